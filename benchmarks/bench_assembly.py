@@ -0,0 +1,111 @@
+"""Benchmark: index-aligned `assemble_combined_df` vs. the reduce-of-outer-merges it replaces.
+
+    python benchmarks/bench_assembly.py [n_seasons]
+
+Builds a rushing/receiving frame (all positions) and a passing frame (QBs) on synthetic weekly
+player stats, with cumulative features for every target stat and random True / Projected
+values, then assembles the dashboard table both ways, checks the frames are identical and
+prints the timings.
+"""
+import os
+import sys
+import time
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, "src")))
+
+import utils
+from pipelines.assembly import assemble_combined_df
+from synthetic import make_player_stats
+
+PASSING_TARGETS = ["p_yd", "p_td", "intcpt"]
+
+
+def merge_assemble(target_data_struct, trues, predictions) -> pd.DataFrame:
+    """The dashboard's original implementation."""
+    metric_frames: list[pd.DataFrame] = []
+    meta_frames: list[pd.DataFrame] = []
+
+    for target, df in target_data_struct.items():
+        if target == "def" or df is None or not isinstance(df, pd.DataFrame):
+            continue
+        keys = [k for k in ["player_id", "season", "week"] if k in df.columns]
+        tmp = df[keys].copy()
+        true_series = trues.get(target, pd.Series(index=df.index, dtype="float64"))
+        pred_series = predictions.get(target, pd.Series(index=df.index, dtype="float64"))
+        stat = utils.TARGET_TRANSLATION[target]
+        tmp[f"True {stat}"] = pd.Series(true_series).reindex(df.index).to_numpy()
+        tmp[f"Projected {stat}"] = pd.Series(pred_series).reindex(df.index).to_numpy()
+        tmp[f"Average {stat}"] = df[f"{stat}_cum_avg"]
+        tmp[f"STD {stat}"] = df[f"{stat}_cum_std"]
+        tmp[f"Risk Quotient {stat}"] = df[f"{stat}_cum_avg"] / df[f"{stat}_cum_std"].replace(0, np.nan)
+        metric_frames.append(tmp)
+        meta_frames.append(df[["player_id", "season", "week", "player_display_name", "position"]].copy())
+
+    def _merge(left, right):
+        return left.merge(right, on=["player_id", "season", "week"], how="outer")
+
+    combined_metrics = reduce(_merge, metric_frames)
+    meta = pd.concat(meta_frames, ignore_index=True).drop_duplicates()
+    meta = (meta.sort_values(["player_id", "season", "week"])
+            .groupby(["player_id", "season", "week"], as_index=False)
+            .agg({"player_display_name": "first", "position": "first"}))
+    combined = combined_metrics.merge(meta, on=["player_id", "season", "week"], how="left")
+
+    metric_cols = [c for c in combined.columns
+                   if c.startswith(("True ", "Projected ", "Average ", "STD ", "Risk Quotient "))]
+    combined[metric_cols] = combined[metric_cols].fillna(0)
+    front = ["player_id", "season", "week", "player_display_name", "position"]
+    combined = combined[front + [c for c in combined.columns if c not in front]]
+    combined = combined.drop_duplicates(subset=["season", "week", "player_display_name"])
+    combined = utils.compile_player_points_and_projections(combined)
+    return combined.reset_index(drop=True)
+
+
+def build_inputs(n_seasons: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    df = make_player_stats(n_seasons, seed=seed).sort_values(["season", "week", "player_id"]).reset_index(drop=True)
+    stats = list(utils.TARGET_TRANSLATION.values())
+    df = pd.concat([df, utils.grouped_window_features(df, stats, ["season", "player_id"])], axis=1)
+    # A few duplicated player-weeks and missing names, as left by the pipeline's merges
+    df = pd.concat([df, df.sample(frac=0.01, random_state=seed)], ignore_index=True)
+    df.loc[rng.random(len(df)) < 0.01, "player_display_name"] = np.nan
+
+    passing = df[df["position"] == "QB"].reset_index(drop=True)
+    struct = {t: (passing if t in PASSING_TARGETS else df) for t in utils.TARGET_TRANSLATION}
+    struct["def"] = pd.DataFrame()
+    trues = {t: struct[t][utils.TARGET_TRANSLATION[t]].to_numpy() for t in utils.TARGET_TRANSLATION}
+    predictions = {t: rng.normal(size=len(struct[t])) for t in utils.TARGET_TRANSLATION}
+    return struct, trues, predictions
+
+
+def _best_of(fn, repeat: int = 3) -> float:
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(n_seasons: int = 5):
+    struct, trues, predictions = build_inputs(n_seasons)
+    n_rows = len(struct["rsh_yd"])
+    print(f"{n_seasons} season(s): {n_rows:,} rows, {len(trues)} targets")
+
+    expected = merge_assemble(struct, trues, predictions)
+    actual = assemble_combined_df(struct, trues, predictions)
+    pd.testing.assert_frame_equal(actual, expected)
+    print(f"identical output ({len(actual):,} rows x {actual.shape[1]} columns)")
+
+    t_merge = _best_of(lambda: merge_assemble(struct, trues, predictions))
+    t_aligned = _best_of(lambda: assemble_combined_df(struct, trues, predictions))
+    print(f"reduce of outer merges: {t_merge:8.3f} s")
+    print(f"index-aligned build:    {t_aligned:8.3f} s  ({t_merge / t_aligned:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,67 @@
+"""Benchmark: one in-season week via IncrementalFeatureUpdater vs. a full recompute.
+
+    python benchmarks/bench_incremental_features.py [n_seasons]
+
+Replays every week but the last into the updater, then times ingesting the final week
+and checks the emitted rows against the full vectorized recompute.
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, "src")))
+
+import utils
+from pipelines import IncrementalFeatureUpdater
+from synthetic import make_player_stats
+
+ROLLING_PERIOD = 4
+SORT = ["season", "week", "player_id"]
+
+
+def full_recompute(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
+    season = utils.grouped_window_features(df, cols, ["season", "player_id"], rolling_period=ROLLING_PERIOD)
+    opponent = utils.grouped_window_features(df, cols, ["opponent_team", "player_id"], prefix="vs_opponent_")
+    return pd.concat([season, opponent], axis=1)
+
+
+def main(n_seasons: int = 25):
+    cols = list(dict.fromkeys(utils.TARGETS_TO_INPUTS["rsh_yd"] + utils.TARGETS_TO_INPUTS["rc_yd"]))
+    df = make_player_stats(n_seasons).sort_values(SORT).reset_index(drop=True)
+    last_season = df["season"].max()
+    last = (df["season"] == last_season) & (df["week"] == df.loc[df["season"] == last_season, "week"].max())
+    print(f"{n_seasons} season(s): {len(df):,} rows, {len(cols)} input columns, {last.sum()} rows in the new week")
+
+    start = time.perf_counter()
+    updater = IncrementalFeatureUpdater.from_history(df[~last], cols, rolling_period=ROLLING_PERIOD)
+    print(f"state built from history:   {time.perf_counter() - start:8.3f} s")
+
+    start = time.perf_counter()
+    expected = full_recompute(df, cols)
+    t_full = time.perf_counter() - start
+
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        emitted = updater.features(df[last])
+        timings.append(time.perf_counter() - start)
+    start = time.perf_counter()
+    emitted = updater.ingest(df[last])
+    t_ingest = time.perf_counter() - start
+
+    np.testing.assert_allclose(
+        emitted[updater.feature_columns].to_numpy(),
+        expected.loc[last, updater.feature_columns].to_numpy(),
+        rtol=1e-9, atol=1e-12,
+    )
+    print("emitted week matches the full recompute")
+    print(f"full recompute:             {t_full * 1e3:8.1f} ms")
+    print(f"features for the new week:  {min(timings) * 1e3:8.1f} ms")
+    print(f"ingest (features + update): {t_ingest * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 25)
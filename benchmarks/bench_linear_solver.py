@@ -0,0 +1,105 @@
+"""Benchmark: batched closed-form training vs. one scikit-learn LinearRegression fit per target.
+
+    python benchmarks/bench_linear_solver.py [n_seasons]
+
+Builds the rushing/receiving feature frame (season rolling + cumulative, vs-opponent
+cumulative, one merged defensive feature) on synthetic weekly player stats, then trains the
+five rushing/receiving targets both ways, checks the validation predictions agree and prints
+the timings.
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+from sklearn.model_selection import train_test_split
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, "src")))
+
+import utils
+from pipelines import build_feature_matrix, fit_feature_scalers, train_and_validate_batched
+from synthetic import make_player_stats
+
+ROLLING_PERIOD = 4
+SORT = ["season", "week", "player_id"]
+TARGETS = ["rsh_yd", "rsh_td", "rc_yd", "rc_td", "rc"]
+
+
+def _feature_names(cols: list[str]) -> list[str]:
+    return (
+        [f"{c}_roll{ROLLING_PERIOD}_shift" for c in cols]
+        + [f"{c}_cum_avg" for c in cols] + [f"{c}_cum_std" for c in cols]
+        + [f"vs_opponent_{c}_cum_avg" for c in cols] + [f"vs_opponent_{c}_cum_std" for c in cols]
+    )
+
+
+def build_struct(n_seasons: int) -> tuple[dict[str, pd.DataFrame], dict[str, list[str]]]:
+    df = make_player_stats(n_seasons).sort_values(SORT).reset_index(drop=True)
+    cols = list(dict.fromkeys(c for t in TARGETS for c in utils.TARGETS_TO_INPUTS[t]))
+    season = utils.grouped_window_features(df, cols, ["season", "player_id"], rolling_period=ROLLING_PERIOD)
+    opponent = utils.grouped_window_features(df, cols, ["opponent_team", "player_id"], prefix="vs_opponent_")
+    df = pd.concat([df, season, opponent], axis=1)
+
+    # One team-level defensive feature: rushing yards allowed, rolling over the season
+    allowed = (df.groupby(["season", "week", "opponent_team"], as_index=False)["rushing_yards"].sum()
+               .rename(columns={"opponent_team": "team", "rushing_yards": "def_rushing_yards_allowed"}))
+    allowed = pd.concat([allowed, utils.grouped_window_features(
+        allowed, ["def_rushing_yards_allowed"], ["season", "team"], rolling_period=ROLLING_PERIOD, cumulative=False,
+    )], axis=1)
+    def_cols = [f"def_rushing_yards_allowed_roll{ROLLING_PERIOD}_shift"]
+    df = df.merge(allowed[["season", "week", "team"] + def_cols],
+                  left_on=["opponent_team", "season", "week"], right_on=["team", "season", "week"],
+                  how="left", suffixes=("", "_def"))
+
+    struct = {t: df for t in TARGETS}
+    struct["def"] = allowed
+    input_cols = {t: _feature_names(utils.TARGETS_TO_INPUTS[t]) for t in TARGETS}
+    input_cols["def"] = def_cols
+    return struct, input_cols
+
+
+def sklearn_per_target(struct, input_cols, scalers, season_holdout):
+    """The per-target fit loop the batched engine replaces."""
+    predictions = {}
+    for target in TARGETS:
+        df = struct[target]
+        mask = (df["season"] != season_holdout).to_numpy()
+        X = build_feature_matrix(df, input_cols[target] + input_cols["def"], mask, scalers[target])
+        y = build_feature_matrix(df, [utils.TARGET_TRANSLATION[target]], mask)[:, 0]
+        X_train, X_valid, y_train, _ = train_test_split(X, y, test_size=0.2, random_state=42)
+        predictions[target] = LinearRegression().fit(X_train, y_train).predict(X_valid)
+    return predictions
+
+
+def _best_of(fn, repeat: int = 3) -> float:
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(n_seasons: int = 25):
+    struct, input_cols = build_struct(n_seasons)
+    season_holdout = int(struct[TARGETS[0]]["season"].max())
+    scalers = fit_feature_scalers(struct, input_cols)
+    n_features = len(input_cols[TARGETS[0]]) + len(input_cols["def"])
+    print(f"{n_seasons} season(s): {len(struct[TARGETS[0]]):,} rows, {len(TARGETS)} targets, ~{n_features} features each")
+
+    expected = sklearn_per_target(struct, input_cols, scalers, season_holdout)
+    _, _, _, actual = train_and_validate_batched(struct, input_cols, season_holdout, scalers)
+    for target in TARGETS:
+        np.testing.assert_allclose(actual[target], expected[target], rtol=1e-7, atol=1e-7)
+    print("validation predictions match")
+
+    t_sklearn = _best_of(lambda: sklearn_per_target(struct, input_cols, scalers, season_holdout))
+    t_batched = _best_of(lambda: train_and_validate_batched(struct, input_cols, season_holdout, scalers))
+    print(f"LinearRegression per target: {t_sklearn:8.3f} s")
+    print(f"batched normal equations:    {t_batched:8.3f} s  ({t_sklearn / t_batched:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 25)
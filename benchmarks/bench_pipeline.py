@@ -0,0 +1,134 @@
+"""Benchmark suite: every `run_pipeline` stage, training, `test_model` and `assemble_combined_df`
+on synthetic nflverse-shaped data at 1, 5 and 25 season scales (pytest-benchmark, offline).
+
+    python -m pytest benchmarks/bench_pipeline.py [--seasons 1,5] --benchmark-autosave
+
+Results are grouped by scale and saved as JSON under `.benchmarks/` (or any file with
+`--benchmark-json=PATH`); each result records the number of player rows it ran on. Compare a
+run against the last saved one, failing on regressions:
+
+    python -m pytest benchmarks/bench_pipeline.py --benchmark-compare --benchmark-compare-fail=mean:15%
+
+Inputs of every stage are built once per scale (see conftest.py), so each benchmark times
+only its own stage.
+"""
+import pytest
+
+from pipelines.assembly import assemble_combined_df
+from pipelines.frame_dtypes import optimize_nfl_frames
+
+# Timed rounds per scale (the 25-season stages take seconds each)
+ROUNDS = {1: 5, 5: 3, 25: 2}
+
+
+def _run(benchmark, n_seasons, frames, fn, setup=None):
+    benchmark.group = f"{n_seasons} season(s)"
+    benchmark.extra_info["player_rows"] = len(frames["players"])
+    return benchmark.pedantic(fn, setup=setup, rounds=ROUNDS.get(n_seasons, 2), iterations=1)
+
+
+def _copied(struct):
+    """Setup for stages that reassign the entries of the dict they are given."""
+    return lambda: ((dict(struct),), {})
+
+
+# ---------- run_pipeline stages ----------------------------------------------
+
+def test_dtype_optimization(benchmark, n_seasons, frames):
+    _, report = _run(benchmark, n_seasons, frames, lambda: optimize_nfl_frames(frames))
+    benchmark.extra_info["saved_mb"] = round(report.saved / 2**20, 1)
+
+
+def test_encode_injuries(benchmark, n_seasons, frames, lean_frames, pipeline):
+    _run(benchmark, n_seasons, frames, lambda: pipeline.encode_and_filter_injuries_data(lean_frames["injuries"]))
+
+
+def test_filter_depth(benchmark, n_seasons, frames, lean_frames, pipeline):
+    _run(benchmark, n_seasons, frames, lambda: pipeline.filter_depth_data(lean_frames["depth"]))
+
+
+def test_merge_depth_and_injuries(benchmark, n_seasons, frames, lean_frames, pipeline, stages):
+    _run(benchmark, n_seasons, frames, lambda: pipeline.merge_players_to_depth_and_injury(
+        lean_frames["players"], stages["injuries"], stages["depth"]
+    ))
+
+
+def _merge_chain(players, injuries, depth, teams):
+    keys = ["player_id", "season", "week"]
+    df = players.merge(injuries, how="left", on=keys).merge(depth, how="left", on=keys)
+    return df.merge(teams, how="left", left_on=["opponent_team", "season", "week"], right_on=["team", "season", "week"])
+
+
+def _left_join_chain(players, injuries, depth, teams):
+    from utils import left_join
+    keys = ["player_id", "season", "week"]
+    df = left_join(left_join(players, injuries, keys), depth, keys)
+    return left_join(df, teams, ["opponent_team", "season", "week"], ["team", "season", "week"])
+
+
+@pytest.mark.parametrize("chain", [_merge_chain, _left_join_chain], ids=["merge", "left_join"])
+def test_join_chain(benchmark, n_seasons, frames, lean_frames, stages, chain):
+    """Player-week joins to injuries, depth charts and the opponent's team-week."""
+    _run(benchmark, n_seasons, frames, lambda: chain(
+        lean_frames["players"], stages["injuries"], stages["depth"], lean_frames["teams"]
+    ))
+
+
+def test_positional_frames(benchmark, n_seasons, frames, pipeline, stages):
+    def positional():
+        pipeline.filter_by_positional_group(stages["merged"], "passing")
+        pipeline.filter_by_positional_group(stages["merged"], "rushing_and_receiving")
+
+    _run(benchmark, n_seasons, frames, positional)
+
+
+def test_feature_store(benchmark, n_seasons, frames, lean_frames, pipeline, stages):
+    _run(benchmark, n_seasons, frames, lambda: pipeline.generate_feature_store_struct(
+        stages["encoded_feature_names"], stages["rushing_and_receiving"], stages["passing"], lean_frames["teams"]
+    ))
+
+
+def test_window_features(benchmark, n_seasons, frames, pipeline, stages):
+    _run(benchmark, n_seasons, frames, pipeline.calculate_rolling_and_cumulative_data,
+         setup=_copied(stages["feature_store"]))
+
+
+def test_defense_merge(benchmark, n_seasons, frames, pipeline, stages):
+    def merge_and_select(feature_store):
+        struct = pipeline.select_target_data(pipeline.merge_target_data_to_defense(feature_store))
+        pipeline.get_input_cols_by_target(struct, stages["encoded_feature_names"])
+
+    _run(benchmark, n_seasons, frames, merge_and_select, setup=_copied(stages["engineered"]))
+
+
+def test_run_pipeline(benchmark, n_seasons, frames, pipeline):
+    _run(benchmark, n_seasons, frames, lambda: pipeline.run_pipeline(
+        frames["players"], frames["teams"], frames["injuries"], frames["depth"]
+    ))
+
+
+# ---------- Training, scoring and assembly -----------------------------------
+
+def test_fit_scalers(benchmark, n_seasons, frames, pipeline, stages):
+    _run(benchmark, n_seasons, frames, lambda: pipeline.fit_feature_scalers(stages["struct"], stages["input_cols"]))
+
+
+def test_training(benchmark, n_seasons, frames, pipeline, stages, trained):
+    _, scalers = trained
+    models, *_ = _run(benchmark, n_seasons, frames, lambda: pipeline.train_and_validate_model(
+        stages["struct"], stages["input_cols"], scalers=scalers
+    ))
+    assert set(models) == set(trained[0])
+
+
+def test_test_model(benchmark, n_seasons, frames, pipeline, stages, registry_path):
+    results, *_ = _run(benchmark, n_seasons, frames, lambda: pipeline.test_model(
+        stages["struct"], stages["input_cols"], registry_path
+    ))
+    assert all(r["validation_rmse"] != "nan" for r in results.values())
+
+
+def test_assemble(benchmark, n_seasons, frames, stages, scored):
+    trues, predictions = scored
+    combined = _run(benchmark, n_seasons, frames, lambda: assemble_combined_df(stages["struct"], trues, predictions))
+    assert len(combined) > 0
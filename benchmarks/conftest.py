@@ -0,0 +1,90 @@
+# benchmarks/conftest.py
+"""Fixtures of the pytest-benchmark suite (bench_pipeline.py).
+
+Every fixture is built once per season scale (`--seasons`, default 1,5,25) from synthetic
+frames, so each benchmark times one stage on the outputs of the stages before it.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, "src")))
+
+from synthetic import make_nfl_frames
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--seasons",
+        default="1,5,25",
+        help="Comma separated season scales of the pipeline benchmarks (default: 1,5,25).",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "n_seasons" in metafunc.fixturenames:
+        scales = [int(s) for s in metafunc.config.getoption("--seasons").split(",")]
+        metafunc.parametrize("n_seasons", scales, ids=[f"{n}-seasons" for n in scales], scope="session")
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture(scope="session")
+def pipeline():
+    # Imported lazily: the module prints its setup and reads the environment
+    from pipelines import linear_regression_pipeline_v1
+    return linear_regression_pipeline_v1
+
+
+@pytest.fixture(scope="session")
+def frames(n_seasons):
+    return make_nfl_frames(n_seasons)
+
+
+@pytest.fixture(scope="session")
+def lean_frames(frames):
+    """The frames with the dtypes `run_pipeline` converts them to first."""
+    from pipelines.frame_dtypes import optimize_nfl_frames
+    return optimize_nfl_frames(frames)[0]
+
+
+@pytest.fixture(scope="session")
+def stages(pipeline, lean_frames):
+    """Output of every `run_pipeline` stage, computed the way `run_pipeline` chains them."""
+    frames = lean_frames
+    out = {}
+    out["injuries"], out["encoded_feature_names"] = pipeline.encode_and_filter_injuries_data(frames["injuries"])
+    out["depth"] = pipeline.filter_depth_data(frames["depth"])
+    out["merged"] = pipeline.merge_players_to_depth_and_injury(frames["players"], out["injuries"], out["depth"])
+    out["passing"] = pipeline.filter_by_positional_group(out["merged"], "passing")
+    out["rushing_and_receiving"] = pipeline.filter_by_positional_group(out["merged"], "rushing_and_receiving")
+    out["feature_store"] = pipeline.generate_feature_store_struct(
+        out["encoded_feature_names"], out["rushing_and_receiving"], out["passing"], frames["teams"]
+    )
+    out["engineered"] = pipeline.calculate_rolling_and_cumulative_data(dict(out["feature_store"]))
+    out["with_defense"] = pipeline.merge_target_data_to_defense(dict(out["engineered"]))
+    out["struct"] = pipeline.select_target_data(out["with_defense"])
+    out["input_cols"] = pipeline.get_input_cols_by_target(out["struct"], out["encoded_feature_names"])
+    return out
+
+
+@pytest.fixture(scope="session")
+def trained(pipeline, stages):
+    scalers = pipeline.fit_feature_scalers(stages["struct"], stages["input_cols"])
+    models, *_ = pipeline.train_and_validate_model(stages["struct"], stages["input_cols"], scalers=scalers)
+    return models, scalers
+
+
+@pytest.fixture(scope="session")
+def registry_path(pipeline, stages, trained, tmp_path_factory):
+    models, scalers = trained
+    path = str(tmp_path_factory.mktemp("registry") / "bench.models")
+    pipeline.save_model_registry(models, stages["struct"], stages["input_cols"], scalers, path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def scored(pipeline, stages, registry_path):
+    _, trues, predictions = pipeline.test_model(stages["struct"], stages["input_cols"], registry_path)
+    return trues, predictions
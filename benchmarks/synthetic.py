@@ -0,0 +1,151 @@
+"""Synthetic, nflverse-shaped frames for offline benchmarks.
+
+Column names come from utils.STATISTICAL_COLUMNS_BY_CATEGORY / TARGETS_TO_INPUTS so the
+pipelines can run on these frames exactly as they do on the real weekly data.
+`make_nfl_frames` returns the four frames `run_pipeline` takes (weekly player stats, team
+stats, injuries and depth charts, the last two keyed by `gsis_id` like nflverse).
+"""
+import numpy as np
+import pandas as pd
+
+import utils
+
+__all__ = ["TEAMS", "make_player_stats", "make_team_stats", "make_injuries", "make_depth_charts", "make_nfl_frames"]
+
+TEAMS = [
+    "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN", "DET", "GB",
+    "HOU", "IND", "JAX", "KC", "LA", "LAC", "LV", "MIA", "MIN", "NE", "NO", "NYG",
+    "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS",
+]
+
+_POSITIONS = {"QB": 2, "RB": 3, "WR": 5, "TE": 3}  # players per team
+_SPARSE_COLS = {"racr", "pacr", "passing_cpoe", "target_share", "air_yards_share", "wopr"}
+_REPORT_STATUS = ["Out", "Doubtful", "Questionable", None]
+_PRACTICE_STATUS = [
+    "Did Not Participate In Practice",
+    "Limited Participation in Practice",
+    "Full Participation in Practice",
+    "Out (Definitely Will Not Play)",
+    None,
+]
+
+
+def _stat_columns() -> list[str]:
+    cats = utils.STATISTICAL_COLUMNS_BY_CATEGORY
+    cols = set(cats["passing"]) | set(cats["rushing_and_receiving"])
+    for target, inputs in utils.TARGETS_TO_INPUTS.items():
+        if target != "def":
+            cols |= set(inputs)
+    return sorted(cols)
+
+
+def _schedule(rng: np.random.Generator, season: int, weeks: int) -> pd.DataFrame:
+    """Random pairings so every team plays one opponent per week."""
+    rows = []
+    for week in range(1, weeks + 1):
+        teams = rng.permutation(TEAMS)
+        for home, away in zip(teams[::2], teams[1::2]):
+            rows.append((season, week, home, away))
+            rows.append((season, week, away, home))
+    return pd.DataFrame(rows, columns=["season", "week", "team", "opponent_team"])
+
+
+def make_player_stats(
+    n_seasons: int = 1,
+    first_season: int = 2024 - 24,
+    weeks: int = 18,
+    participation: float = 0.85,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """Weekly player stats for QB/RB/WR/TE over `n_seasons` seasons (about 5k rows per season)."""
+    rng = np.random.default_rng(seed)
+    stat_cols = _stat_columns()
+    frames = []
+    for s in range(n_seasons):
+        season = first_season + s
+        schedule = _schedule(rng, season, weeks)
+        roster = [
+            (f"00-00{t:02d}{pos}{k}", team, pos)
+            for t, team in enumerate(TEAMS)
+            for pos, n in _POSITIONS.items()
+            for k in range(n)
+        ]
+        roster = pd.DataFrame(roster, columns=["player_id", "team", "position"])
+        df = schedule.merge(roster, on="team")
+        df = df[rng.random(len(df)) < participation].reset_index(drop=True)
+
+        stats = rng.gamma(shape=1.5, scale=12.0, size=(len(df), len(stat_cols)))
+        stats[rng.random(stats.shape) < 0.02] = np.nan
+        df = pd.concat([df, pd.DataFrame(stats, columns=stat_cols)], axis=1)
+        for col in sorted(_SPARSE_COLS & set(stat_cols)):
+            df.loc[rng.random(len(df)) < 0.4, col] = np.nan
+        frames.append(df)
+
+    df = pd.concat(frames, ignore_index=True)
+    df["player_name"] = df["player_id"]
+    df["player_display_name"] = df["player_id"]
+    df["position_group"] = df["position"]
+    df["season_type"] = "REG"
+    return df
+
+
+def make_team_stats(
+    n_seasons: int = 1,
+    first_season: int = 2024 - 24,
+    weeks: int = 18,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """Weekly team stats with the defensive inputs (TARGETS_TO_INPUTS["def"]) for every team."""
+    rng = np.random.default_rng(seed)
+    rows = [
+        (first_season + s, week, team)
+        for s in range(n_seasons)
+        for week in range(1, weeks + 1)
+        for team in TEAMS
+    ]
+    df = pd.DataFrame(rows, columns=["season", "week", "team"])
+    def_cols = utils.TARGETS_TO_INPUTS["def"]
+    stats = rng.poisson(4.0, size=(len(df), len(def_cols))).astype(np.float64)
+    df = pd.concat([df, pd.DataFrame(stats, columns=def_cols)], axis=1)
+    df["season_type"] = "REG"
+    return df
+
+
+def make_injuries(players: pd.DataFrame, fraction: float = 0.1, seed: int = 0) -> pd.DataFrame:
+    """Injury report rows for a random `fraction` of the player weeks."""
+    rng = np.random.default_rng(seed)
+    rows = players.loc[rng.random(len(players)) < fraction, ["season", "week", "player_id"]]
+    return pd.DataFrame({
+        "season": rows["season"].to_numpy(),
+        "week": rows["week"].to_numpy(),
+        "gsis_id": rows["player_id"].to_numpy(),
+        "report_status": rng.choice(np.array(_REPORT_STATUS, dtype=object), len(rows)),
+        "practice_status": rng.choice(np.array(_PRACTICE_STATUS, dtype=object), len(rows)),
+    })
+
+
+def make_depth_charts(players: pd.DataFrame, seed: int = 0) -> pd.DataFrame:
+    """One depth chart entry per player week (depth 1-3, a few missing)."""
+    rng = np.random.default_rng(seed)
+    depth = rng.choice([1.0, 2.0, 3.0], len(players), p=[0.6, 0.3, 0.1])
+    depth[rng.random(len(players)) < 0.02] = np.nan
+    return pd.DataFrame({
+        "season": players["season"].to_numpy(),
+        "week": players["week"].to_numpy(),
+        "gsis_id": players["player_id"].to_numpy(),
+        "depth_team": depth,
+    })
+
+
+def make_nfl_frames(n_seasons: int = 1, first_season: int | None = None, seed: int = 0) -> dict[str, pd.DataFrame]:
+    """{"players", "teams", "injuries", "depth"} frames for `run_pipeline`. Unless `first_season`
+    is given, the seasons end with 2023, so training (which leaves out the 2024 holdout season)
+    uses all of them."""
+    first_season = 2024 - n_seasons if first_season is None else first_season
+    players = make_player_stats(n_seasons, first_season=first_season, seed=seed)
+    return {
+        "players": players,
+        "teams": make_team_stats(n_seasons, first_season=first_season, seed=seed + 1),
+        "injuries": make_injuries(players, seed=seed + 2),
+        "depth": make_depth_charts(players, seed=seed + 3),
+    }
@@ -0,0 +1,36 @@
+# Side-effect free pipeline components. The versioned pipelines themselves
+# (e.g. linear_regression_pipeline_v1) download their default data and are imported explicitly.
+from .assembly import assemble_combined_df
+from .batched_training import train_and_validate_batched
+from .feature_matrix import ScalerStats, build_feature_matrix, fit_feature_scalers
+from .frame_dtypes import DtypeReport, optimize_nfl_frames
+from .injury_encoding import InjuryEncoder, INJURY_ENCODER
+from .incremental_features import IncrementalFeatureUpdater
+from .instrumentation import PipelineTrace, StageRecord
+from .model_registry import ModelRegistry, RegisteredModel, data_fingerprint, load_registry
+from .projection_service import ProjectionService
+from .slate_scoring import score_slate
+from .parallel import train_and_validate_parallel, score_parallel
+
+__all__ = [
+    "assemble_combined_df",
+    "ScalerStats",
+    "build_feature_matrix",
+    "fit_feature_scalers",
+    "DtypeReport",
+    "optimize_nfl_frames",
+    "InjuryEncoder",
+    "INJURY_ENCODER",
+    "IncrementalFeatureUpdater",
+    "PipelineTrace",
+    "StageRecord",
+    "ModelRegistry",
+    "RegisteredModel",
+    "data_fingerprint",
+    "load_registry",
+    "train_and_validate_batched",
+    "ProjectionService",
+    "score_slate",
+    "train_and_validate_parallel",
+    "score_parallel",
+]
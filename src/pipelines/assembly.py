@@ -0,0 +1,124 @@
+"""Wide per-player table of every target's True / Projected / Average / STD / Risk columns.
+
+The dashboard used to build one small frame per target and `reduce` them with repeated outer
+merges on (player_id, season, week), then rebuild the player meta with a concat + groupby.
+That repeats the hash join and copies the growing frame once per target.
+
+`assemble_combined_df` instead factorizes the (player_id, season, week) keys of every frame
+once, and writes each target's columns into preallocated arrays at the rows of those codes.
+The output is the same table: rows in key order, the first row of a key in each frame, NaNs
+in metric columns set to 0, the first non-null name / position per key, one row per
+(season, week, player_display_name), plus the fantasy-point columns.
+"""
+import numpy as np
+import pandas as pd
+
+import utils
+
+from .feature_matrix import fill_nan_inplace
+
+__all__ = ["assemble_combined_df"]
+
+_KEYS = ["player_id", "season", "week"]
+_META_COLS = ["player_display_name", "position"]
+_METRICS = ["True", "Projected", "Average", "STD", "Risk Quotient"]
+
+
+def _first_rows(codes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Codes present (>= 0) and the position of their first row."""
+    present, first = np.unique(codes, return_index=True)
+    keep = present >= 0
+    return present[keep], first[keep]
+
+
+def _aligned(values, index: pd.Index) -> np.ndarray:
+    """`values` aligned to a frame's rows: Series (as returned by training and scoring) by row
+    label, rows they do not cover left NaN; plain arrays by position."""
+    if isinstance(values, pd.DataFrame) and values.shape[1] == 1:
+        values = values.iloc[:, 0]
+    return pd.Series(values).reindex(index).to_numpy(dtype=np.float64)
+
+
+def assemble_combined_df(
+    target_data_struct: dict[str, pd.DataFrame],
+    trues: dict[str, pd.Series | pd.DataFrame | np.ndarray],
+    predictions: dict[str, pd.Series | pd.DataFrame | np.ndarray],
+) -> pd.DataFrame:
+    """
+    Build one wide table with per-target True/Projected columns.
+    - One row per (player_id, season, week) over every target frame, in key order
+    - Keeps player_display_name and position (first non-null value per key)
+    - Fills NA in metric columns with 0 (does not touch text/meta)
+    """
+    targets: list[str] = []
+    frames: dict[int, pd.DataFrame] = {}
+    for target, df in target_data_struct.items():
+        if target == "def" or df is None or not isinstance(df, pd.DataFrame):
+            continue
+        if not all(k in df.columns for k in _KEYS):
+            print(f"[assemble] Skipping '{target}' (no merge key present).")
+            continue
+        targets.append(target)
+        frames.setdefault(id(df), df)
+
+    if not targets:
+        return pd.DataFrame(columns=_KEYS + _META_COLS)
+
+    # Factorize every frame's keys once; codes are shared by all targets of all frames
+    meta_cols = [c for c in _META_COLS if any(c in df.columns for df in frames.values())]
+    rows = pd.concat([df.reindex(columns=_KEYS + meta_cols) for df in frames.values()], ignore_index=True)
+    codes = utils.group_codes(rows, _KEYS)
+    _, first = _first_rows(codes)
+    keys = rows.iloc[first][_KEYS]
+
+    # Outer merges return keys sorted (a single frame keeps its row order)
+    if len(targets) > 1:
+        order = np.lexsort([keys[k].to_numpy() for k in reversed(_KEYS)])
+    else:
+        order = np.arange(len(keys))
+
+    # Per frame: its first row of every key and that key's code
+    frame_rows: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+    offset = 0
+    for frame_id, df in frames.items():
+        present, frame_first = _first_rows(codes[offset:offset + len(df)])
+        frame_rows[frame_id] = (frame_first, present)
+        offset += len(df)
+
+    metric_cols = [f"{metric} {utils.TARGET_TRANSLATION[t]}" for t in targets for metric in _METRICS]
+    metrics = np.zeros((len(keys), len(metric_cols)))
+    for i, target in enumerate(targets):
+        df = target_data_struct[target]
+        stat = utils.TARGET_TRANSLATION[target]
+        avg = df[f"{stat}_cum_avg"].to_numpy(dtype=np.float64, na_value=np.nan)
+        std = df[f"{stat}_cum_std"].to_numpy(dtype=np.float64, na_value=np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            risk = avg / np.where(std == 0, np.nan, std)
+        missing = np.full(len(df), np.nan)
+        columns = [
+            _aligned(trues[target], df.index) if target in trues else missing,
+            _aligned(predictions[target], df.index) if target in predictions else missing,
+            avg,
+            std,
+            risk,
+        ]
+        src, dst = frame_rows[id(df)]
+        for j, values in enumerate(columns):
+            metrics[dst, len(_METRICS) * i + j] = values[src]
+    fill_nan_inplace(metrics)
+
+    combined = pd.DataFrame({k: keys[k].to_numpy()[order] for k in _KEYS})
+    for col in meta_cols:
+        values = rows[col]
+        valid = np.flatnonzero(values.notna().to_numpy() & (codes >= 0))
+        present, valid_first = _first_rows(codes[valid])
+        column = np.full(len(keys), np.nan, dtype=object)
+        column[present] = values.to_numpy(dtype=object)[valid[valid_first]]
+        combined[col] = column[order]
+    combined = pd.concat([combined, pd.DataFrame(metrics[order], columns=metric_cols)], axis=1)
+
+    combined = combined.drop_duplicates(subset=["season", "week", "player_display_name"])
+
+    combined = utils.compile_player_points_and_projections(combined)
+
+    return combined.reset_index(drop=True)
@@ -0,0 +1,119 @@
+"""Batched closed-form training of every target's linear model.
+
+All targets of a feature-store frame are fitted on the same rows (same season holdout, same
+seeded train/validation split), so their designs differ only in which columns they use. For
+each frame this module builds one matrix over the union of its targets' feature columns,
+forms the normal equations once (utils.NormalEquations) and solves every target from
+sub-blocks of it. Targets with identical feature sets share one factorization.
+
+The fitted models are plain scikit-learn `LinearRegression` objects (coef_, intercept_,
+n_features_in_), so they can be saved, restored and scored like the per-target fits.
+Validation trues and predictions are Series indexed by the frame rows they belong to.
+"""
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import r2_score, root_mean_squared_error
+from sklearn.model_selection import train_test_split
+
+import utils
+
+from .feature_matrix import ScalerStats, build_feature_matrix, fit_feature_scalers
+
+__all__ = ["train_and_validate_batched"]
+
+
+def _as_linear_regression(coef: np.ndarray, intercept: float) -> LinearRegression:
+    reg = LinearRegression()
+    reg.coef_ = coef
+    reg.intercept_ = float(intercept)
+    reg.n_features_in_ = coef.shape[0]
+    return reg
+
+
+def train_and_validate_batched(
+    target_data_struct: dict[str, pd.DataFrame],
+    target_input_cols: dict[str, list[str]],
+    season_holdout: int = 2024,
+    scalers: dict[str, ScalerStats] | None = None,
+    alpha: float = 0.0,
+    sample_weight_col: str | None = None,
+):
+    """Batched equivalent of `train_and_validate_model` (same split, metrics and outputs).
+
+    Args:
+        alpha: ridge penalty (0 for ordinary least squares).
+        sample_weight_col: optional frame column holding per-row training weights.
+
+    Returns models, model_results, trues, predictions keyed by target (trues and predictions
+    as Series indexed by the validation rows' labels in the target's frame).
+    """
+    model_results: dict[str, dict] = {}
+    models: dict[str, LinearRegression] = {}
+    predictions: dict[str, pd.Series] = {}
+    trues: dict[str, pd.Series] = {}
+
+    if scalers is None:
+        scalers = fit_feature_scalers(target_data_struct, target_input_cols)
+
+    frames: dict[int, list[str]] = {}
+    for target, df in target_data_struct.items():
+        if target != "def":
+            frames.setdefault(id(df), []).append(target)
+
+    for targets in frames.values():
+        df = target_data_struct[targets[0]]
+        feature_cols = {t: target_input_cols[t] + target_input_cols["def"] for t in targets}
+        union_cols = list(dict.fromkeys(c for t in targets for c in feature_cols[t]))
+        union_scaler = ScalerStats.concat([scalers[t] for t in targets]).select(union_cols)
+
+        # hold out a season for validation split (and avoid leakage)
+        mask = (df["season"] != season_holdout).to_numpy()
+        n_rows = int(np.count_nonzero(mask))
+        if n_rows == 0:
+            for target in targets:
+                model_results[target] = {"validation_rmse": "nan", "r2": "nan"}
+            continue
+
+        X = build_feature_matrix(df, union_cols, mask, union_scaler)
+        Y = build_feature_matrix(df, [utils.TARGET_TRANSLATION[t] for t in targets], mask)
+        weight = None
+        if sample_weight_col is not None:
+            weight = build_feature_matrix(df, [sample_weight_col], mask)[:, 0]
+
+        # Same rows as train_test_split(X, y, test_size=0.2, random_state=42) per target
+        train_idx, valid_idx = train_test_split(np.arange(n_rows), test_size=0.2, random_state=42)
+        equations = utils.NormalEquations(X[train_idx], None if weight is None else weight[train_idx], copy=False)
+        X_valid = X[valid_idx]
+        valid_rows = df.index[mask][valid_idx]
+        del X
+
+        position = {c: j for j, c in enumerate(union_cols)}
+        by_feature_set: dict[tuple, list[int]] = {}
+        for i, target in enumerate(targets):
+            by_feature_set.setdefault(tuple(feature_cols[target]), []).append(i)
+
+        for cols, members in by_feature_set.items():
+            idx = [position[c] for c in cols]
+            coef, intercept = equations.solve(Y[train_idx][:, members], idx, alpha=alpha)
+            for i, target_coef, target_intercept in zip(members, coef, intercept):
+                target = targets[i]
+                reg = _as_linear_regression(target_coef, target_intercept)
+                preds = reg.predict(X_valid[:, idx])
+                y_valid = Y[valid_idx, i]
+
+                rmse = root_mean_squared_error(y_valid, preds)
+                r2 = r2_score(y_valid, preds)
+                model_results[target] = {"validation_rmse": f"{rmse:.4f}", "r2": f"{r2:.3f}"}
+                models[target] = reg
+                predictions[target] = pd.Series(preds, index=valid_rows, name=target)
+                trues[target] = pd.Series(y_valid, index=valid_rows, name=target)
+
+    # Report targets in the order they appear in the struct
+    order = [t for t in target_data_struct if t in model_results]
+    return (
+        {t: models[t] for t in order if t in models},
+        {t: model_results[t] for t in order},
+        {t: trues[t] for t in order if t in trues},
+        {t: predictions[t] for t in order if t in predictions},
+    )
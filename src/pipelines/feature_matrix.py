@@ -0,0 +1,132 @@
+"""Feature matrix assembly for training and scoring.
+
+The feature store keeps raw (unscaled) feature values. Models are fitted on standardized
+features with NaNs set to 0, so for each target this module allocates one contiguous
+(rows, features) array and fills it column by column straight from the frame. Each column is
+standardized with the per-column parameters (`ScalerStats`) and NaN-filled on its way into
+the matrix, so the matrix is written exactly once.
+
+Peak memory per target is therefore roughly one matrix, and the raw values stay available
+in the store (no preserved `_copy` columns are needed). Scaler parameters are fitted once on
+the training data and stored with the models (see pipelines.model_registry), so scoring
+applies the training-time scaling instead of refitting on the scored data.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+__all__ = [
+    "ScalerStats",
+    "fit_feature_scalers",
+    "standardize_inplace",
+    "fill_nan_inplace",
+    "build_feature_matrix",
+]
+
+
+@dataclass(frozen=True)
+class ScalerStats:
+    """Per-column standardization parameters: x -> (x - mean) / scale."""
+
+    columns: tuple[str, ...]
+    mean: np.ndarray
+    scale: np.ndarray
+
+    @classmethod
+    def fit(cls, df: pd.DataFrame, cols: list[str]) -> "ScalerStats":
+        """Fits like StandardScaler (NaNs ignored, population std, zero std -> scale 1)."""
+        scaler = StandardScaler().fit(df[cols])
+        return cls(tuple(cols), scaler.mean_, scaler.scale_)
+
+    def select(self, cols: list[str]) -> "ScalerStats":
+        index = {c: i for i, c in enumerate(self.columns)}
+        idx = [index[c] for c in cols]
+        return ScalerStats(tuple(cols), self.mean[idx], self.scale[idx])
+
+    @staticmethod
+    def concat(parts: list["ScalerStats"]) -> "ScalerStats":
+        return ScalerStats(
+            tuple(c for p in parts for c in p.columns),
+            np.concatenate([p.mean for p in parts]),
+            np.concatenate([p.scale for p in parts]),
+        )
+
+
+def fit_feature_scalers(
+    target_data_struct: dict[str, pd.DataFrame],
+    target_input_cols: dict[str, list[str]],
+) -> dict[str, ScalerStats]:
+    """Scaler parameters per target covering its features (`input cols + def input cols`).
+
+    Player features are fitted once per distinct frame (targets of a source share it) and the
+    defensive features on the team-level "def" frame, so each target's parameters match
+    scaling every frame before the defensive merge.
+    """
+    def_stats = ScalerStats.fit(target_data_struct["def"], target_input_cols["def"])
+
+    frame_cols: dict[int, list[str]] = {}
+    for target, df in target_data_struct.items():
+        if target == "def":
+            continue
+        cols = frame_cols.setdefault(id(df), [])
+        cols.extend(c for c in target_input_cols[target] if c not in cols)
+
+    frame_stats: dict[int, ScalerStats] = {}
+    scalers = {"def": def_stats}
+    for target, df in target_data_struct.items():
+        if target == "def":
+            continue
+        if id(df) not in frame_stats:
+            frame_stats[id(df)] = ScalerStats.fit(df, frame_cols[id(df)])
+        scalers[target] = ScalerStats.concat([frame_stats[id(df)].select(target_input_cols[target]), def_stats])
+    return scalers
+
+
+def standardize_inplace(X: np.ndarray, stats: ScalerStats) -> np.ndarray:
+    X -= stats.mean.astype(X.dtype, copy=False)
+    X /= stats.scale.astype(X.dtype, copy=False)
+    return X
+
+
+def fill_nan_inplace(X: np.ndarray, value: float = 0.0) -> np.ndarray:
+    np.copyto(X, value, where=np.isnan(X))
+    return X
+
+
+def build_feature_matrix(
+    df: pd.DataFrame,
+    cols: list[str],
+    rows: np.ndarray | None = None,
+    scaler: ScalerStats | None = None,
+    dtype=np.float64,
+    fill_value: float | None = 0.0,
+) -> np.ndarray:
+    """Contiguous (rows, len(cols)) matrix of `df[cols]`.
+
+    Args:
+        rows: optional boolean mask selecting rows of `df`.
+        scaler: standardization applied while filling (its columns must match `cols`).
+        dtype: np.float64 or np.float32.
+        fill_value: value NaNs are replaced with after scaling (None keeps NaNs).
+    """
+    if scaler is not None and list(scaler.columns) != list(cols):
+        raise ValueError("Scaler columns do not match the requested feature columns")
+
+    n_rows = len(df) if rows is None else int(np.count_nonzero(rows))
+    X = np.empty((n_rows, len(cols)), dtype=dtype)
+    for j, col in enumerate(cols):
+        column = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        if scaler is not None:
+            # Fused affine on the column (never in place: to_numpy may return a view of the frame)
+            column = np.subtract(column if rows is None else column[rows], scaler.mean[j])
+            column /= scaler.scale[j]
+        elif rows is not None:
+            column = column[rows]
+        if fill_value is not None:
+            missing = np.isnan(column)
+            if missing.any():
+                column = np.where(missing, fill_value, column)
+        X[:, j] = column
+    return X
@@ -0,0 +1,105 @@
+"""Memory-lean dtypes for the nflverse frames, applied once when they are loaded.
+
+Weekly player stats, team stats, injuries and depth charts arrive with 64-bit numbers and
+Python-string keys, so every merge on (player_id, season, week) or (opponent_team, season,
+week) hashes strings. `optimize_nfl_frames`:
+
+    - downcasts integer columns to the smallest integer type holding their values
+    - downcasts float64 columns to float32 only when every value survives the round trip
+      (counts and yards stored as floats); consumers upcast to float64, so features and
+      models are unchanged
+    - turns the key columns into categoricals that share one dtype per key across all frames
+      (player ids, incl. the injuries' / depth charts' `gsis_id`; teams and opponents;
+      positions). Merges of two columns with the same categorical dtype join on the integer
+      codes. Categories are sorted, so sorting by a key gives the same order as the strings.
+    - makes a few low-cardinality label columns (incl. the injury report / practice
+      statuses, see pipelines.injury_encoding) categorical per frame
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["DtypeReport", "downcast_numeric", "optimize_nfl_frames"]
+
+# Key columns sharing one categorical dtype: key -> [(frame, column)]
+SHARED_KEYS = {
+    "player": [("players", "player_id"), ("injuries", "gsis_id"), ("injuries", "player_id"),
+               ("depth", "gsis_id"), ("depth", "player_id")],
+    "team": [("players", "team"), ("players", "opponent_team"), ("teams", "team"),
+             ("teams", "opponent_team"), ("injuries", "team"), ("depth", "club_code")],
+    "position": [("players", "position"), ("injuries", "position"), ("depth", "position")],
+}
+LABEL_COLUMNS = ["position_group", "season_type", "game_type", "report_status", "practice_status"]
+
+
+@dataclass
+class DtypeReport:
+    """Memory (deep, in bytes) of every frame before and after the optimization."""
+
+    before: dict[str, int] = field(default_factory=dict)
+    after: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def saved(self) -> int:
+        return sum(self.before.values()) - sum(self.after.values())
+
+    def describe(self) -> str:
+        parts = [
+            f"{name} {self.before[name] / 2**20:.1f} -> {self.after[name] / 2**20:.1f} MB"
+            for name in self.before
+        ]
+        total = sum(self.before.values())
+        share = self.saved / total if total else 0.0
+        return f"saved {self.saved / 2**20:.1f} MB ({share:.0%}): " + ", ".join(parts)
+
+
+def _memory(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def _is_string(col: pd.Series) -> bool:
+    return pd.api.types.is_object_dtype(col.dtype) or pd.api.types.is_string_dtype(col.dtype)
+
+
+def downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """Integer columns to their smallest integer type, float64 columns to float32 where lossless."""
+    columns = {}
+    for col in df.columns:
+        values = df[col]
+        if not isinstance(values.dtype, np.dtype):
+            continue  # extension dtypes (nullable ints, categoricals, strings) are left alone
+        if values.dtype.kind in "iu":
+            downcast = pd.to_numeric(values, downcast="integer")
+            if downcast.dtype != values.dtype:
+                columns[col] = downcast
+        elif values.dtype == np.float64:
+            array = values.to_numpy()
+            as_float32 = array.astype(np.float32)
+            if np.array_equal(as_float32.astype(np.float64), array, equal_nan=True):
+                columns[col] = pd.Series(as_float32, index=df.index)
+    return df.assign(**columns) if columns else df
+
+
+def optimize_nfl_frames(frames: dict[str, pd.DataFrame]) -> tuple[dict[str, pd.DataFrame], DtypeReport]:
+    """Leaner copies of {"players", "teams", "injuries", "depth", ...} frames (see module docstring)."""
+    report = DtypeReport(before={name: _memory(df) for name, df in frames.items()})
+    out = {name: downcast_numeric(df) for name, df in frames.items()}
+
+    for members in SHARED_KEYS.values():
+        present = [(name, col) for name, col in members if name in out and col in out[name].columns]
+        present = [(name, col) for name, col in present if _is_string(out[name][col])]
+        if not present:
+            continue
+        values = pd.concat([out[name][col] for name, col in present], ignore_index=True).dropna().unique()
+        dtype = pd.CategoricalDtype(sorted(values))
+        for name, col in present:
+            out[name] = out[name].assign(**{col: out[name][col].astype(dtype)})
+
+    for name, df in out.items():
+        labels = {col: df[col].astype("category") for col in LABEL_COLUMNS if col in df.columns and _is_string(df[col])}
+        if labels:
+            out[name] = df.assign(**labels)
+
+    report.after = {name: _memory(df) for name, df in out.items()}
+    return out, report
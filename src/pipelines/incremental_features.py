@@ -0,0 +1,261 @@
+"""Incremental (week-at-a-time) window features for in-season projections.
+
+`run_pipeline` rebuilds every rolling / cumulative feature from the whole season. During the
+season only one new week arrives at a time, and each of those features can be updated from a
+small amount of stored per-group state:
+
+    per (entity, season):   ring buffer of the last `rolling_period` values, running moments
+    per (entity, opponent): running moments
+
+Running moments are utils.Moments accumulators (count, mean, M2 via Welford/Chan), so the
+cumulative std stays numerically stable over long careers and state can be merged.
+
+`IncrementalFeatureUpdater.ingest(week_df)` emits the feature rows for the new week from the
+state accumulated so far (every feature is lagged by one game, so the week's own stats are
+not used) and then folds that week's stats into the state. Outputs use the same column names
+and semantics as the pipeline's `calculate_window_data` (NaNs skipped, rolling min_periods=1,
+sample std), so a week produced incrementally matches a full recompute.
+
+Rows are expected to be unique per (entity, season, week), i.e. one source frame at a time.
+Weeks are folded in order: updating with a (season, week) at or before the last one folded
+in raises a ValueError instead of counting it twice.
+"""
+import json
+
+import numpy as np
+import pandas as pd
+
+import utils
+
+__all__ = ["IncrementalFeatureUpdater"]
+
+
+def _key_array(values: list) -> np.ndarray:
+    """Group keys as int64 when they are all integers (e.g. numeric entity ids), else strings,
+    so they load back equal to the keys the frames are looked up with."""
+    if values and all(isinstance(v, (int, np.integer)) and not isinstance(v, bool) for v in values):
+        return np.array(values, dtype=np.int64)
+    return np.array([str(v) for v in values], dtype=str)
+
+
+class _WindowState:
+    """Running window statistics for a growable set of groups, stored as NumPy arrays."""
+
+    def __init__(self, n_cols: int, rolling_period: int | None = None):
+        self.n_cols = n_cols
+        self.rolling_period = rolling_period
+        self.slots: dict[tuple, int] = {}
+        self.moments = utils.Moments.zeros((0, n_cols))
+        if rolling_period is not None:
+            self.ring = np.full((0, rolling_period, n_cols), np.nan)
+            self.ring_next = np.zeros(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def _grow(self, size: int):
+        capacity = len(self.moments)
+        if size <= capacity:
+            return
+        extra = max(size, 2 * capacity, 64) - capacity
+        self.moments = utils.Moments.concatenate([self.moments, utils.Moments.zeros((extra, self.n_cols))])
+        if self.rolling_period is not None:
+            self.ring = np.concatenate([self.ring, np.full((extra, self.rolling_period, self.n_cols), np.nan)])
+            self.ring_next = np.concatenate([self.ring_next, np.zeros(extra, dtype=np.int64)])
+
+    def lookup(self, keys: list, has_group: np.ndarray, create: bool = False) -> np.ndarray:
+        """Slot per key; -1 where `has_group` is False (a key part is missing) or the key is unknown."""
+        slots = np.full(len(keys), -1, dtype=np.int64)
+        for i in np.flatnonzero(has_group):
+            key = keys[i]
+            slot = self.slots.get(key)
+            if slot is None and create:
+                slot = self.slots[key] = len(self.slots)
+            if slot is not None:
+                slots[i] = slot
+        self._grow(len(self.slots))
+        return slots
+
+    def rolling_mean(self, slots: np.ndarray) -> np.ndarray:
+        out = np.full((slots.shape[0], self.n_cols), np.nan)
+        known = slots >= 0
+        window = self.ring[slots[known]]
+        n = (~np.isnan(window)).sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out[known] = np.where(n > 0, np.nansum(window, axis=1) / n, np.nan)
+        return out
+
+    def mean_std(self, slots: np.ndarray, ddof: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        mean = np.full((slots.shape[0], self.n_cols), np.nan)
+        std = np.full((slots.shape[0], self.n_cols), np.nan)
+        known = slots >= 0
+        mean[known], std[known] = self.moments[slots[known]].finalize(ddof)
+        return mean, std
+
+    def update(self, slots: np.ndarray, values: np.ndarray):
+        known = slots >= 0
+        slots, values = slots[known], values[known]
+        # Groups appearing more than once are applied in row order, one occurrence per pass
+        pending = np.arange(slots.shape[0])
+        while pending.size:
+            _, first = np.unique(slots[pending], return_index=True)
+            batch = pending[np.sort(first)]
+            self._apply(slots[batch], values[batch])
+            pending = np.setdiff1d(pending, batch, assume_unique=True)
+
+    def _apply(self, slots: np.ndarray, values: np.ndarray):
+        self.moments[slots] = self.moments[slots].merge(utils.Moments.from_observations(values))
+        if self.rolling_period is not None:
+            self.ring[slots, self.ring_next[slots]] = values
+            self.ring_next[slots] = (self.ring_next[slots] + 1) % self.rolling_period
+
+    def to_arrays(self, prefix: str) -> dict[str, np.ndarray]:
+        n = len(self.slots)
+        keys = list(self.slots)  # insertion order == slot order
+        arrays = {
+            f"{prefix}_key_0": _key_array([k[0] for k in keys]),
+            f"{prefix}_key_1": _key_array([k[1] for k in keys]),
+            f"{prefix}_count": self.moments.count[:n],
+            f"{prefix}_mean": self.moments.mean[:n],
+            f"{prefix}_m2": self.moments.m2[:n],
+        }
+        if self.rolling_period is not None:
+            arrays[f"{prefix}_ring"] = self.ring[:n]
+            arrays[f"{prefix}_ring_next"] = self.ring_next[:n]
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays, prefix: str, n_cols: int, rolling_period: int | None) -> "_WindowState":
+        state = cls(n_cols, rolling_period)
+        keys = zip(arrays[f"{prefix}_key_0"].tolist(), arrays[f"{prefix}_key_1"].tolist())
+        state.slots = {key: i for i, key in enumerate(keys)}
+        state.moments = utils.Moments(
+            np.array(arrays[f"{prefix}_count"]),
+            np.array(arrays[f"{prefix}_mean"]),
+            np.array(arrays[f"{prefix}_m2"]),
+        )
+        if rolling_period is not None:
+            state.ring = np.array(arrays[f"{prefix}_ring"])
+            state.ring_next = np.array(arrays[f"{prefix}_ring_next"])
+        return state
+
+
+class IncrementalFeatureUpdater:
+    """Stateful, week-at-a-time equivalent of the pipeline's rolling and cumulative features.
+
+    Args:
+        cols: stat columns to build features for (e.g. SOURCE_INPUTS["rushing_and_receiving"]).
+        rolling_period: rolling window length in games.
+        entity: entity id column ("player_id", or "team" for the defensive frame).
+        opponent: opponent column for the vs-opponent features, or None to skip them.
+    """
+
+    def __init__(
+        self,
+        cols: list[str],
+        rolling_period: int = 4,
+        entity: str = "player_id",
+        opponent: str | None = "opponent_team",
+    ):
+        self.cols = list(cols)
+        self.rolling_period = rolling_period
+        self.entity = entity
+        self.opponent = opponent
+        self.season_state = _WindowState(len(self.cols), rolling_period)
+        self.opponent_state = _WindowState(len(self.cols)) if opponent else None
+        self.last_week: tuple[int, int] | None = None
+
+    @property
+    def feature_columns(self) -> list[str]:
+        names = [f"{c}_roll{self.rolling_period}_shift" for c in self.cols]
+        names += [f"{c}_cum_avg" for c in self.cols] + [f"{c}_cum_std" for c in self.cols]
+        if self.opponent:
+            names += [f"vs_opponent_{c}_cum_avg" for c in self.cols]
+            names += [f"vs_opponent_{c}_cum_std" for c in self.cols]
+        return names
+
+    def _slots(self, week_df: pd.DataFrame, create: bool = False) -> tuple[np.ndarray, np.ndarray | None]:
+        """Season-group and opponent-group slots for every row of `week_df`."""
+        entities = week_df[self.entity].to_numpy(dtype=object)
+        has_entity = week_df[self.entity].notna().to_numpy()
+        season_keys = list(zip(entities.tolist(), week_df["season"].astype(int).tolist()))
+        season_slots = self.season_state.lookup(season_keys, has_entity, create)
+
+        opponent_slots = None
+        if self.opponent:
+            opponents = week_df[self.opponent]
+            opponent_keys = list(zip(entities.tolist(), opponents.to_numpy(dtype=object).tolist()))
+            has_opponent = has_entity & opponents.notna().to_numpy()
+            opponent_slots = self.opponent_state.lookup(opponent_keys, has_opponent, create)
+        return season_slots, opponent_slots
+
+    def _values(self, week_df: pd.DataFrame) -> np.ndarray:
+        return week_df[self.cols].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def features(self, week_df: pd.DataFrame) -> pd.DataFrame:
+        """Feature rows for `week_df` from the current state (does not change the state)."""
+        season_slots, opponent_slots = self._slots(week_df)
+        blocks = [self.season_state.rolling_mean(season_slots), *self.season_state.mean_std(season_slots)]
+        if self.opponent:
+            blocks.extend(self.opponent_state.mean_std(opponent_slots))
+
+        key_cols = [c for c in [self.entity, "season", "week", self.opponent] if c and c in week_df.columns]
+        features = pd.DataFrame(np.hstack(blocks), index=week_df.index, columns=self.feature_columns)
+        return pd.concat([week_df[key_cols], features], axis=1)
+
+    def update(self, week_df: pd.DataFrame):
+        """Folds the week's stats into the per-group state (weeks after `last_week` only)."""
+        if not len(week_df):
+            return
+        weeks = list(zip(week_df["season"].astype(int).tolist(), week_df["week"].astype(int).tolist()))
+        if self.last_week is not None and min(weeks) <= self.last_week:
+            raise ValueError(
+                f"week {min(weeks)} is at or before the last week already folded in {self.last_week}"
+            )
+        season_slots, opponent_slots = self._slots(week_df, create=True)
+        values = self._values(week_df)
+        self.season_state.update(season_slots, values)
+        if self.opponent:
+            self.opponent_state.update(opponent_slots, values)
+        self.last_week = max(weeks)
+
+    def ingest(self, week_df: pd.DataFrame) -> pd.DataFrame:
+        """Emits the feature rows for a new week, then adds the week to the state."""
+        features = self.features(week_df)
+        self.update(week_df)
+        return features
+
+    @classmethod
+    def from_history(cls, df: pd.DataFrame, cols: list[str], **kwargs) -> "IncrementalFeatureUpdater":
+        """Builds the state by replaying every (season, week) of `df` in order."""
+        updater = cls(cols, **kwargs)
+        ordered = df.sort_values(["season", "week", updater.entity], kind="stable")
+        for _, week_df in ordered.groupby(["season", "week"], sort=True):
+            updater.update(week_df)
+        return updater
+
+    def save(self, path: str):
+        """Persists the state to a single `.npz` (plain arrays, no pickled objects)."""
+        meta = {
+            "cols": self.cols,
+            "rolling_period": self.rolling_period,
+            "entity": self.entity,
+            "opponent": self.opponent,
+            "last_week": self.last_week,
+        }
+        arrays = {"meta": np.array(json.dumps(meta)), **self.season_state.to_arrays("season")}
+        if self.opponent:
+            arrays.update(self.opponent_state.to_arrays("opponent"))
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "IncrementalFeatureUpdater":
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            updater = cls(meta["cols"], meta["rolling_period"], meta["entity"], meta["opponent"])
+            updater.last_week = tuple(meta["last_week"]) if meta["last_week"] else None
+            n_cols = len(updater.cols)
+            updater.season_state = _WindowState.from_arrays(data, "season", n_cols, updater.rolling_period)
+            if updater.opponent:
+                updater.opponent_state = _WindowState.from_arrays(data, "opponent", n_cols, None)
+        return updater
@@ -0,0 +1,76 @@
+"""Fixed-vocabulary one-hot encoding of injury report and practice statuses.
+
+The vocabulary is `utils.REQUIRED_INJURY_ENCODED_COLS`: every feature is named
+`<column>_<category>` and the features always come out in that order, whatever statuses the
+data holds, so nothing is fitted and the same encoder serves training and scoring.
+
+Statuses are matched after normalizing whitespace and case (nflverse spells "Did Not
+Participate In Practice" with either case of "In", and has blank statuses such as "\\n    ",
+which fall into the `practice_status_\\n    ` feature). A missing report status is the
+`report_status_None` feature. Unknown statuses encode as all zeros.
+
+Encoding is one categorical pass per column: only the distinct statuses are normalized and
+looked up, and the rows' category codes index the resulting feature positions.
+"""
+import numpy as np
+import pandas as pd
+
+import utils
+
+__all__ = ["InjuryEncoder", "INJURY_ENCODER"]
+
+
+def _normalize(status) -> str:
+    return " ".join(str(status).split()).casefold()
+
+
+class InjuryEncoder:
+    """uint8 indicator columns of `feature_names` (see module docstring)."""
+
+    def __init__(
+        self,
+        feature_names: list[str] = utils.REQUIRED_INJURY_ENCODED_COLS,
+        columns: tuple[str, ...] = ("report_status", "practice_status"),
+        missing: dict[str, str] | None = None,
+    ):
+        """
+        Args:
+            feature_names: `<column>_<category>` names, in output order.
+            columns: the status columns encoded.
+            missing: {column: category} that missing values of `column` encode as
+                (default: a missing report status is "None").
+        """
+        self.feature_names = list(feature_names)
+        self.columns = tuple(columns)
+        missing = {"report_status": "None"} if missing is None else missing
+
+        self.vocabulary: dict[str, dict[str, int]] = {col: {} for col in self.columns}
+        for position, name in enumerate(self.feature_names):
+            col = next((c for c in self.columns if name.startswith(f"{c}_")), None)
+            if col is None:
+                raise ValueError(f"feature {name!r} does not belong to any of {self.columns}")
+            self.vocabulary[col].setdefault(_normalize(name[len(col) + 1:]), position)
+        self.missing = {
+            col: self.vocabulary[col].get(_normalize(missing[col]), -1) if col in missing else -1
+            for col in self.columns
+        }
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Indicator frame (uint8, `feature_names` columns) aligned with `df`'s index."""
+        encoded = np.zeros((len(df), len(self.feature_names)), dtype=np.uint8)
+        rows = np.arange(len(df))
+        for col in self.columns:
+            statuses = df[col].astype("category")
+            vocabulary = self.vocabulary[col]
+            # Feature position per category, plus the missing one last (code -1 indexes it)
+            positions = np.array(
+                [vocabulary.get(_normalize(c), -1) for c in statuses.cat.categories] + [self.missing[col]],
+                dtype=np.int64,
+            )
+            features = positions[statuses.cat.codes.to_numpy()]
+            hit = features >= 0
+            encoded[rows[hit], features[hit]] = 1
+        return pd.DataFrame(encoded, columns=self.feature_names, index=df.index)
+
+
+INJURY_ENCODER = InjuryEncoder()
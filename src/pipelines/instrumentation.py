@@ -0,0 +1,189 @@
+"""Per-stage timing and memory instrumentation for the pipelines.
+
+`PipelineTrace.stage(name)` is a context manager around one pipeline stage. It records a
+`StageRecord` with:
+
+    - wall time (`perf_counter`) and CPU time of the process (`process_time`)
+    - the process' peak RSS after the stage and how much the stage raised it (Unix only)
+    - the peak Python allocation during the stage above what was allocated when it started
+      (tracemalloc, only when the trace is created with `trace_memory=True`, it slows
+      allocation-heavy code down)
+    - the row / column counts of the stage's output, given with `record.output(obj)`
+
+Stages can be nested. Every finished stage is logged as one structured line on the
+`pipelines.trace` logger (the record is also attached as `extra={"stage": {...}}`), and
+`write_chrome_trace` saves all of them as a Chrome trace (chrome://tracing, Perfetto).
+"""
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Iterator
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+__all__ = ["StageRecord", "PipelineTrace"]
+
+logger = logging.getLogger("pipelines.trace")
+
+_MB = 2**20
+
+
+def _max_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes elsewhere
+    return max_rss / _MB if sys.platform == "darwin" else max_rss / 1024
+
+
+def _shape(obj) -> tuple[int | None, int | None]:
+    """Rows and columns of a frame, or total rows / widest frame of the distinct frames in a
+    dict, list or tuple (e.g. the feature store)."""
+    if isinstance(obj, pd.DataFrame):
+        return obj.shape
+    if isinstance(obj, pd.Series):
+        return len(obj), 1
+    values = obj.values() if isinstance(obj, dict) else obj if isinstance(obj, (list, tuple)) else []
+    frames = {id(v): v for v in values if isinstance(v, pd.DataFrame)}
+    if not frames:
+        return None, None
+    return sum(len(df) for df in frames.values()), max(df.shape[1] for df in frames.values())
+
+
+@dataclass
+class StageRecord:
+    name: str
+    start: float  # seconds since the trace started
+    depth: int = 0  # nesting level
+    wall: float = 0.0
+    cpu: float = 0.0
+    max_rss_mb: float | None = None
+    rss_growth_mb: float | None = None
+    alloc_peak_mb: float | None = None
+    rows: int | None = None
+    columns: int | None = None
+    error: str | None = None
+    meta: dict[str, Any] = field(default_factory=dict)
+
+    def output(self, obj) -> Any:
+        """Records the row / column counts of the stage's output and returns it."""
+        self.rows, self.columns = _shape(obj)
+        return obj
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def describe(self) -> str:
+        parts = [f"stage={self.name}", f"wall_s={self.wall:.3f}", f"cpu_s={self.cpu:.3f}"]
+        if self.max_rss_mb is not None:
+            parts.append(f"max_rss_mb={self.max_rss_mb:.1f} (+{self.rss_growth_mb:.1f})")
+        if self.alloc_peak_mb is not None:
+            parts.append(f"alloc_peak_mb={self.alloc_peak_mb:.1f}")
+        if self.rows is not None:
+            parts.append(f"rows={self.rows} cols={self.columns}")
+        parts += [f"{k}={v}" for k, v in self.meta.items()]
+        if self.error:
+            parts.append(f"error={self.error!r}")
+        return " ".join(parts)
+
+
+class PipelineTrace:
+    """Collects `StageRecord`s of the stages run inside `stage` (see module docstring)."""
+
+    def __init__(self, trace_memory: bool = False):
+        self.records: list[StageRecord] = []
+        self.trace_memory = trace_memory
+        self._origin = time.perf_counter()
+        self._stack: list[dict] = []
+        self._started_tracemalloc = False
+
+    @contextmanager
+    def stage(self, name: str, **meta) -> Iterator[StageRecord]:
+        """Times the body as stage `name`; `meta` is logged and stored with the record."""
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+        record = StageRecord(name, time.perf_counter() - self._origin, depth=len(self._stack), meta=meta)
+        frame = {"peak": 0}
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                # The parent's peak so far; resetting the peak below would lose it
+                self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+            tracemalloc.reset_peak()
+            frame["start_alloc"] = current
+        self._stack.append(frame)
+
+        rss_before = _max_rss_mb()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        except BaseException as exc:
+            record.error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            record.wall = time.perf_counter() - wall
+            record.cpu = time.process_time() - cpu
+            record.max_rss_mb = _max_rss_mb()
+            if rss_before is not None:
+                record.rss_growth_mb = record.max_rss_mb - rss_before
+
+            self._stack.pop()
+            if "start_alloc" in frame and tracemalloc.is_tracing():
+                peak = max(tracemalloc.get_traced_memory()[1], frame["peak"])
+                record.alloc_peak_mb = max(peak - frame["start_alloc"], 0) / _MB
+                if self._stack:
+                    self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+            if not self._stack and self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+
+            self.records.append(record)
+            logger.info(record.describe(), extra={"stage": record.as_dict()})
+
+    def to_chrome_trace(self) -> dict:
+        """The records as Chrome trace events (complete events plus a peak RSS counter)."""
+        pid, tid = os.getpid(), threading.get_ident()
+        events = []
+        for record in sorted(self.records, key=lambda r: (r.start, r.depth)):
+            args = {k: v for k, v in record.as_dict().items() if k not in ("name", "start") and v is not None}
+            events.append({
+                "name": record.name,
+                "cat": "pipeline",
+                "ph": "X",
+                "ts": record.start * 1e6,
+                "dur": record.wall * 1e6,
+                "pid": pid,
+                "tid": tid,
+                "args": args,
+            })
+            if record.max_rss_mb is not None:
+                events.append({
+                    "name": "max_rss_mb",
+                    "ph": "C",
+                    "ts": (record.start + record.wall) * 1e6,
+                    "pid": pid,
+                    "args": {"max_rss_mb": record.max_rss_mb},
+                })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str) -> str:
+        """Writes the Chrome trace JSON to `path` and returns the path."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+        return path
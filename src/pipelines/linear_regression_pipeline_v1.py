@@ -1,11 +1,10 @@
+import logging
 import os
 import sys
 import numpy as np
 import pandas as pd
 
-from sklearn.preprocessing import OneHotEncoder, StandardScaler
 from sklearn.linear_model import LinearRegression
-from sklearn.model_selection import train_test_split
 from sklearn.metrics import root_mean_squared_error, r2_score
 
 from dotenv import load_dotenv
@@ -24,13 +23,25 @@ if project_root not in sys.path:
 # Now import internal modules
 import utils
 from data_api import NFLDataPy
+from pipelines.batched_training import train_and_validate_batched
+from pipelines.feature_matrix import ScalerStats, build_feature_matrix, fit_feature_scalers
+from pipelines.frame_dtypes import optimize_nfl_frames
+from pipelines.injury_encoding import INJURY_ENCODER
+from pipelines.instrumentation import PipelineTrace
+from pipelines.model_registry import ModelRegistry, data_fingerprint, load_registry
+from pipelines.parallel import train_and_validate_parallel
+from pipelines.projection_service import ProjectionService, serve
+from pipelines.slate_scoring import score_slate
 
 __all__ = [
     "run_pipeline", 
     "train_and_validate_model",
     "encode_and_filter_injuries_data",
     "encode_depth_data",
-    "save_and_store_model_weights"
+    "save_and_store_model_weights",
+    "save_model_registry",
+    "serve_projections",
+    "project_slate",
 ]
 
 # -----------------------------------------------------------------------------
@@ -41,59 +52,81 @@ TARGET_INPUTS = utils.TARGETS_TO_INPUTS
 
 ROLLING_PERIOD = 4
 
+MODEL_VERSION = "linear_regression_v1"
+MODEL_REGISTRY_PATH = os.getenv("MODEL_REGISTRY_PATH", os.path.join("models", f"{MODEL_VERSION}.models"))
+# Optional Chrome trace of the stage timings written by main(), with tracemalloc peaks if enabled
+PIPELINE_TRACE_PATH = os.getenv("PIPELINE_TRACE_PATH")
+PIPELINE_TRACE_MEMORY = os.getenv("PIPELINE_TRACE_MEMORY", "").lower() in ("1", "true", "yes")
+
 CATEGORIES_POSITIONS = {
     "passing": ["QB"],
     "rushing_and_receiving": ["RB", "WR", "TE", "QB"],
     # (kicking not available)
 }
 
+# Positional frame each target is modeled from. Targets that share a source also share
+# its feature-store frame, so every (entity, input column, window) feature is built once.
+TARGET_SOURCES = {
+    "rsh_yd": "rushing_and_receiving",
+    "rsh_td": "rushing_and_receiving",
+    "rc_yd": "rushing_and_receiving",
+    "rc_td": "rushing_and_receiving",
+    "rc": "rushing_and_receiving",
+    "p_yd": "passing",
+    "p_td": "passing",
+    "intcpt": "passing",
+    "rsh_fmbls": "both",
+    "rc_fmbls": "both",
+}
+
+# Union of the input columns of every target drawing from a source
+SOURCE_INPUTS = {
+    source: list(dict.fromkeys(
+        col for target, target_source in TARGET_SOURCES.items() if target_source == source
+        for col in TARGET_INPUTS[target]
+    ))
+    for source in dict.fromkeys(TARGET_SOURCES.values())
+}
+SOURCE_INPUTS["def"] = TARGET_INPUTS["def"]
+
 # -----------------------------------------------------------------------------
 # Load Persistent DataFrames
 # -----------------------------------------------------------------------------
-print("Loading base data frames...")
-nfl_data = NFLDataPy()
+# Downloaded on first use, so importing this module (e.g. from the dashboard, tests or
+# benchmarks with their own frames) stays offline.
 years = [2024]
-all_players_df = nfl_data.load_player_stats(years)
-injuries_df = nfl_data.load_injuries(years)
-depth_df = nfl_data.load_depth_charts(years)
-all_teams_df = nfl_data.load_team_stats(years)
-print("-" * 40)
-print("\n")
+_base_frames: dict[str, pd.DataFrame] = {}
+
+
+def load_base_frames() -> dict[str, pd.DataFrame]:
+    """Weekly player and team stats, injuries and depth charts of `years` (loaded once)."""
+    if not _base_frames:
+        nfl_data = NFLDataPy()
+        _base_frames["players"] = nfl_data.load_player_stats(years)
+        _base_frames["injuries"] = nfl_data.load_injuries(years)
+        _base_frames["depth"] = nfl_data.load_depth_charts(years)
+        _base_frames["teams"] = nfl_data.load_team_stats(years)
+    return _base_frames
 
 # -----------------------------------------------------------------------------
 # Helpers
 # -----------------------------------------------------------------------------
-def encode_and_filter_injuries_data(injuries_df: pd.DataFrame = injuries_df):
-    df_inj = injuries_df.copy()
-    if "gsis_id" in df_inj.columns:
-        df_inj = df_inj.rename({"gsis_id": "player_id"}, axis=1)
-
-    filtered = df_inj[["season", "week", "player_id", "report_status", "practice_status"]].copy()
-
-    encoder = OneHotEncoder(handle_unknown="ignore", sparse_output=False)
-    X_cat = filtered[["report_status", "practice_status"]]
-    encoded_data = encoder.fit_transform(X_cat)
-    encoded_feature_names = encoder.get_feature_names_out(X_cat.columns)
-
-    encoded_df = pd.DataFrame(encoded_data, columns=encoded_feature_names, index=filtered.index).fillna(0)
-
-    # Drop extraneous columns
-    keep_mask = np.isin(encoded_feature_names, utils.REQUIRED_INJURY_ENCODED_COLS)
-    encoded_feature_names = encoded_feature_names[keep_mask]
-
-    # Add missing encoded feature names that are required by the model
-    for col in utils.REQUIRED_INJURY_ENCODED_COLS:
-        if col not in encoded_feature_names:
-            encoded_df[col] = 0
-            encoded_feature_names = np.append(encoded_feature_names, col)
-    
-    encoded_df = encoded_df[encoded_feature_names]
-  
-    out = pd.concat([filtered[["season", "week", "player_id"]], encoded_df], axis=1)
-    return out, encoded_feature_names
-
-
-def filter_depth_data(depth_df: pd.DataFrame = depth_df):
+def encode_and_filter_injuries_data(injuries_df: pd.DataFrame | None = None):
+    """Player-week keys plus the uint8 injury indicators of the fixed vocabulary
+    (see pipelines.injury_encoding), and the indicators' names."""
+    if injuries_df is None:
+        injuries_df = load_base_frames()["injuries"]
+    if "gsis_id" in injuries_df.columns:
+        injuries_df = injuries_df.rename({"gsis_id": "player_id"}, axis=1)
+
+    encoded_df = INJURY_ENCODER.transform(injuries_df)
+    out = pd.concat([injuries_df[["season", "week", "player_id"]], encoded_df], axis=1)
+    return out, np.array(INJURY_ENCODER.feature_names, dtype=object)
+
+
+def filter_depth_data(depth_df: pd.DataFrame | None = None):
+    if depth_df is None:
+        depth_df = load_base_frames()["depth"]
     # Always start from a concrete base df
     if "gsis_id" in depth_df.columns:
         base = depth_df.rename({"gsis_id": "player_id"}, axis=1).copy()
@@ -103,8 +136,9 @@ def filter_depth_data(depth_df: pd.DataFrame = depth_df):
     filtered = base[["season", "week", "player_id", "depth_team"]].copy()
     filtered = filtered.dropna(subset=["season", "week"]).reset_index(drop=True)
 
-    filtered["week"] = filtered["week"].astype(int)
-    filtered["season"] = filtered["season"].astype(int)
+    # Smallest integer type, as the players' keys (see pipelines.frame_dtypes)
+    filtered["week"] = pd.to_numeric(filtered["week"].astype(int), downcast="integer")
+    filtered["season"] = pd.to_numeric(filtered["season"].astype(int), downcast="integer")
 
     # Fill NaNs in depth with mean depth (around 1.5/2.0)
     if filtered["depth_team"].isna().any():
@@ -118,8 +152,9 @@ def merge_players_to_depth_and_injury(
     filtered_injuries_df: pd.DataFrame,
     filtered_depth_df: pd.DataFrame,
 ) -> pd.DataFrame:
-    df = all_players_df.merge(filtered_injuries_df, how="left", on=["player_id", "season", "week"])
-    df = df.merge(filtered_depth_df, how="left", on=["player_id", "season", "week"])
+    # Left joins on one int64 key per (player_id, season, week), see utils.joins
+    df = utils.left_join(all_players_df, filtered_injuries_df, ["player_id", "season", "week"])
+    df = utils.left_join(df, filtered_depth_df, ["player_id", "season", "week"])
     return df
 
 
@@ -129,6 +164,41 @@ def filter_by_positional_group(df: pd.DataFrame, category_key_a: str, category_k
     return new_df.reset_index(drop=True)
 
 
+def _get_input_refs(input_ref: str) -> list[str]:
+    """Raw input columns for a feature-store source or a single target."""
+    if input_ref in SOURCE_INPUTS:
+        return SOURCE_INPUTS[input_ref]
+    return TARGET_INPUTS[input_ref]
+
+
+def calculate_window_data(
+    df: pd.DataFrame,
+    sort_values: list,
+    input_ref: str,
+    groupby: list,
+    rolling_period: int | None = None,
+    cumulative: bool = True,
+    prefix: str = "",
+    min_periods: int = 1,
+    shift: int = 1,
+) -> pd.DataFrame:
+    """Adds lagged rolling and/or cumulative (mean, std) features for every input column of
+    `input_ref` (a source or target) in a single vectorized pass over the groups
+    (see utils.grouped_window_features).
+    """
+    df = df.sort_values(sort_values)
+    cols = _get_input_refs(input_ref)
+    features = utils.grouped_window_features(
+        df, cols, groupby,
+        rolling_period=rolling_period,
+        min_periods=min_periods,
+        shift=shift,
+        cumulative=cumulative,
+        prefix=prefix,
+    )
+    return pd.concat([df, features], axis=1)
+
+
 def calculate_rolling_data(
     df: pd.DataFrame,
     sort_values: list,
@@ -138,13 +208,10 @@ def calculate_rolling_data(
     min_periods: int = 1,
     shift: int = 1,
 ) -> pd.DataFrame:
-    df = df.sort_values(sort_values)
-    cols = TARGET_INPUTS[input_ref]
-    df[[f"{c}_roll{rolling_period}_shift" for c in cols]] = (
-        df.groupby(groupby)[cols]
-          .transform(lambda x: x.rolling(rolling_period, min_periods=min_periods).mean().shift(shift))
+    return calculate_window_data(
+        df, sort_values, input_ref, groupby,
+        rolling_period=rolling_period, cumulative=False, min_periods=min_periods, shift=shift,
     )
-    return df
 
 
 def calculate_cumulative_data(
@@ -155,27 +222,17 @@ def calculate_cumulative_data(
     prefix: str = "",
     shift: int = 1
 ) -> pd.DataFrame:
-    df = df.sort_values(sort_values)
-    cols = TARGET_INPUTS[input_ref]
-    # mean
-    df[[f"{prefix}{c}_cum_avg" for c in cols]] = (
-        df.groupby(groupby)[cols]
-          .transform(lambda x: x.expanding().mean().shift(shift))
-    )
-    # std (sample std by default); adjust min_periods/ddof if you prefer
-    df[[f"{prefix}{c}_cum_std" for c in cols]] = (
-        df.groupby(groupby)[cols]
-          .transform(lambda x: x.expanding().std().shift(shift))
-    )
-    return df
+    # mean and sample std (ddof=1) of all prior rows in the group
+    return calculate_window_data(df, sort_values, input_ref, groupby, prefix=prefix, shift=shift)
 
 
 def get_standard_input_cols(target: str, encoded_feature_names) -> list[str]:
-    rolling_cols = [col + f"_roll{ROLLING_PERIOD}_shift" for col in TARGET_INPUTS[target]]
-    avg_cum_cols = [col + "_cum_avg" for col in TARGET_INPUTS[target]]
-    std_cum_cols = [col + "_cum_std" for col in TARGET_INPUTS[target]]
-    opp_avg_cum_cols = ["vs_opponent_" + col + "_cum_avg" for col in TARGET_INPUTS[target]]
-    opp_std_cum_cols = ["vs_opponent_" + col + "_cum_std" for col in TARGET_INPUTS[target]]
+    inputs = _get_input_refs(target)
+    rolling_cols = [col + f"_roll{ROLLING_PERIOD}_shift" for col in inputs]
+    avg_cum_cols = [col + "_cum_avg" for col in inputs]
+    std_cum_cols = [col + "_cum_std" for col in inputs]
+    opp_avg_cum_cols = ["vs_opponent_" + col + "_cum_avg" for col in inputs]
+    opp_std_cum_cols = ["vs_opponent_" + col + "_cum_std" for col in inputs]
 
     return (
         rolling_cols
@@ -188,17 +245,6 @@ def get_standard_input_cols(target: str, encoded_feature_names) -> list[str]:
     )
 
 
-def scale_inplace(df: pd.DataFrame, cols: list[str], name: str, scalers: dict | None = None):
-    if scalers is None:
-        scalers = {}
-    scaler = StandardScaler()
-    for col in cols:
-        df[f"{col}_copy"] = df[col] # Save a preserved column
-    df.loc[:, cols] = scaler.fit_transform(df[cols])
-    scalers[name] = scaler
-    return df, scalers
-
-
 def handle_merge(
     left_df: pd.DataFrame,
     right_df: pd.DataFrame,
@@ -206,39 +252,49 @@ def handle_merge(
     left_on: list = ["opponent_team", "season", "week"],
     right_on: list = ["team", "season", "week"],
 ) -> pd.DataFrame:
+    """Joins the opponent's team-week onto every player-week. Left joins run on int64 keys
+    (utils.left_join) and keep only the left key columns, so the player's `team` is not
+    suffixed by the defense's."""
+    if how == "left":
+        return utils.left_join(left_df, right_df, left_on, right_on)
     return left_df.merge(right_df, how=how, left_on=left_on, right_on=right_on)
 
 
-def generate_target_dataframe_struct(
+def generate_feature_store_struct(
     encoded_feature_names,
     rushing_and_receiving_df: pd.DataFrame,
     passing_df: pd.DataFrame,
     all_teams_df: pd.DataFrame,
 ) -> dict[str, pd.DataFrame]:
+    """Builds one frame per source (see TARGET_SOURCES) holding the union of its targets' inputs.
+    Features are engineered on these frames once and shared by every target of the source.
+    """
     standard_inputs = [
         "season", "week", "player_id", "position",
         "player_display_name", "team", "opponent_team", "depth_team",
     ]
     enc = list(encoded_feature_names)
 
-    target_data_struct: dict[str, pd.DataFrame] = {}
-
-    rushing_cats = ["rsh_yd", "rsh_td", "rc_yd", "rc_td", "rc"]
-    passing_cats = ["p_yd", "p_td", "intcpt"]
-    both_cats = ["rsh_fmbls", "rc_fmbls"]
+    positional_frames = {
+        "rushing_and_receiving": rushing_and_receiving_df,
+        "passing": passing_df,
+        "both": pd.concat([rushing_and_receiving_df, passing_df], ignore_index=True),
+    }
 
-    for target in TARGET_INPUTS:
-        if target in rushing_cats:
-            target_data_struct[target] = rushing_and_receiving_df[TARGET_INPUTS[target] + standard_inputs + enc].copy()
-        elif target in passing_cats:
-            target_data_struct[target] = passing_df[TARGET_INPUTS[target] + standard_inputs + enc].copy()
-        elif target in both_cats:
-            both = pd.concat([rushing_and_receiving_df, passing_df], ignore_index=True)
-            target_data_struct[target] = both[TARGET_INPUTS[target] + standard_inputs + enc].copy()
+    feature_store: dict[str, pd.DataFrame] = {}
+    for source, df in positional_frames.items():
+        feature_store[source] = df[SOURCE_INPUTS[source] + standard_inputs + enc].copy()
 
     # Defensive (opponent) stats handled separately
-    target_data_struct["def"] = all_teams_df[TARGET_INPUTS["def"] + ["season", "week", "team"]].copy()
+    feature_store["def"] = all_teams_df[SOURCE_INPUTS["def"] + ["season", "week", "team"]].copy()
+
+    return feature_store
 
+
+def select_target_data(feature_store: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    """Maps every target to its source's feature-store frame (shared, not copied)."""
+    target_data_struct = {target: feature_store[source] for target, source in TARGET_SOURCES.items()}
+    target_data_struct["def"] = feature_store["def"]
     return target_data_struct
 
 
@@ -246,7 +302,7 @@ def get_input_cols_by_target(target_data_struct: dict[str, pd.DataFrame], encode
     input_cols_by_target: dict[str, list[str]] = {}
     for target in target_data_struct:
         if target == "def":
-            input_cols_by_target[target] = [col + f"_roll{ROLLING_PERIOD}_shift" for col in TARGET_INPUTS[target]]
+            input_cols_by_target[target] = [col + f"_roll{ROLLING_PERIOD}_shift" for col in _get_input_refs(target)]
         else:
             input_cols_by_target[target] = get_standard_input_cols(target, encoded_feature_names)
     return input_cols_by_target
@@ -258,26 +314,15 @@ def calculate_rolling_and_cumulative_data(
 ) -> dict[str, pd.DataFrame]:
     for target, df in target_data_struct.items():
         if target == "def":
-            tmp = calculate_rolling_data(df, ["season", "week", "team"], target, ["season", "team"], rolling_period=rolling_period)
-            tmp = calculate_cumulative_data(tmp, ["season", "week", "team"], target, ["season", "team"])
+            tmp = calculate_window_data(df, ["season", "week", "team"], target, ["season", "team"], rolling_period=rolling_period)
             target_data_struct[target] = tmp
         else:
-            tmp = calculate_rolling_data(df, ["season", "week", "player_id"], target, ["season", "player_id"], rolling_period=rolling_period)
-            tmp = calculate_cumulative_data(tmp, ["season", "week", "player_id"], target, ["season", "player_id"])
-            tmp = calculate_cumulative_data(tmp, ["season", "week", "player_id"], target, ["opponent_team", "player_id"], prefix="vs_opponent_")
+            tmp = calculate_window_data(df, ["season", "week", "player_id"], target, ["season", "player_id"], rolling_period=rolling_period)
+            tmp = calculate_window_data(tmp, ["season", "week", "player_id"], target, ["opponent_team", "player_id"], prefix="vs_opponent_")
             target_data_struct[target] = tmp
     return target_data_struct
 
 
-def scale_target_data(target_data_struct: dict[str, pd.DataFrame], target_input_cols: dict[str, list[str]]) -> dict[str, pd.DataFrame]:
-    for target, df in target_data_struct.items():
-        cols = target_input_cols.get(target, [])
-        if not cols:
-            continue
-        target_data_struct[target], _ = scale_inplace(df, cols, target)  # discard scalers for now
-    return target_data_struct
-
-
 def merge_target_data_to_defense(target_data_struct: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
     # merge 'def' onto each offensive df
     def_df = target_data_struct["def"]
@@ -292,47 +337,19 @@ def train_and_validate_model(
     target_data_struct: dict[str, pd.DataFrame],
     target_input_cols: dict[str, list[str]],
     season_holdout: int = 2024,
+    scalers: dict[str, ScalerStats] | None = None,
+    alpha: float = 0.0,
 ):
-    model_results: dict[str, dict] = {}
-    models: dict[str, LinearRegression] = {}
-    predictions: dict[str, np.array] = {}
-    trues: dict[str, np.array] = {}
-
-    for target, df in target_data_struct.items():
-        if target == "def":
-            continue  # no target variable for defense
-
-        input_cols = target_input_cols[target]
-        def_input_cols = target_input_cols["def"]
-
-        # hold out a season for validation split (and avoid leakage)
-        mask = df["season"] != season_holdout
+    """Fits one model per target on standardized features (scalers are fitted on the feature
+    store when not given, see pipelines.feature_matrix).
 
-        # Build a single feature matrix with aligned rows, then dropna once
-        feature_cols = input_cols + def_input_cols
-        XY = df.loc[mask, feature_cols + [utils.TARGET_TRANSLATION[target]]].fillna(0) #.dropna().reset_index(drop=True)
-
-        if XY.empty:
-            model_results[target] = {"validation_rmse": "nan", "r2": "nan"}
-            continue
-
-        X = XY[feature_cols].values
-        y = XY[utils.TARGET_TRANSLATION[target]].values
-
-        X_train, X_valid, y_train, y_valid = train_test_split(X, y, test_size=0.2, random_state=42)
-
-        reg = LinearRegression().fit(X_train, y_train)
-        preds = reg.predict(X_valid)
-
-        rmse = root_mean_squared_error(y_valid, preds)
-        r2 = r2_score(y_valid, preds)
-
-        model_results[target] = {"validation_rmse": f"{rmse:.4f}", "r2": f"{r2:.3f}"}
-        models[target] = reg
-        predictions[target] = preds
-        trues[target] = y_valid
-
-    return models, model_results, trues, predictions
+    All targets are solved in closed form from shared normal equations
+    (see pipelines.batched_training); `alpha` > 0 fits ridge models instead of OLS.
+    Validation trues and predictions are Series indexed by their rows in the target's frame.
+    """
+    return train_and_validate_batched(
+        target_data_struct, target_input_cols, season_holdout, scalers=scalers, alpha=alpha
+    )
 
 
 def _restore_weights(
@@ -350,6 +367,40 @@ def _restore_weights(
         restored.feature_names_in_ = fni
     return restored
 
+
+def _restore_feature_names(model_path: str) -> tuple[str, ...] | None:
+    """Feature names in coefficient order saved with the weights (None if there are none)."""
+    with np.load(model_path, allow_pickle=True) as data:
+        for key in ("feature_names", "feature_names_in_"):
+            if key in data and data[key].ndim == 1 and data[key].size > 0:
+                return tuple(str(name) for name in data[key].tolist())
+    return None
+
+
+def _align_coefficients(target: str, reg: LinearRegression, names: tuple[str, ...] | None, columns: tuple[str, ...]):
+    """Reorders the model's coefficients from its stored feature order to `columns`."""
+    if names is None:
+        raise ValueError(
+            f"{target}: saved weights have no feature names, so their coefficients cannot be matched "
+            "to the feature columns; retrain and save them with their scalers"
+        )
+    if sorted(names) != sorted(columns):
+        raise ValueError(f"{target}: saved feature names do not match the scaler columns")
+    position = {name: i for i, name in enumerate(names)}
+    reg.coef_ = np.asarray(reg.coef_)[..., [position[c] for c in columns]]
+    reg.n_features_in_ = len(columns)
+    if hasattr(reg, "feature_names_in_"):
+        del reg.feature_names_in_  # scored on arrays in `columns` order
+    return reg
+
+
+def _restore_scaler(model_path: str) -> ScalerStats | None:
+    """Scaler parameters saved with the weights (None for weights saved without them)."""
+    with np.load(model_path, allow_pickle=False) as data:
+        if "scaler_mean" not in data:
+            return None
+        return ScalerStats(tuple(data["feature_names"].tolist()), data["scaler_mean"], data["scaler_scale"])
+
 def _get_model_paths(
         target_names: list,
         linear_regression_weights_path: str
@@ -365,35 +416,60 @@ def _get_model_paths(
 def test_model(
     test_data_struct: dict[str, pd.DataFrame],
     test_input_cols: dict[str, list[str]],
-    linear_regression_weights_path: str
+    linear_regression_weights_path: str,
+    scalers: dict[str, ScalerStats] | None = None,
 ):
-    model_results: dict[str, dict] = {}
-    models: dict[str, LinearRegression] = {}
-    predictions: dict[str, dict] = {}
-    trues: dict[str, dict] = {}
+    """Scores every target with saved models. `linear_regression_weights_path` is either a
+    model registry file (see pipelines.model_registry, loaded once per process) or a folder
+    of per-target `.npz` weights.
 
-    model_paths = _get_model_paths(list(test_data_struct.keys()), linear_regression_weights_path)
+    Features are scaled with the statistics fitted at training time and stored with the
+    models (or the given `scalers`), and every model's coefficients are matched to the columns
+    by its stored feature names; weights saved without feature names raise a ValueError.
+    Scaling is never fitted on the scored data: models saved without scaler statistics raise
+    a ValueError and have to be retrained and saved with their scalers.
 
-    for target, df in test_data_struct.items():
-        if target == "def":
-            continue  # no target variable for defense
-
-        reg = _restore_weights(model_paths[target])
+    Trues and predictions are Series indexed like the target's frame.
+    """
+    model_results: dict[str, dict] = {}
+    models: dict[str, LinearRegression] = {}
+    predictions: dict[str, pd.Series] = {}
+    trues: dict[str, pd.Series] = {}
+
+    targets = [target for target in test_data_struct if target != "def"]
+    if os.path.isfile(linear_regression_weights_path):
+        registry = load_registry(linear_regression_weights_path)
+        restored = {target: registry[target].to_linear_regression() for target in targets}
+        feature_names = {target: registry[target].feature_names for target in targets}
+        stored_scalers = {target: registry[target].scaler for target in targets}
+    else:
+        model_paths = _get_model_paths(targets, linear_regression_weights_path)
+        restored = {target: _restore_weights(model_paths[target]) for target in targets}
+        feature_names = {target: _restore_feature_names(model_paths[target]) for target in targets}
+        stored_scalers = {target: _restore_scaler(model_paths[target]) for target in targets}
+
+    scalers = stored_scalers if scalers is None else scalers
+    missing = [target for target in targets if scalers.get(target) is None]
+    if missing:
+        raise ValueError(
+            f"Saved models in {linear_regression_weights_path} have no scaler statistics for "
+            f"{', '.join(missing)}; retrain and save them with their scalers "
+            "(save_model_registry or save_and_store_model_weights(..., scalers=...))"
+        )
 
-        input_cols = test_input_cols[target]
-        def_input_cols = test_input_cols["def"]
+    for target in targets:
+        df = test_data_struct[target]
+        feature_cols = list(scalers[target].columns)
+        reg = _align_coefficients(target, restored[target], feature_names[target], tuple(feature_cols))
 
-        # Build a single feature matrix with aligned rows, then dropna once
-        feature_cols = input_cols + def_input_cols
-        XY = df.loc[:, feature_cols + [utils.TARGET_TRANSLATION[target]]].fillna(0)
+        # Build the scaled feature matrix and target vector directly, NaNs filled with 0
+        X = build_feature_matrix(df, feature_cols, scaler=scalers[target])
+        y = build_feature_matrix(df, [utils.TARGET_TRANSLATION[target]])[:, 0]
 
-        if XY.empty:
+        if X.shape[0] == 0:
             model_results[target] = {"validation_rmse": "nan", "r2": "nan"}
             continue
 
-        X = XY[feature_cols].values
-        y = XY[utils.TARGET_TRANSLATION[target]].values
-
         preds = reg.predict(X)
 
         rmse = root_mean_squared_error(y, preds)
@@ -401,93 +477,179 @@ def test_model(
 
         model_results[target] = {"validation_rmse": f"{rmse:.4f}", "r2": f"{r2:.3f}"}
         models[target] = reg
-        trues[target] = y
-        predictions[target] = preds
+        trues[target] = pd.Series(y, index=df.index, name=target)
+        predictions[target] = pd.Series(preds, index=df.index, name=target)
     
     return model_results, trues, predictions
 
 
-def save_and_store_model_weights(models: dict, path: str = "models"):
-    """Save the coefficients and intercept for the linear regression models to models/ folder."""
+def save_and_store_model_weights(models: dict, path: str = "models", scalers: dict[str, ScalerStats] | None = None):
+    """Save the coefficients and intercept for the linear regression models to models/ folder,
+    with each model's feature names and scaler statistics when `scalers` is given.
+    """
     os.makedirs(path, exist_ok=True)
 
     for name, lr in models.items():
+        scaler_arrays = {}
+        if scalers is not None:
+            scaler_arrays = {
+                "feature_names": np.array(scalers[name].columns, dtype=str),
+                "scaler_mean": scalers[name].mean,
+                "scaler_scale": scalers[name].scale,
+            }
         np.savez(
             os.path.join(path, f"{name}_linreg_weights.npz"),
             coef=lr.coef_,
             intercept=lr.intercept_,
             n_features_in_=lr.n_features_in_,
             feature_names_in_=getattr(lr, "feature_names_in_", None),
+            **scaler_arrays,
         )
 
 
+def save_model_registry(
+    models: dict[str, LinearRegression],
+    target_data_struct: dict[str, pd.DataFrame],
+    target_input_cols: dict[str, list[str]],
+    scalers: dict[str, ScalerStats] | None = None,
+    path: str = MODEL_REGISTRY_PATH,
+    version: str = MODEL_VERSION,
+) -> ModelRegistry:
+    """Save every target model, its feature names, scaler parameters and a fingerprint of the
+    training data to a single registry file.
+    """
+    feature_names = {target: target_input_cols[target] + target_input_cols["def"] for target in models}
+    registry = ModelRegistry.from_models(
+        models, feature_names, scalers, version, data_fingerprint(target_data_struct, target_input_cols)
+    )
+    registry.save(path)
+    return registry
+
+
 def run_pipeline(
-        players_df: pd.DataFrame = all_players_df,
-        teams_df:  pd.DataFrame = all_teams_df,
-        injuries_df: pd.DataFrame = injuries_df, 
-        depth_df: pd.DataFrame = depth_df
+        players_df: pd.DataFrame | None = None,
+        teams_df:  pd.DataFrame | None = None,
+        injuries_df: pd.DataFrame | None = None, 
+        depth_df: pd.DataFrame | None = None,
+        trace: PipelineTrace | None = None,
+        optimize_dtypes: bool = True,
 ) -> dict[str, pd.DataFrame]:
-    """Runs the data preprocessing pipeline for inputs of all_players_df, injuries_df, and depth_df.
-    If no arguments are given, it will default to the dataframes of the same name in this file. 
+    """Runs the data preprocessing pipeline for inputs of players_df, teams_df, injuries_df, and depth_df.
+    Frames that are not given default to the ones of `years` (see load_base_frames).
     Returns a data structure containing the processed dataframes for each target.
+
+    Every stage is timed and logged (see pipelines.instrumentation); pass a `trace` to keep
+    the records, e.g. to write them as a Chrome trace.
+
+    The frames are first converted to lean dtypes (see pipelines.frame_dtypes) unless
+    `optimize_dtypes` is False; the features and models do not change.
     """
-    # 1) Prepare injuries/depth and merge with players first
-    print("Filtering and merging injuries and depth charts...")
-    filtered_injuries_df, encoded_feature_names = encode_and_filter_injuries_data(injuries_df)
-    filtered_depth_df = filter_depth_data(depth_df)
-    merged_players = merge_players_to_depth_and_injury(players_df, filtered_injuries_df, filtered_depth_df)
-    print("-" * 40)
-    print("\n")
+    trace = trace or PipelineTrace()
+    if any(df is None for df in (players_df, teams_df, injuries_df, depth_df)):
+        with trace.stage("load_base_frames"):
+            base = load_base_frames()
+        players_df = base["players"] if players_df is None else players_df
+        teams_df = base["teams"] if teams_df is None else teams_df
+        injuries_df = base["injuries"] if injuries_df is None else injuries_df
+        depth_df = base["depth"] if depth_df is None else depth_df
+
+    with trace.stage("run_pipeline", players=len(players_df)) as pipeline_stage:
+        if optimize_dtypes:
+            with trace.stage("dtype_optimization") as stage:
+                frames, report = optimize_nfl_frames(
+                    {"players": players_df, "teams": teams_df, "injuries": injuries_df, "depth": depth_df}
+                )
+                players_df, teams_df, injuries_df, depth_df = (
+                    frames["players"], frames["teams"], frames["injuries"], frames["depth"]
+                )
+                stage.meta["saved_mb"] = round(report.saved / 2**20, 1)
+                stage.output(frames)
+
+        # 1) Prepare injuries/depth and merge with players first
+        with trace.stage("injury_encoding") as stage:
+            filtered_injuries_df, encoded_feature_names = stage.output(encode_and_filter_injuries_data(injuries_df))
+        with trace.stage("depth_filter") as stage:
+            filtered_depth_df = stage.output(filter_depth_data(depth_df))
+        with trace.stage("player_merge") as stage:
+            merged_players = stage.output(merge_players_to_depth_and_injury(players_df, filtered_injuries_df, filtered_depth_df))
+
+        # 2) Build positional dataframes FROM the merged players df
+        with trace.stage("positional_split") as stage:
+            passing_df = filter_by_positional_group(merged_players, "passing")
+            rushing_and_receiving_df = filter_by_positional_group(merged_players, "rushing_and_receiving")
+            stage.output([passing_df, rushing_and_receiving_df])
+
+        # Optional: quick null check utility (add .alias only if used)
+        passing_df.alias = "passing_df"
+        rushing_and_receiving_df.alias = "rushing_and_receiving_df"
+
+        # 3) Create the per-source feature store
+        with trace.stage("feature_store") as stage:
+            feature_store = stage.output(generate_feature_store_struct(
+                encoded_feature_names, rushing_and_receiving_df, passing_df, teams_df
+            ))
+
+        # 4) Feature engineering: rolling / cumulative (season & vs-opponent), then merge defense.
+        # Each stage runs once per source; targets then select their shared source frame.
+        # Features stay unscaled here; standardization is applied when the model matrices are
+        # built (see pipelines.feature_matrix).
+        with trace.stage("feature_engineering") as stage:
+            feature_store = stage.output(calculate_rolling_and_cumulative_data(feature_store))
+        with trace.stage("defensive_merge") as stage:
+            feature_store = stage.output(merge_target_data_to_defense(feature_store))
+            target_data_struct = select_target_data(feature_store)
+            target_input_cols = get_input_cols_by_target(target_data_struct, encoded_feature_names)
+        pipeline_stage.output(feature_store)
+    return target_data_struct, target_input_cols
 
-    # 2) Build positional dataframes FROM the merged players df
-    print("Generating positional dataframes...")
-    passing_df = filter_by_positional_group(merged_players, "passing")
-    rushing_and_receiving_df = filter_by_positional_group(merged_players, "rushing_and_receiving")
-    print(f"Generated positional dataframes with {passing_df.size} rows and {rushing_and_receiving_df.size} rows")
-    print("-" * 40)
-    print("\n")
 
-    # Optional: quick null check utility (add .alias only if used)
-    passing_df.alias = "passing_df"
-    rushing_and_receiving_df.alias = "rushing_and_receiving_df"
+def serve_projections(registry_path: str = MODEL_REGISTRY_PATH, host: str = "127.0.0.1", port: int = 8050):
+    """Indexes the engineered feature store and serves single-player projections over HTTP
+    (GET /project?player_id=...&season=...&week=..., see pipelines.projection_service).
+    """
+    target_data_struct, target_input_cols = run_pipeline()
+    service = ProjectionService.build(target_data_struct, load_registry(registry_path), target_input_cols["def"])
+    serve(service, host, port)
 
-    # 3) Create per-target dataframes
-    print("Generating target data structure and input columns by statistical category...")
-    target_data_struct = generate_target_dataframe_struct(
-        encoded_feature_names, rushing_and_receiving_df, passing_df, teams_df
-    )
-    target_input_cols = get_input_cols_by_target(target_data_struct, encoded_feature_names)
-    print("-" * 40)
-    print("\n")
 
-    # 4) Feature engineering: rolling / cumulative (season & vs-opponent), then scale, then merge defense
-    print("Engineering features for cumulative and rolling data...")
-    target_data_struct = calculate_rolling_and_cumulative_data(target_data_struct)
-    target_data_struct = scale_target_data(target_data_struct, target_input_cols)
-    target_data_struct = merge_target_data_to_defense(target_data_struct)
-    print("-" * 40)
-    print("\n")
-    return target_data_struct, target_input_cols
+def project_slate(season: int, week: int, registry_path: str = MODEL_REGISTRY_PATH) -> pd.DataFrame:
+    """Wide projections (one row per player, `Projected <stat>` columns and `Projected Points`)
+    for every player of a week, scored in bulk with the registered models.
+    """
+    target_data_struct, _ = run_pipeline()
+    return score_slate(target_data_struct, load_registry(registry_path), season, week)
 
 
 def main():
-    target_data_struct, target_input_cols = run_pipeline()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    trace = PipelineTrace(trace_memory=PIPELINE_TRACE_MEMORY)
+    target_data_struct, target_input_cols = run_pipeline(trace=trace)
+    with trace.stage("scaling"):
+        scalers = fit_feature_scalers(target_data_struct, target_input_cols)
 
-    # 5) Train & validate models
+    # 5) Train & validate models (one process per target, see pipelines.parallel)
     print("Training and validating model...")
-    models, model_results = train_and_validate_model(target_data_struct, target_input_cols)
+    with trace.stage("training"):
+        models, model_results, _, _, timings = train_and_validate_parallel(
+            target_data_struct, target_input_cols, scalers=scalers
+        )
     print("-" * 40) 
     print("\n")
 
     # 6) Report
     print("\nMODEL RESULTS:")
     for target, metrics in model_results.items():
-        print(f"{target}: {metrics}")
+        print(f"{target}: {metrics} ({timings[target]['total']:.2f}s)")
     print("-" * 40)
 
     print("Saving model weights...")
-    save_and_store_model_weights(models)
-    print("Model weights saved!")
+    with trace.stage("saving"):
+        save_and_store_model_weights(models, scalers=scalers)
+        save_model_registry(models, target_data_struct, target_input_cols, scalers)
+    print(f"Model weights saved! (registry: {MODEL_REGISTRY_PATH})")
+
+    if PIPELINE_TRACE_PATH:
+        print(f"Stage trace written to {trace.write_chrome_trace(PIPELINE_TRACE_PATH)} (open in chrome://tracing).")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,241 @@
+"""Single-file registry of every target model of a model version.
+
+`save_and_store_model_weights` writes one pickled-metadata `.npz` per target. A registry file
+instead holds, for all targets of a version:
+
+    - coefficients and intercept
+    - the ordered feature names the coefficients apply to
+    - the scaler parameters (mean / scale per feature) fitted with the model
+    - a fingerprint of the training data
+
+File layout (no pickle anywhere):
+
+    b"NFLMODEL" | uint64 header length | JSON header | padding to 64 bytes | float64 blob
+
+The header describes every array as an (offset, length) slice of the blob. Loading parses the
+header and memory-maps the blob, so arrays are read lazily from the page cache, and
+`load_registry` keeps loaded registries in-process (keyed by path and modification time) for
+repeated scoring, e.g. in the dashboard.
+"""
+import hashlib
+import json
+import os
+import struct
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+
+import utils
+
+from .feature_matrix import ScalerStats
+
+__all__ = ["RegisteredModel", "ModelRegistry", "stack_models", "load_registry", "data_fingerprint"]
+
+_MAGIC = b"NFLMODEL"
+_FORMAT_VERSION = 1
+_ALIGNMENT = 64
+
+
+@dataclass(frozen=True)
+class RegisteredModel:
+    """A fitted linear model with the feature names (and scaling) it expects."""
+
+    target: str
+    feature_names: tuple[str, ...]
+    coef: np.ndarray
+    intercept: float
+    scaler: ScalerStats | None = None
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return X @ self.coef + self.intercept
+
+    def to_linear_regression(self) -> LinearRegression:
+        reg = LinearRegression()
+        reg.coef_ = np.asarray(self.coef)
+        reg.intercept_ = self.intercept
+        reg.n_features_in_ = len(self.feature_names)
+        return reg
+
+
+class ModelRegistry:
+    """All target models of one model version."""
+
+    def __init__(
+        self,
+        models: dict[str, RegisteredModel],
+        version: str = "",
+        fingerprint: str = "",
+        created: str | None = None,
+    ):
+        self.models = dict(models)
+        self.version = version
+        self.fingerprint = fingerprint
+        self.created = created or datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    def __getitem__(self, target: str) -> RegisteredModel:
+        return self.models[target]
+
+    def __contains__(self, target: str) -> bool:
+        return target in self.models
+
+    def __iter__(self):
+        return iter(self.models)
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    @classmethod
+    def from_models(
+        cls,
+        models: dict[str, LinearRegression],
+        feature_names: dict[str, list[str]],
+        scalers: dict[str, ScalerStats] | None = None,
+        version: str = "",
+        fingerprint: str = "",
+    ) -> "ModelRegistry":
+        """Wraps fitted models; `feature_names[target]` lists the columns in coefficient order."""
+        registered = {}
+        for target, reg in models.items():
+            names = tuple(feature_names[target])
+            coef = np.asarray(reg.coef_, dtype=np.float64).ravel()
+            if coef.shape[0] != len(names):
+                raise ValueError(f"{target}: {coef.shape[0]} coefficients for {len(names)} feature names")
+            scaler = scalers.get(target) if scalers else None
+            if scaler is not None and scaler.columns != names:
+                raise ValueError(f"{target}: scaler columns do not match the feature names")
+            registered[target] = RegisteredModel(target, names, coef, float(np.ravel(reg.intercept_)[0]), scaler)
+        return cls(registered, version, fingerprint)
+
+    def to_linear_regressions(self) -> dict[str, LinearRegression]:
+        return {target: model.to_linear_regression() for target, model in self.models.items()}
+
+    def save(self, path: str):
+        """Writes the registry to a single file (see module docstring for the layout)."""
+        arrays: list[np.ndarray] = []
+        offset = 0
+
+        def _slot(values: np.ndarray) -> list[int]:
+            nonlocal offset
+            values = np.ascontiguousarray(values, dtype=np.float64)
+            arrays.append(values)
+            offset += values.shape[0]
+            return [offset - values.shape[0], values.shape[0]]
+
+        entries = {}
+        for target, model in self.models.items():
+            entry = {
+                "features": list(model.feature_names),
+                "coef": _slot(model.coef),
+                "intercept": model.intercept,
+                "scaler": None,
+            }
+            if model.scaler is not None:
+                entry["scaler"] = {"mean": _slot(model.scaler.mean), "scale": _slot(model.scaler.scale)}
+            entries[target] = entry
+
+        header = json.dumps({
+            "format": _FORMAT_VERSION,
+            "version": self.version,
+            "created": self.created,
+            "fingerprint": self.fingerprint,
+            "models": entries,
+        }).encode("utf-8")
+        prefix = len(_MAGIC) + 8 + len(header)
+        padding = b" " * (-prefix % _ALIGNMENT)
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(struct.pack("<Q", len(header) + len(padding)))
+            f.write(header + padding)
+            for values in arrays:
+                f.write(values.astype("<f8", copy=False).tobytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ModelRegistry":
+        """Reads the header and memory-maps the weights (no pickle)."""
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{path} is not a model registry file")
+            (header_len,) = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(header_len).decode("utf-8"))
+        if header.get("format") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported model registry format: {header.get('format')}")
+
+        data_offset = len(_MAGIC) + 8 + header_len
+        n_values = (os.path.getsize(path) - data_offset) // 8
+        blob = np.memmap(path, dtype="<f8", mode="r", offset=data_offset, shape=(n_values,)) if n_values else np.empty(0)
+
+        def _view(slot: list[int]) -> np.ndarray:
+            start, length = slot
+            return blob[start:start + length]
+
+        models = {}
+        for target, entry in header["models"].items():
+            names = tuple(entry["features"])
+            scaler = None
+            if entry["scaler"] is not None:
+                scaler = ScalerStats(names, _view(entry["scaler"]["mean"]), _view(entry["scaler"]["scale"]))
+            models[target] = RegisteredModel(target, names, _view(entry["coef"]), float(entry["intercept"]), scaler)
+        return cls(models, header["version"], header["fingerprint"], header["created"])
+
+
+def stack_models(
+    models: list[RegisteredModel],
+    columns: list[str] | None = None,
+) -> tuple[list[str], np.ndarray, np.ndarray, ScalerStats | None]:
+    """Stacks models into one (features x targets) coefficient matrix.
+
+    `columns` defaults to the union of the models' feature names in first-appearance order; a
+    model's coefficient is 0 for every column it does not use. Returns the columns, the
+    coefficient matrix, the intercepts and the scaler over the columns (None unless every
+    model stores one). Models sharing a column must share its scaling.
+    """
+    if columns is None:
+        columns = list(dict.fromkeys(c for m in models for c in m.feature_names))
+    position = {c: j for j, c in enumerate(columns)}
+    coef = np.zeros((len(columns), len(models)))
+    for k, model in enumerate(models):
+        coef[[position[c] for c in model.feature_names], k] = model.coef
+    intercept = np.array([m.intercept for m in models], dtype=np.float64)
+
+    scaler = None
+    if models and all(m.scaler is not None for m in models):
+        scaler = ScalerStats.concat([m.scaler for m in models]).select(columns)
+        for model in models:
+            idx = [position[c] for c in model.feature_names]
+            if not (np.array_equal(scaler.mean[idx], model.scaler.mean)
+                    and np.array_equal(scaler.scale[idx], model.scaler.scale)):
+                raise ValueError(f"{model.target}: scaler statistics differ from the other stacked models")
+    return columns, coef, intercept, scaler
+
+
+_CACHE: dict[str, tuple[tuple[int, int], ModelRegistry]] = {}
+
+
+def load_registry(path: str) -> ModelRegistry:
+    """`ModelRegistry.load` with an in-process cache, refreshed when the file changes."""
+    path = os.path.realpath(path)
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _CACHE.get(path)
+    if cached is None or cached[0] != key:
+        cached = _CACHE[path] = (key, ModelRegistry.load(path))
+    return cached[1]
+
+
+def data_fingerprint(target_data_struct: dict[str, pd.DataFrame], target_input_cols: dict[str, list[str]]) -> str:
+    """SHA-256 over every target's training columns (names, row count and values)."""
+    digest = hashlib.sha256()
+    for target, df in target_data_struct.items():
+        if target == "def":
+            continue
+        cols = target_input_cols[target] + target_input_cols["def"] + [utils.TARGET_TRANSLATION[target]]
+        digest.update(json.dumps([target, len(df), cols]).encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(df[cols], index=False).to_numpy().tobytes())
+    return digest.hexdigest()
@@ -0,0 +1,262 @@
+"""Process-parallel per-target training and scoring.
+
+`train_and_validate_model` and `test_model` handle the targets one after another. Every target
+is independent once the feature store is built, so the functions here run each target's
+feature preparation, fit and scoring in a process pool instead.
+
+Targets drawing from the same source share one feature-store frame (with the defensive block
+already merged in). Each distinct frame is copied once into a float64 matrix in shared memory;
+workers attach to it by name and take only their own columns, so neither the frame nor the
+common defensive features are pickled per task. Only column indices, scaler parameters and
+(for scoring) model coefficients travel to the workers.
+
+Results come back in the same `models` / `model_results` / `trues` / `predictions` shapes as
+the serial functions (workers return the frame positions of the scored rows, so trues and
+predictions are Series indexed by row label), plus per-target timings in seconds:
+    {"prepare": ..., "fit": ..., "score": ..., "total": ...}
+"""
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import r2_score, root_mean_squared_error
+from sklearn.model_selection import train_test_split
+
+import utils
+
+from .feature_matrix import ScalerStats, fill_nan_inplace, fit_feature_scalers, standardize_inplace
+
+__all__ = ["train_and_validate_parallel", "score_parallel"]
+
+
+@dataclass(frozen=True)
+class _SharedBlock:
+    """Handle to a float64 (rows, columns) matrix living in shared memory."""
+
+    name: str
+    shape: tuple[int, int]
+
+
+@dataclass(frozen=True)
+class _TargetTask:
+    target: str
+    block: _SharedBlock
+    feature_idx: list[int]
+    target_idx: int
+    season_idx: int
+    scaler: ScalerStats
+    season_holdout: int | None = None  # None: score every row with `coef` / `intercept`
+    coef: np.ndarray | None = None
+    intercept: float | None = None
+
+
+def _feature_cols(target: str, target_input_cols: dict[str, list[str]]) -> list[str]:
+    return target_input_cols[target] + target_input_cols["def"]
+
+
+@contextmanager
+def _shared_blocks(target_data_struct: dict[str, pd.DataFrame], target_input_cols: dict[str, list[str]]):
+    """Copies every distinct target frame's needed columns into shared memory once.
+
+    Yields {target: (block, column index)}; the segments are released on exit.
+    """
+    frames: dict[int, list[str]] = {}
+    for target, df in target_data_struct.items():
+        if target == "def":
+            continue
+        needed = frames.setdefault(id(df), ["season"])
+        for col in _feature_cols(target, target_input_cols) + [utils.TARGET_TRANSLATION[target]]:
+            if col not in needed:
+                needed.append(col)
+
+    segments: list[shared_memory.SharedMemory] = []
+    blocks: dict[int, tuple[_SharedBlock, dict[str, int]]] = {}
+    try:
+        for target, df in target_data_struct.items():
+            if target == "def" or id(df) in blocks:
+                continue
+            cols = frames[id(df)]
+            values = df[cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+            segments.append(shm)
+            np.ndarray(values.shape, dtype=np.float64, buffer=shm.buf)[:] = values
+            blocks[id(df)] = (_SharedBlock(shm.name, values.shape), {c: i for i, c in enumerate(cols)})
+
+        yield {target: blocks[id(df)] for target, df in target_data_struct.items() if target != "def"}
+    finally:
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+
+def _make_tasks(
+    target_input_cols: dict[str, list[str]],
+    blocks: dict,
+    scalers: dict[str, ScalerStats],
+    options: dict[str, dict],
+) -> list[_TargetTask]:
+    """One task per target; `options[target]` holds the task's mode-specific fields."""
+    tasks = []
+    for target, (block, index) in blocks.items():
+        tasks.append(_TargetTask(
+            target=target,
+            block=block,
+            feature_idx=[index[c] for c in _feature_cols(target, target_input_cols)],
+            target_idx=index[utils.TARGET_TRANSLATION[target]],
+            season_idx=index["season"],
+            scaler=scalers[target],
+            **options[target],
+        ))
+    return tasks
+
+
+def _run_target(task: _TargetTask) -> dict:
+    """Worker: prepares the target's matrix from shared memory, then fits and/or scores it."""
+    start = time.perf_counter()
+    shm = shared_memory.SharedMemory(name=task.block.name)
+    try:
+        data = np.ndarray(task.block.shape, dtype=np.float64, buffer=shm.buf)
+        rows = np.arange(task.block.shape[0])
+        if task.season_holdout is not None:
+            rows = np.flatnonzero(data[:, task.season_idx] != task.season_holdout)
+            data = data[rows]
+        # Fancy indexing copies, so nothing below refers to the shared segment
+        X = data[:, task.feature_idx]
+        y = data[:, [task.target_idx]].ravel()
+        del data
+    finally:
+        shm.close()
+    fill_nan_inplace(standardize_inplace(X, task.scaler))
+    fill_nan_inplace(y)
+    timing = {"prepare": time.perf_counter() - start, "fit": 0.0, "score": 0.0}
+
+    if X.shape[0] == 0:
+        timing["total"] = time.perf_counter() - start
+        return {"target": task.target, "model_results": {"validation_rmse": "nan", "r2": "nan"}, "timing": timing}
+
+    if task.season_holdout is None:
+        reg = LinearRegression()
+        reg.coef_ = task.coef
+        reg.intercept_ = task.intercept
+        reg.n_features_in_ = X.shape[1]
+        X_eval, y_eval = X, y
+    else:
+        # hold out a season for validation split (and avoid leakage)
+        tic = time.perf_counter()
+        # Same rows as train_test_split(X, y, test_size=0.2, random_state=42)
+        train_idx, eval_idx = train_test_split(np.arange(X.shape[0]), test_size=0.2, random_state=42)
+        X_eval, y_eval, rows = X[eval_idx], y[eval_idx], rows[eval_idx]
+        coef, intercept = utils.fit_least_squares(X[train_idx], y[train_idx])
+        reg = LinearRegression()
+        reg.coef_, reg.intercept_, reg.n_features_in_ = coef[0], float(intercept[0]), X.shape[1]
+        timing["fit"] = time.perf_counter() - tic
+
+    tic = time.perf_counter()
+    preds = reg.predict(X_eval)
+    rmse = root_mean_squared_error(y_eval, preds)
+    r2 = r2_score(y_eval, preds)
+    timing["score"] = time.perf_counter() - tic
+    timing["total"] = time.perf_counter() - start
+
+    return {
+        "target": task.target,
+        "model_results": {"validation_rmse": f"{rmse:.4f}", "r2": f"{r2:.3f}"},
+        "model": reg,
+        "rows": rows,
+        "trues": y_eval,
+        "predictions": preds,
+        "timing": timing,
+    }
+
+
+def _keyed(result: dict, df: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+    """A worker's trues / predictions as Series indexed by the labels of the scored rows."""
+    index = df.index[result["rows"]]
+    target = result["target"]
+    return (pd.Series(result["trues"], index=index, name=target),
+            pd.Series(result["predictions"], index=index, name=target))
+
+
+def _run_tasks(tasks: list[_TargetTask], max_workers: int | None) -> list[dict]:
+    if not tasks:
+        return []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_run_target, tasks))
+
+
+def train_and_validate_parallel(
+    target_data_struct: dict[str, pd.DataFrame],
+    target_input_cols: dict[str, list[str]],
+    season_holdout: int = 2024,
+    max_workers: int | None = None,
+    scalers: dict[str, ScalerStats] | None = None,
+):
+    """Parallel `train_and_validate_model`.
+
+    Returns models, model_results, trues, predictions (as the serial version) and timings.
+    """
+    if scalers is None:
+        scalers = fit_feature_scalers(target_data_struct, target_input_cols)
+    models: dict[str, LinearRegression] = {}
+    model_results: dict[str, dict] = {}
+    trues: dict[str, pd.Series] = {}
+    predictions: dict[str, pd.Series] = {}
+    timings: dict[str, dict] = {}
+
+    with _shared_blocks(target_data_struct, target_input_cols) as blocks:
+        options = {t: {"season_holdout": season_holdout} for t in blocks}
+        tasks = _make_tasks(target_input_cols, blocks, scalers, options)
+        results = _run_tasks(tasks, max_workers)
+
+    for result in results:
+        target = result["target"]
+        model_results[target] = result["model_results"]
+        timings[target] = result["timing"]
+        if "model" in result:
+            models[target] = result["model"]
+            trues[target], predictions[target] = _keyed(result, target_data_struct[target])
+
+    return models, model_results, trues, predictions, timings
+
+
+def score_parallel(
+    test_data_struct: dict[str, pd.DataFrame],
+    test_input_cols: dict[str, list[str]],
+    models: dict[str, LinearRegression],
+    scalers: dict[str, ScalerStats],
+    max_workers: int | None = None,
+):
+    """Parallel `test_model` scoring already restored `models` (one per target).
+
+    `scalers` are the statistics the models were trained with (e.g. `RegisteredModel.scaler`);
+    they are never fitted on the scored data.
+    Returns model_results, trues, predictions (as the serial version) and timings.
+    """
+    missing = [t for t in test_data_struct if t != "def" and (scalers or {}).get(t) is None]
+    if missing:
+        raise ValueError(
+            f"No training scaler statistics for {', '.join(missing)}: retrain and save the models with their scalers"
+        )
+    model_results: dict[str, dict] = {}
+    trues: dict[str, pd.Series] = {}
+    predictions: dict[str, pd.Series] = {}
+    timings: dict[str, dict] = {}
+
+    with _shared_blocks(test_data_struct, test_input_cols) as blocks:
+        options = {t: {"coef": models[t].coef_, "intercept": models[t].intercept_} for t in blocks}
+        tasks = _make_tasks(test_input_cols, blocks, scalers, options)
+        results = _run_tasks(tasks, max_workers)
+
+    for result in results:
+        target = result["target"]
+        model_results[target] = result["model_results"]
+        timings[target] = result["timing"]
+        if "model" in result:
+            trues[target], predictions[target] = _keyed(result, test_data_struct[target])
+
+    return model_results, trues, predictions, timings
@@ -0,0 +1,179 @@
+"""Low-latency single-player projections.
+
+`ProjectionService.build` runs once over the engineered feature store and a model registry and
+keeps, per source frame:
+
+    - an index (player_id, season, week) -> row of a scaled player-feature matrix
+    - the stacked coefficients of every target model fed by that frame
+
+plus one index (team, season, week) -> row of the scaled defensive rolling features. A
+projection then costs a few dictionary lookups and one small (1 x features) @ (features x
+targets) product per source, applied to the player's row and the opponent's defensive row,
+followed by the fantasy-point weights used by `utils.compile_player_points_and_projections`.
+
+Features are lagged (they only use games before the keyed week), so the row for
+(player, season, week) is the projection for that week.
+
+`serve` exposes the service over a small local HTTP endpoint:
+
+    GET /project?player_id=00-0033873&season=2024&week=7
+"""
+import json
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+import utils
+from utils.data_descriptions.StatProjections import POSITION_PLAYER_STAT_PROJECTION_DATA_DICT
+
+from .feature_matrix import build_feature_matrix
+from .model_registry import ModelRegistry, stack_models
+
+__all__ = ["ProjectionService", "make_server", "serve"]
+
+POINT_WEIGHTS = {stat: float(spec["weight"]) for stat, spec in POSITION_PLAYER_STAT_PROJECTION_DATA_DICT.items()}
+# Player-week columns returned with every projection (also by pipelines.slate_scoring)
+META_COLS = ["player_display_name", "position", "team", "opponent_team"]
+
+
+@dataclass
+class _SourceBlock:
+    """Scaled player features of one feature-store frame and the models that read them."""
+
+    stats: list[str]  # projected stat per model column
+    rows: dict[tuple, int]  # (player_id, season, week) -> row
+    features: np.ndarray  # (rows, player features), scaled, NaN -> 0
+    meta: list[dict]
+    coef: np.ndarray  # (player features + defensive features, targets)
+    intercept: np.ndarray  # (targets,)
+
+
+def _row_keys(df: pd.DataFrame, entity: str) -> list[tuple]:
+    return list(zip(
+        df[entity].tolist(),
+        df["season"].astype(int).tolist(),
+        df["week"].astype(int).tolist(),
+    ))
+
+
+class ProjectionService:
+    """In-memory projection index over a feature store and one model registry."""
+
+    def __init__(self, blocks: list[_SourceBlock], def_rows: dict[tuple, int], def_features: np.ndarray):
+        self.blocks = blocks
+        self.def_rows = def_rows
+        self.def_features = def_features
+        self._no_defense = np.zeros(def_features.shape[1])
+
+    @classmethod
+    def build(
+        cls,
+        target_data_struct: dict[str, pd.DataFrame],
+        registry: ModelRegistry,
+        def_cols: list[str],
+    ) -> "ProjectionService":
+        """Indexes the frames of `target_data_struct` (as returned by `run_pipeline`).
+
+        Every registered model must list its player features followed by `def_cols`.
+        """
+        n_def = len(def_cols)
+        targets_by_frame: dict[int, list[str]] = {}
+        for target, df in target_data_struct.items():
+            if target != "def" and target in registry:
+                targets_by_frame.setdefault(id(df), []).append(target)
+
+        blocks: list[_SourceBlock] = []
+        def_scaler = None
+        for targets in targets_by_frame.values():
+            df = target_data_struct[targets[0]]
+            models = [registry[t] for t in targets]
+            for model in models:
+                if list(model.feature_names[-n_def:]) != list(def_cols) or model.scaler is None:
+                    raise ValueError(f"Model '{model.target}' needs scaler statistics and trailing defensive features")
+            def_scaler = models[0].scaler.select(def_cols)
+
+            player_cols = list(dict.fromkeys(c for m in models for c in m.feature_names[:-n_def]))
+            _, coef, intercept, scaler = stack_models(models, player_cols + list(def_cols))
+            meta_cols = [c for c in META_COLS if c in df.columns]
+            blocks.append(_SourceBlock(
+                stats=[utils.TARGET_TRANSLATION[t] for t in targets],
+                rows={key: i for i, key in reversed(list(enumerate(_row_keys(df, "player_id"))))},
+                features=build_feature_matrix(df, player_cols, scaler=scaler.select(player_cols)),
+                meta=df[meta_cols].astype(object).where(df[meta_cols].notna(), None).to_dict("records"),
+                coef=coef,
+                intercept=intercept,
+            ))
+
+        def_df = target_data_struct["def"]
+        def_rows = {key: i for i, key in reversed(list(enumerate(_row_keys(def_df, "team"))))}
+        def_features = (build_feature_matrix(def_df, list(def_cols), scaler=def_scaler)
+                        if def_scaler is not None else np.zeros((len(def_df), n_def)))
+        return cls(blocks, def_rows, def_features)
+
+    def project(self, player_id: str, season: int, week: int) -> dict | None:
+        """Projected stats and fantasy points for one player-week (None if not indexed)."""
+        key = (player_id, int(season), int(week))
+        result = None
+        for block in self.blocks:
+            row = block.rows.get(key)
+            if row is None:
+                continue
+            if result is None:
+                meta = block.meta[row]
+                result = {"player_id": player_id, "season": key[1], "week": key[2], **meta, "projections": {}}
+            def_row = self.def_rows.get((result.get("opponent_team"), key[1], key[2]))
+            defense = self._no_defense if def_row is None else self.def_features[def_row]
+            values = np.concatenate([block.features[row], defense]) @ block.coef + block.intercept
+            for stat, value in zip(block.stats, values.tolist()):
+                result["projections"].setdefault(stat, value)
+
+        if result is not None:
+            projections = result["projections"]
+            result["projected_points"] = sum(POINT_WEIGHTS[s] * projections.get(s, 0.0) for s in POINT_WEIGHTS)
+        return result
+
+
+def make_server(service: ProjectionService, host: str = "127.0.0.1", port: int = 8050) -> ThreadingHTTPServer:
+    """HTTP server answering GET /project?player_id=...&season=...&week=... with JSON."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status: int, payload: dict):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path != "/project":
+                return self._send(404, {"error": "unknown path"})
+            params = {k: v[0] for k, v in parse_qs(url.query).items()}
+            try:
+                result = service.project(params["player_id"], int(params["season"]), int(params["week"]))
+            except (KeyError, ValueError):
+                return self._send(400, {"error": "player_id, season and week are required"})
+            if result is None:
+                return self._send(404, {"error": "no features for that player-week"})
+            return self._send(200, result)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def serve(service: ProjectionService, host: str = "127.0.0.1", port: int = 8050):
+    """Serves projections until interrupted."""
+    server = make_server(service, host, port)
+    print(f"Serving projections on http://{host}:{server.server_address[1]}/project")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
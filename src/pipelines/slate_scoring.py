@@ -0,0 +1,93 @@
+"""Bulk projection scoring for a whole slate.
+
+`test_model` scores one target at a time and the dashboard then outer-joins the per-target
+results (`assemble_combined_df`). For a slate this module instead, per feature-store frame:
+
+    - selects the slate rows once
+    - builds one scaled (players x features) matrix over the union of the frame's model features
+    - multiplies it by the stacked (features x targets) coefficients of those models
+
+and writes the products straight into one preallocated wide (player-weeks x stats) array, keyed
+by (player_id, season, week) codes shared across frames. Fantasy points are one more product
+with the point weights.
+"""
+import numpy as np
+import pandas as pd
+
+import utils
+
+from .feature_matrix import build_feature_matrix
+from .model_registry import ModelRegistry, stack_models
+from .projection_service import META_COLS, POINT_WEIGHTS
+
+__all__ = ["score_slate"]
+
+_KEYS = ["player_id", "season", "week"]
+
+
+def score_slate(
+    target_data_struct: dict[str, pd.DataFrame],
+    registry: ModelRegistry,
+    season: int | None = None,
+    week: int | None = None,
+) -> pd.DataFrame:
+    """Projects every registered target for every player-week of a slate.
+
+    Args:
+        target_data_struct: feature store as returned by `run_pipeline`.
+        registry: models with stored scaler statistics (see pipelines.model_registry).
+        season, week: restrict to one slate (None scores every row).
+
+    Returns one row per (player_id, season, week) in first-appearance order with the player
+    meta columns, a `Projected <stat>` column for every stat of the point system (0 where no
+    model applies) and `Projected Points`.
+    """
+    targets_by_frame: dict[int, list[str]] = {}
+    for target, df in target_data_struct.items():
+        if target != "def" and target in registry:
+            targets_by_frame.setdefault(id(df), []).append(target)
+
+    frames: list[tuple[pd.DataFrame, list[str]]] = []
+    for targets in targets_by_frame.values():
+        df = target_data_struct[targets[0]]
+        mask = np.ones(len(df), dtype=bool)
+        if season is not None:
+            mask &= (df["season"] == season).to_numpy()
+        if week is not None:
+            mask &= (df["week"] == week).to_numpy()
+        frames.append((df.loc[mask], targets))
+
+    meta_cols = [c for c in META_COLS if any(c in df.columns for df, _ in frames)]
+    rows = pd.concat([df.reindex(columns=_KEYS + meta_cols) for df, _ in frames], ignore_index=True) if frames \
+        else pd.DataFrame(columns=_KEYS + meta_cols)
+    codes = utils.group_codes(rows, _KEYS)
+    _, first = np.unique(codes, return_index=True)
+    first = first[codes[first] >= 0]
+
+    stats = list(POINT_WEIGHTS)
+    stat_index = {stat: j for j, stat in enumerate(stats)}
+    projections = np.zeros((first.shape[0], len(stats)))
+
+    offset = 0
+    for df, targets in frames:
+        frame_codes = codes[offset:offset + len(df)]
+        offset += len(df)
+        if len(df) == 0:
+            continue
+        # One row per player-week (the first, as in the projection index)
+        _, keep = np.unique(frame_codes, return_index=True)
+        keep = keep[frame_codes[keep] >= 0]
+
+        models = [registry[t] for t in targets]
+        cols, coef, intercept, scaler = stack_models(models)
+        if scaler is None:
+            raise ValueError("Slate scoring needs models saved with scaler statistics")
+        X = build_feature_matrix(df.iloc[keep], cols, scaler=scaler)
+        projections[np.ix_(frame_codes[keep], [stat_index[utils.TARGET_TRANSLATION[t]] for t in targets])] = (
+            X @ coef + intercept
+        )
+
+    slate = rows.iloc[first].reset_index(drop=True)
+    slate[[f"Projected {stat}" for stat in stats]] = projections
+    slate["Projected Points"] = projections @ np.array([POINT_WEIGHTS[s] for s in stats])
+    return slate
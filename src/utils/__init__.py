@@ -3,6 +3,10 @@ from .fuzzy import FuzzyNameSearcher, normalize
 from .Scrapers import PFRScraper
 from .data_descriptions.stats_categories import STATISTICAL_COLUMNS_BY_CATEGORY, TARGETS_TO_INPUTS, REQUIRED_INJURY_ENCODED_COLS, TARGET_TRANSLATION
 from .yahoo_helpers import get_all_players, get_player_details, get_player_stats
+from .moments import Moments
+from .linear_solver import NormalEquations, fit_least_squares
+from .joins import join_keys, left_join_indexer, left_join
+from .window_features import group_codes, grouped_rolling_mean, grouped_expanding_moments, grouped_expanding_mean_std, grouped_window_features
 
 __all__ = ["safe_json_load", 
            "validate_date", 
@@ -19,4 +23,15 @@ __all__ = ["safe_json_load",
            "get_all_players",
            "get_player_details",
            "get_player_stats",
-           "compile_player_points_and_projections"]
\ No newline at end of file
+           "compile_player_points_and_projections",
+           "group_codes",
+           "grouped_rolling_mean",
+           "grouped_expanding_moments",
+           "grouped_expanding_mean_std",
+           "grouped_window_features",
+           "join_keys",
+           "left_join_indexer",
+           "left_join",
+           "Moments",
+           "NormalEquations",
+           "fit_least_squares"]
\ No newline at end of file
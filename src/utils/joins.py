@@ -0,0 +1,157 @@
+"""Left joins on composite keys encoded as one int64 per row.
+
+The pipelines join player-weeks to injuries and depth charts on (player_id, season, week)
+and to the opponent's team-week on (opponent_team, season, week) -> (team, season, week).
+`DataFrame.merge` hashes the key tuples and keeps both sides' key columns (`team_x`,
+`team_y`). `left_join` instead:
+
+  1. Encodes every key column as dense integer codes shared by both sides: integers by
+     offset from the smallest value (direct address), categoricals with the same dtype by
+     their codes, anything else with one `pd.factorize` over both sides. The codes are
+     combined into one int64 key per row (mixed radix, re-densified if it would overflow).
+  2. Looks the left keys up in the right ones: with a direct-address table when the right
+     keys are unique and the key space is small (e.g. team-weeks), otherwise in the sorted
+     right keys with `searchsorted`.
+  3. Gathers the rows once and keeps only the left key columns.
+
+Rows, row order and values match `left.merge(right, how="left", ...)` (a left row matching
+several right rows is repeated, in the right's row order), except that missing keys never
+match and the right key columns are dropped.
+"""
+import numpy as np
+import pandas as pd
+
+__all__ = ["join_keys", "left_join_indexer", "left_join"]
+
+# Largest key space looked up directly: slots per row of both sides, at least _MIN_DIRECT_SLOTS
+_DIRECT_SLOTS_PER_ROW = 4
+_MIN_DIRECT_SLOTS = 1 << 16
+
+
+def _column_codes(left: pd.Series, right: pd.Series) -> tuple[np.ndarray, np.ndarray, int]:
+    """Codes (-1 = missing) of one key column on both sides, and how many codes there are."""
+    if isinstance(left.dtype, pd.CategoricalDtype) and left.dtype == right.dtype:
+        n = len(left.dtype.categories)
+        return left.cat.codes.to_numpy(np.int64), right.cat.codes.to_numpy(np.int64), n
+
+    if (isinstance(left.dtype, np.dtype) and isinstance(right.dtype, np.dtype)
+            and left.dtype.kind in "iu" and right.dtype.kind in "iu"):
+        lv, rv = left.to_numpy(np.int64), right.to_numpy(np.int64)
+        if len(lv) and len(rv):
+            low = min(lv.min(), rv.min())
+            return lv - low, rv - low, int(max(lv.max(), rv.max()) - low) + 1
+
+    values = pd.concat([left.astype(object), right.astype(object)], ignore_index=True)
+    codes, uniques = pd.factorize(values)
+    return codes[:len(left)].astype(np.int64), codes[len(left):].astype(np.int64), len(uniques)
+
+
+def join_keys(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    left_on: list[str],
+    right_on: list[str] | None = None,
+) -> tuple[np.ndarray, np.ndarray, int]:
+    """One int64 key per row of `left` and `right` (-1 where a key column is missing), equal
+    exactly when all key columns are equal, and the size of the key space."""
+    right_on = left_on if right_on is None else right_on
+    if len(left_on) != len(right_on):
+        raise ValueError("left_on and right_on must have the same length")
+
+    left_keys = np.zeros(len(left), dtype=np.int64)
+    right_keys = np.zeros(len(right), dtype=np.int64)
+    space = 1
+    for lcol, rcol in zip(left_on, right_on):
+        lcodes, rcodes, n = _column_codes(left[lcol], right[rcol])
+        if space * n >= 2**62:
+            # Re-densify the keys so far before they overflow
+            codes, uniques = pd.factorize(np.concatenate([left_keys, right_keys]))
+            left_keys, right_keys = codes[:len(left)].astype(np.int64), codes[len(left):].astype(np.int64)
+            space = len(uniques)
+        left_keys = np.where((left_keys < 0) | (lcodes < 0), -1, left_keys * n + lcodes)
+        right_keys = np.where((right_keys < 0) | (rcodes < 0), -1, right_keys * n + rcodes)
+        space *= n
+    return left_keys, right_keys, space
+
+
+def left_join_indexer(
+    left_keys: np.ndarray,
+    right_keys: np.ndarray,
+    space: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Row positions (left, right; right -1 = no match) of the left join of two key arrays.
+
+    Negative keys never match. `space` (keys are < space) enables direct-address lookups.
+    """
+    left_keys = np.asarray(left_keys, dtype=np.int64)
+    right_keys = np.asarray(right_keys, dtype=np.int64)
+    valid = right_keys >= 0
+    right_rows = np.flatnonzero(valid)
+    keys = right_keys[valid]
+
+    max_direct = max(_DIRECT_SLOTS_PER_ROW * (len(left_keys) + len(keys)), _MIN_DIRECT_SLOTS)
+    if space is not None and space <= max_direct:
+        slots = np.full(space, -1, dtype=np.int64)
+        slots[keys] = right_rows
+        if np.count_nonzero(slots >= 0) == len(keys):  # unique right keys
+            found = np.full(len(left_keys), -1, dtype=np.int64)
+            ok = left_keys >= 0
+            found[ok] = slots[left_keys[ok]]
+            return np.arange(len(left_keys)), found
+
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    # Searching sorted left keys walks the right keys in order (far fewer cache misses)
+    left_order = np.argsort(left_keys)
+    sorted_left = left_keys[left_order]
+    first = np.empty(len(left_keys), dtype=np.int64)
+    counts = np.empty(len(left_keys), dtype=np.int64)
+    first[left_order] = np.searchsorted(sorted_keys, sorted_left, side="left")
+    counts[left_order] = np.searchsorted(sorted_keys, sorted_left, side="right")
+    counts -= first
+    counts[left_keys < 0] = 0
+
+    repeats = np.maximum(counts, 1)
+    left_idx = np.repeat(np.arange(len(left_keys)), repeats)
+    # Position of every output row among its left row's matches
+    offsets = np.arange(len(left_idx)) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+    matched = np.repeat(counts > 0, repeats)
+    right_idx = np.full(len(left_idx), -1, dtype=np.int64)
+    right_idx[matched] = right_rows[order[np.repeat(first, repeats)[matched] + offsets[matched]]]
+    return left_idx, right_idx
+
+
+def _values(col: pd.Series):
+    return col.to_numpy() if isinstance(col.dtype, np.dtype) else col.array
+
+
+def left_join(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    left_on: list[str],
+    right_on: list[str] | None = None,
+    suffixes: tuple[str, str] = ("_x", "_y"),
+) -> pd.DataFrame:
+    """`left.merge(right, how="left", left_on=..., right_on=...)` on int64 keys, without the
+    right key columns (see module docstring). Other shared columns get `suffixes`."""
+    right_on = left_on if right_on is None else right_on
+    left_keys, right_keys, space = join_keys(left, right, left_on, right_on)
+    left_idx, right_idx = left_join_indexer(left_keys, right_keys, space)
+
+    right_cols = [c for c in right.columns if c not in right_on]
+    shared = set(right_cols) & set(left.columns)
+    left_names = {c: f"{c}{suffixes[0]}" for c in shared}
+
+    if len(left_idx) == len(left):
+        out = left.reset_index(drop=True)  # every left row exactly once, in order
+    else:
+        out = left.take(left_idx).reset_index(drop=True)
+    out = out.rename(columns=left_names) if left_names else out
+
+    fill = bool((right_idx < 0).any())
+    gathered = {
+        f"{c}{suffixes[1]}" if c in shared else c:
+            pd.api.extensions.take(_values(right[c]), right_idx, allow_fill=fill)
+        for c in right_cols
+    }
+    return pd.concat([out, pd.DataFrame(gathered, index=out.index)], axis=1)
@@ -0,0 +1,103 @@
+"""Closed-form (ridge) least squares for many targets over shared design matrices.
+
+`NormalEquations` forms the centered Gram matrix X^T W X of a design once. Any subset of its
+columns can then be solved for any number of right-hand sides: the Gram matrix of a column
+subset is a sub-block of the full one, and targets sharing a column subset share a single
+Cholesky factorization. Targets with different feature sets over the same rows therefore cost
+one Gram product in total instead of one full fit each.
+
+Columns are equilibrated (unit diagonal) before factoring. Zero-variance columns get a zero
+coefficient, and designs that are rank deficient or too ill-conditioned for Cholesky fall back
+to a pseudo-inverse, which gives the minimum-norm solution, as scikit-learn's LinearRegression
+does.
+"""
+import numpy as np
+from scipy import linalg
+
+__all__ = ["NormalEquations", "fit_least_squares"]
+
+# Smallest acceptable squared pivot ratio of the equilibrated Cholesky factor (~1 / condition)
+_MIN_PIVOT_RATIO = 1e-10
+
+
+class NormalEquations:
+    """Centered, optionally weighted normal equations of one design matrix.
+
+    Args:
+        X: design matrix, (rows, features).
+        sample_weight: optional non-negative weight per row.
+        copy: when False, a float64 X is centered in place.
+    """
+
+    def __init__(self, X: np.ndarray, sample_weight: np.ndarray | None = None, copy: bool = True):
+        X = np.array(X, dtype=np.float64) if copy else np.asarray(X, dtype=np.float64)
+        self.n_features = X.shape[1]
+        self.weight = None if sample_weight is None else np.asarray(sample_weight, dtype=np.float64)
+        self.weight_sum = float(X.shape[0] if self.weight is None else self.weight.sum())
+        if self.weight_sum <= 0:
+            raise ValueError("NormalEquations needs at least one row with positive weight")
+
+        self.x_mean = self._weighted_mean(X)
+        X -= self.x_mean
+        self.centered = X
+        self.gram = X.T @ (X if self.weight is None else X * self.weight[:, None])
+
+    def _weighted_mean(self, values: np.ndarray) -> np.ndarray:
+        if self.weight is None:
+            return values.mean(axis=0)
+        return self.weight @ values / self.weight_sum
+
+    def solve(
+        self,
+        Y: np.ndarray,
+        cols: list[int] | np.ndarray | None = None,
+        alpha: float = 0.0,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Coefficients (targets, len(cols)) and intercepts (targets,) for the columns `cols`.
+
+        `Y` holds one target per column (rows, targets), aligned with the design's rows.
+        `alpha` is the ridge penalty on the coefficients (the intercept is not penalized).
+        """
+        Y = np.asarray(Y, dtype=np.float64).reshape(self.centered.shape[0], -1)
+        cols = np.arange(self.n_features) if cols is None else np.asarray(cols, dtype=np.intp)
+        y_mean = self._weighted_mean(Y)
+
+        weighted = Y - y_mean if self.weight is None else (Y - y_mean) * self.weight[:, None]
+        rhs = self.centered[:, cols].T @ weighted
+        gram = self.gram[np.ix_(cols, cols)]
+
+        coef = np.zeros((cols.shape[0], Y.shape[1]))
+        diag = np.diag(gram).copy()
+        active = diag > np.finfo(np.float64).eps * max(diag.max(initial=0.0), 1.0)
+        if active.any():
+            coef[active] = _solve_equilibrated(gram[np.ix_(active, active)], rhs[active], diag[active], alpha)
+
+        intercept = y_mean - self.x_mean[cols] @ coef
+        return coef.T, intercept
+
+
+def _solve_equilibrated(gram: np.ndarray, rhs: np.ndarray, diag: np.ndarray, alpha: float) -> np.ndarray:
+    """Solves (gram + alpha I) b = rhs after scaling the system to unit diagonal."""
+    d = np.sqrt(diag)
+    scaled = gram / np.outer(d, d)
+    scaled[np.diag_indices_from(scaled)] += alpha / diag
+    scaled_rhs = rhs / d[:, None]
+
+    try:
+        factor = linalg.cho_factor(scaled, lower=True, check_finite=False)
+        pivots = np.diag(factor[0])
+        if pivots.min() ** 2 >= _MIN_PIVOT_RATIO * pivots.max() ** 2:
+            return linalg.cho_solve(factor, scaled_rhs, check_finite=False) / d[:, None]
+    except linalg.LinAlgError:
+        pass
+    return linalg.pinvh(scaled) @ scaled_rhs / d[:, None]
+
+
+def fit_least_squares(
+    X: np.ndarray,
+    Y: np.ndarray,
+    sample_weight: np.ndarray | None = None,
+    alpha: float = 0.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """One-shot fit of every column of `Y` on all columns of `X`: (coef (targets, features), intercept)."""
+    return NormalEquations(X, sample_weight).solve(Y, alpha=alpha)
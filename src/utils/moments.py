@@ -0,0 +1,96 @@
+"""Mergeable moment accumulators (count, mean, M2) for many groups and columns at once.
+
+Accumulating mean and variance through Welford's update / Chan et al.'s pairwise combine
+keeps the variance numerically stable (no sum-of-squares cancellation) and makes partial
+results combinable: moments built over separate partitions (season chunks, processes,
+saved in-season state) merge into exactly the moments of the union.
+
+All arrays share one shape, typically (groups, columns); NaN observations are skipped.
+"""
+import numpy as np
+
+__all__ = ["Moments"]
+
+
+class Moments:
+    """Count, mean and sum of squared deviations (M2) held as parallel float64 arrays."""
+
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self, count: np.ndarray, mean: np.ndarray, m2: np.ndarray):
+        self.count = np.asarray(count, dtype=np.float64)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.m2 = np.asarray(m2, dtype=np.float64)
+
+    @classmethod
+    def zeros(cls, shape) -> "Moments":
+        return cls(np.zeros(shape), np.zeros(shape), np.zeros(shape))
+
+    @classmethod
+    def from_observations(cls, values: np.ndarray) -> "Moments":
+        """Element-wise moments of single observations (count 0 where the value is NaN)."""
+        valid = ~np.isnan(values)
+        return cls(valid, np.where(valid, values, 0.0), np.zeros(values.shape))
+
+    @classmethod
+    def from_values(cls, values: np.ndarray, groups: np.ndarray, n_groups: int) -> "Moments":
+        """Moments of the rows of `values` (rows, columns) per group id in `groups` (two-pass)."""
+        values = np.asarray(values, dtype=np.float64).reshape(len(groups), -1)
+        valid = ~np.isnan(values)
+        shape = (n_groups, values.shape[1])
+
+        count = np.zeros(shape)
+        total = np.zeros(shape)
+        np.add.at(count, groups, valid)
+        np.add.at(total, groups, np.where(valid, values, 0.0))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(count > 0, total / count, 0.0)
+
+        deviation = np.where(valid, values - mean[groups], 0.0)
+        m2 = np.zeros(shape)
+        np.add.at(m2, groups, deviation * deviation)
+        return cls(count, mean, m2)
+
+    def __len__(self) -> int:
+        return self.count.shape[0]
+
+    def __getitem__(self, idx) -> "Moments":
+        return Moments(self.count[idx], self.mean[idx], self.m2[idx])
+
+    def __setitem__(self, idx, other: "Moments"):
+        self.count[idx] = other.count
+        self.mean[idx] = other.mean
+        self.m2[idx] = other.m2
+
+    def copy(self) -> "Moments":
+        return Moments(self.count.copy(), self.mean.copy(), self.m2.copy())
+
+    def merge(self, other: "Moments") -> "Moments":
+        """Moments of the union of both partitions (Chan et al. pairwise combine)."""
+        n = self.count + other.count
+        delta = other.mean - self.mean
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weight = np.where(n > 0, other.count / n, 0.0)
+        mean = self.mean + delta * weight
+        m2 = self.m2 + other.m2 + delta * delta * self.count * weight
+        return Moments(n, mean, m2)
+
+    def update(self, groups: np.ndarray, values: np.ndarray):
+        """Folds rows of `values` into the groups listed in `groups` (repeats allowed), in place."""
+        unique, inverse = np.unique(groups, return_inverse=True)
+        self[unique] = self[unique].merge(Moments.from_values(values, inverse.ravel(), unique.shape[0]))
+
+    def finalize(self, ddof: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """Mean (NaN without observations) and standard deviation (NaN with <= ddof observations)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(self.count > 0, self.mean, np.nan)
+            var = np.where(self.count > ddof, self.m2 / (self.count - ddof), np.nan)
+        return mean, np.sqrt(np.clip(var, 0.0, None))
+
+    @staticmethod
+    def concatenate(parts: list["Moments"]) -> "Moments":
+        return Moments(
+            np.concatenate([p.count for p in parts]),
+            np.concatenate([p.mean for p in parts]),
+            np.concatenate([p.m2 for p in parts]),
+        )
@@ -0,0 +1,276 @@
+"""Vectorized grouped window statistics used by the feature engineering pipelines.
+
+The pipelines compute, per entity (player or team), a lagged rolling mean and lagged
+expanding mean / standard deviation for many stat columns at once. Doing that with
+`groupby(...).transform(lambda ...)` calls back into Python for every group and every
+column. The kernels here instead:
+
+  1. Assign each row an integer group code and stable-sort the codes so every group is a
+     contiguous block (row order inside a group is preserved).
+  2. Compute all columns at once, one block position at a time across every block: per-block
+     cumulative sums for the rolling mean, Welford moment updates (utils.moments) for the
+     expanding mean / std.
+  3. Apply the lag (`shift`) with group-offset indexing and scatter back to row order.
+
+Expanding moments can also be built per chunk of rows (e.g. per season, in parallel) and
+combined exactly afterwards, since each chunk's moments merge into its successors'.
+
+Results match pandas' `rolling(...).mean()`, `expanding().mean()` and `expanding().std()`
+(NaNs are skipped and do not count toward `min_periods`).
+"""
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from .moments import Moments
+
+__all__ = [
+    "group_codes",
+    "grouped_rolling_mean",
+    "grouped_expanding_moments",
+    "grouped_expanding_mean_std",
+    "grouped_window_features",
+]
+
+
+def group_codes(df: pd.DataFrame, groupby: list[str]) -> np.ndarray:
+    """Integer group code per row of `df`. Rows with a missing key get -1 (pandas drops them)."""
+    codes = df.groupby(groupby, sort=False, observed=True, dropna=True).ngroup()
+    return codes.fillna(-1).to_numpy(dtype=np.int64)
+
+
+class _GroupLayout:
+    """Contiguous-block view of the rows that belong to a group (code >= 0)."""
+
+    def __init__(self, codes: np.ndarray):
+        codes = np.asarray(codes, dtype=np.int64)
+        self.n_rows = codes.shape[0]
+        order = np.argsort(codes, kind="stable")
+        order = order[codes[order] >= 0]
+        sorted_codes = codes[order]
+
+        is_start = np.ones(sorted_codes.shape[0], dtype=bool)
+        is_start[1:] = sorted_codes[1:] != sorted_codes[:-1]
+        starts = np.flatnonzero(is_start)
+
+        self.order = order
+        self.starts = starts
+        self.lengths = np.diff(np.append(starts, sorted_codes.shape[0]))
+        # For every sorted row: where its block starts and its position within the block
+        self.row_start = np.repeat(starts, self.lengths)
+        self.position = np.arange(sorted_codes.shape[0]) - self.row_start
+        self.row_length = np.repeat(self.lengths, self.lengths)
+        # Sorted rows bucketed by their position within the block (bucket p holds every block's p-th row)
+        by_position = np.argsort(self.position, kind="stable")
+        bounds = np.searchsorted(self.position[by_position], np.arange(self.lengths.max(initial=0) + 1))
+        self.rows_by_position = [by_position[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+
+    def gather(self, values: np.ndarray) -> np.ndarray:
+        return values[self.order]
+
+    def shift(self, values: np.ndarray, shift: int) -> np.ndarray:
+        """Lag sorted `values` by `shift` rows inside each block (NaN where out of the block)."""
+        if shift == 0:
+            return values
+        target = self.position - shift
+        valid = (target >= 0) & (target < self.row_length)
+        out = np.full_like(values, np.nan)
+        out[valid] = values[(self.row_start + target)[valid]]
+        return out
+
+    def scatter(self, sorted_values: np.ndarray) -> np.ndarray:
+        """Place sorted values back in original row order; ungrouped rows are NaN."""
+        out = np.full((self.n_rows,) + sorted_values.shape[1:], np.nan)
+        out[self.order] = sorted_values
+        return out
+
+
+def _as_float_matrix(values) -> np.ndarray:
+    if isinstance(values, (pd.DataFrame, pd.Series)):
+        values = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    values = np.asarray(values, dtype=np.float64)
+    return values.reshape(values.shape[0], -1)
+
+
+def _block_cumsum(values: np.ndarray, layout: _GroupLayout) -> np.ndarray:
+    """Cumulative sums that restart at every block.
+
+    Accumulates one block position at a time across all blocks, so each running total only
+    ever holds its own block's values (a global cumsum would carry the magnitude of every
+    preceding group into the round-off of the differences).
+    """
+    out = np.empty_like(values)
+    for p, rows in enumerate(layout.rows_by_position):
+        out[rows] = values[rows] if p == 0 else out[rows - 1] + values[rows]
+    return out
+
+
+def _window_sum(cs: np.ndarray, layout: _GroupLayout, window: int) -> np.ndarray:
+    """Sum of the last `window` rows in each block from block cumulative sums `cs`."""
+    out = cs.copy()
+    drop = layout.position >= window
+    out[drop] -= cs[np.flatnonzero(drop) - window]
+    return out
+
+
+def _rolling_mean_sorted(values, layout: _GroupLayout, window: int, min_periods: int) -> np.ndarray:
+    valid = ~np.isnan(values)
+    window_sum = _window_sum(_block_cumsum(np.where(valid, values, 0.0), layout), layout, window)
+    window_count = _window_sum(_block_cumsum(valid.astype(np.float64), layout), layout, window)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = window_sum / window_count
+    mean[window_count < max(min_periods, 1)] = np.nan
+    return mean
+
+
+def _prefix_moments_sorted(values: np.ndarray, layout: _GroupLayout) -> Moments:
+    """Inclusive running moments of every row within its block (Welford, one position at a time)."""
+    prefix = Moments.from_observations(values)
+    for rows in layout.rows_by_position[1:]:
+        prefix[rows] = prefix[rows - 1].merge(prefix[rows])
+    return prefix
+
+
+def _chunk_prefix_moments(chunk: tuple[np.ndarray, np.ndarray]) -> tuple[Moments, np.ndarray, Moments]:
+    """Running moments of one chunk's rows (chunk row order) plus each group's chunk total."""
+    values, codes = chunk
+    layout = _GroupLayout(codes)
+    prefix = _prefix_moments_sorted(layout.gather(values), layout)
+    ends = layout.starts + layout.lengths - 1
+
+    rows = Moments.zeros(values.shape)
+    rows[layout.order] = prefix
+    return rows, codes[layout.order[ends]], prefix[ends]
+
+
+def _chunked_prefix_moments(values: np.ndarray, codes: np.ndarray, chunks: np.ndarray, map_fn: Callable) -> Moments:
+    """Running moments per row (original order) computed chunk by chunk.
+
+    Chunks are independent, so `map_fn` may run them in parallel (e.g. `executor.map`). Each
+    chunk's rows are then merged with the totals of every earlier chunk of their group, which
+    yields exactly the moments of an uninterrupted pass. Chunks are combined in sorted order.
+    """
+    labels = np.unique(chunks)
+    members = [np.flatnonzero((chunks == label) & (codes >= 0)) for label in labels]
+    results = map_fn(_chunk_prefix_moments, [(values[rows], codes[rows]) for rows in members])
+
+    out = Moments.zeros(values.shape)
+    carry = Moments.zeros((int(codes.max(initial=-1)) + 1, values.shape[1]))
+    for rows, (chunk_rows, block_codes, block_totals) in zip(members, results):
+        out[rows] = carry[codes[rows]].merge(chunk_rows)
+        carry[block_codes] = carry[block_codes].merge(block_totals)
+    return out
+
+
+def _expanding_mean_std_sorted(values, layout: _GroupLayout, ddof: int) -> tuple[np.ndarray, np.ndarray]:
+    return _prefix_moments_sorted(values, layout).finalize(ddof)
+
+
+def grouped_rolling_mean(
+    values,
+    codes: np.ndarray,
+    window: int,
+    min_periods: int = 1,
+    shift: int = 1,
+) -> np.ndarray:
+    """Rolling mean over the last `window` rows of each group, lagged by `shift` rows.
+
+    Equivalent to `groupby(codes).transform(lambda x: x.rolling(window, min_periods).mean().shift(shift))`
+    for every column of `values` at once. Returns a float64 array shaped (rows, columns).
+    """
+    layout = _GroupLayout(codes)
+    sorted_values = layout.gather(_as_float_matrix(values))
+    mean = _rolling_mean_sorted(sorted_values, layout, window, min_periods)
+    return layout.scatter(layout.shift(mean, shift))
+
+
+def grouped_expanding_moments(
+    values,
+    codes: np.ndarray,
+    chunks: np.ndarray | None = None,
+    map_fn: Callable = map,
+) -> Moments:
+    """Inclusive running moments (count, mean, M2) of every row within its group, in row order.
+
+    With `chunks` (a label per row, e.g. the season) the moments are built per chunk through
+    `map_fn` and combined exactly; rows must be in time order inside every chunk and chunk
+    labels must sort in time order.
+    """
+    values = _as_float_matrix(values)
+    codes = np.asarray(codes, dtype=np.int64)
+    if chunks is not None:
+        return _chunked_prefix_moments(values, codes, np.asarray(chunks), map_fn)
+    layout = _GroupLayout(codes)
+    out = Moments.zeros(values.shape)
+    out[layout.order] = _prefix_moments_sorted(layout.gather(values), layout)
+    return out
+
+
+def grouped_expanding_mean_std(
+    values,
+    codes: np.ndarray,
+    shift: int = 1,
+    ddof: int = 1,
+    chunks: np.ndarray | None = None,
+    map_fn: Callable = map,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Expanding mean and standard deviation within each group, lagged by `shift` rows.
+
+    Equivalent to `expanding().mean().shift(shift)` and `expanding().std(ddof).shift(shift)`
+    per group, computed for every column of `values` in a single pass (or per chunk, see
+    `grouped_expanding_moments`).
+    """
+    layout = _GroupLayout(codes)
+    if chunks is None:
+        mean, std = _expanding_mean_std_sorted(layout.gather(_as_float_matrix(values)), layout, ddof)
+    else:
+        mean, std = layout.gather(grouped_expanding_moments(values, codes, chunks, map_fn)).finalize(ddof)
+    return layout.scatter(layout.shift(mean, shift)), layout.scatter(layout.shift(std, shift))
+
+
+def grouped_window_features(
+    df: pd.DataFrame,
+    cols: list[str],
+    groupby: list[str],
+    rolling_period: int | None = None,
+    min_periods: int = 1,
+    shift: int = 1,
+    cumulative: bool = True,
+    prefix: str = "",
+    chunk_by: str | None = None,
+    map_fn: Callable = map,
+) -> pd.DataFrame:
+    """Lagged rolling and cumulative features for `cols`, grouped by `groupby`, in one pass.
+
+    Rows are taken in the order they appear in `df` (sort it first). Column names follow the
+    pipeline convention:
+        - `{c}_roll{rolling_period}_shift` when `rolling_period` is given
+        - `{prefix}{c}_cum_avg` and `{prefix}{c}_cum_std` when `cumulative` is True
+    With `chunk_by` (e.g. "season") the cumulative moments are built per chunk through `map_fn`
+    and merged exactly (see `grouped_expanding_moments`).
+    Returns a frame indexed like `df` holding only the new columns.
+    """
+    codes = group_codes(df, groupby)
+    layout = _GroupLayout(codes)
+    values = _as_float_matrix(df[cols])
+    sorted_values = layout.gather(values)
+
+    blocks: list[np.ndarray] = []
+    names: list[str] = []
+    if rolling_period is not None:
+        blocks.append(_rolling_mean_sorted(sorted_values, layout, rolling_period, min_periods))
+        names += [f"{c}_roll{rolling_period}_shift" for c in cols]
+    if cumulative:
+        if chunk_by is None:
+            blocks.extend(_expanding_mean_std_sorted(sorted_values, layout, ddof=1))
+        else:
+            moments = grouped_expanding_moments(values, codes, df[chunk_by].to_numpy(), map_fn)
+            blocks.extend(layout.gather(moments).finalize(ddof=1))
+        names += [f"{prefix}{c}_cum_avg" for c in cols] + [f"{prefix}{c}_cum_std" for c in cols]
+
+    if not blocks:
+        return pd.DataFrame(index=df.index)
+    features = layout.scatter(layout.shift(np.hstack(blocks), shift))
+    return pd.DataFrame(features, index=df.index, columns=names)
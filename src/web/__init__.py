@@ -0,0 +1,11 @@
+# Side effect free dashboard components. The dashboards themselves
+# (e.g. statistical_overview_dashboard) load data on import and are run explicitly.
+from .table_style import PALETTE, add_color_columns, cell_styles, color_indices, zscores_by_group
+
+__all__ = [
+    "PALETTE",
+    "add_color_columns",
+    "cell_styles",
+    "color_indices",
+    "zscores_by_group",
+]
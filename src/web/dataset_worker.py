@@ -0,0 +1,159 @@
+"""Background builds and hot swapping of the dashboard dataset.
+
+Building a dashboard dataset (download -> pipeline -> scoring -> assembly -> z-scores) takes
+far longer than any request. `DatasetWorker` runs those builds on a daemon thread, off the
+request path:
+
+    - `build(report)` does the work, calling `report(stage)` as it enters each stage, and
+      returns `(key, frame)` for a new dataset or None when the served one is current
+    - `prepare(key, frame)` turns the frame into what the server reads (e.g. with its query
+      index), still on the worker thread
+    - the result replaces the served `Dataset` in one reference assignment, and `version`
+      is bumped so sessions can poll for the swap
+
+Sessions keep using the dataset they hold until they pick up the new one; nothing is ever
+mutated in place. `status()` reports the running stage, elapsed time and the timings of the
+last build for the UI.
+"""
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import pandas as pd
+
+from .frame_cache import CacheKey
+
+__all__ = ["Dataset", "BuildStatus", "DatasetWorker"]
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """One served dataset version."""
+
+    key: CacheKey
+    frame: pd.DataFrame
+    index: Any = None  # whatever `prepare` built for serving (e.g. a TableQueryEngine)
+    built_at: float = field(default_factory=time.time)
+
+
+@dataclass(frozen=True)
+class BuildStatus:
+    state: str  # "idle", "building" or "failed"
+    stage: str | None = None
+    elapsed: float = 0.0  # seconds into the running build
+    last_timings: dict[str, float] = field(default_factory=dict)  # stage -> seconds
+    error: str | None = None
+
+    def describe(self) -> str:
+        if self.state == "building":
+            return f"Building dataset: {self.stage} ({self.elapsed:.0f} s)"
+        if self.state == "failed":
+            return f"Last build failed: {self.error}"
+        if self.last_timings:
+            stages = ", ".join(f"{stage} {seconds:.1f} s" for stage, seconds in self.last_timings.items())
+            return f"Last build {sum(self.last_timings.values()):.1f} s ({stages})"
+        return "Up to date"
+
+
+class DatasetWorker:
+    """Builds datasets on a background thread and swaps them in atomically."""
+
+    def __init__(
+        self,
+        build: Callable[[Callable[[str], None]], tuple[CacheKey, pd.DataFrame] | None],
+        prepare: Callable[[CacheKey, pd.DataFrame], Any] | None = None,
+        interval: float | None = None,
+    ):
+        """
+        Args:
+            build: builds a dataset (see module docstring).
+            prepare: builds the serving index of a new dataset.
+            interval: seconds between automatic rebuild checks (None: only on request).
+        """
+        self._build = build
+        self._prepare = prepare
+        self._interval = interval
+        self._current: Dataset | None = None
+        self._version = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._state = "idle"
+        self._stage: str | None = None
+        self._started = 0.0
+        self._stage_started = 0.0
+        self._timings: dict[str, float] = {}
+        self._last_timings: dict[str, float] = {}
+        self._error: str | None = None
+
+    @property
+    def version(self) -> int:
+        """Bumped on every swap."""
+        return self._version
+
+    def current(self) -> Dataset | None:
+        return self._current
+
+    def publish(self, key: CacheKey, frame: pd.DataFrame) -> Dataset:
+        """Prepares `frame` and makes it the served dataset."""
+        dataset = Dataset(key, frame, self._prepare(key, frame) if self._prepare else None)
+        with self._lock:
+            self._current = dataset
+            self._version += 1
+        return dataset
+
+    def start(self, build_now: bool = True):
+        """Starts the worker thread (once); `build_now` requests a build straight away."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="dataset-worker", daemon=True)
+            self._thread.start()
+        if build_now:
+            self.request_build()
+
+    def request_build(self):
+        """Asks for a build; requests made while one runs coalesce into one follow-up build."""
+        self._wake.set()
+
+    def status(self) -> BuildStatus:
+        with self._lock:
+            elapsed = time.perf_counter() - self._started if self._state == "building" else 0.0
+            return BuildStatus(self._state, self._stage, elapsed, dict(self._last_timings), self._error)
+
+    def _enter(self, stage: str | None):
+        """Closes the running stage's timing and starts `stage` (None: no stage)."""
+        now = time.perf_counter()
+        with self._lock:
+            if self._stage is not None:
+                self._timings[self._stage] = now - self._stage_started
+            self._stage, self._stage_started = stage, now
+
+    def _run(self):
+        while True:
+            self._wake.wait(self._interval)
+            self._wake.clear()
+            self.build_once()
+
+    def build_once(self) -> bool:
+        """Runs one build on the calling thread; True if a new dataset was swapped in."""
+        with self._lock:
+            self._state, self._stage, self._error = "building", None, None
+            self._started = time.perf_counter()
+            self._timings = {}
+        try:
+            result = self._build(self._enter)
+            if result is not None:
+                self._enter("Indexing")
+                self.publish(*result)
+            self._enter(None)
+        except Exception as exc:  # keep serving the last good dataset
+            traceback.print_exc()
+            with self._lock:
+                self._state, self._stage, self._error = "failed", None, f"{type(exc).__name__}: {exc}"
+            return False
+        with self._lock:
+            self._state, self._stage = "idle", None
+            self._last_timings = dict(self._timings)
+        return result is not None
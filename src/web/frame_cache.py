@@ -0,0 +1,163 @@
+"""Versioned on-disk cache of the dashboard's combined frame.
+
+Each dataset is one uncompressed Arrow IPC file, so it is memory-mapped on load and keeps its
+dtypes (ints, uint8 color indices, strings). The file is keyed by a `CacheKey`:
+
+    - model version: which saved weights scored the projections (`weights_version`)
+    - data watermark: the latest (season, week) and row count of the loaded stats
+      (`data_watermark`)
+    - seasons shown
+
+The key is stored in the file's schema metadata, so `FrameCache.latest` can pick the newest
+usable dataset for a model version and seasons from the schemas alone. The dashboard serves
+that last good version at startup and rebuilds in the background when the data moves on.
+Without saved weights the model version is `UNVERSIONED`, which serves the newest dataset of
+any model version.
+Writes go to a temporary file that is renamed into place.
+
+Reads can project `columns`: only the buffers of those columns of the mapped file are ever
+touched, so a season can be opened with just the columns the table displays.
+"""
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass
+
+import pandas as pd
+import pyarrow as pa
+
+from pipelines.model_registry import load_registry
+
+__all__ = ["CacheKey", "FrameCache", "UNVERSIONED", "weights_version", "data_watermark"]
+
+_FORMAT_VERSION = 1
+_METADATA_KEY = b"dashboard_cache"
+# Model version when there are no saved weights
+UNVERSIONED = "unversioned"
+
+
+@dataclass(frozen=True)
+class CacheKey:
+    model_version: str
+    watermark: str
+    seasons: tuple[int, ...]
+
+    def filename(self) -> str:
+        seasons = "-".join(str(s) for s in self.seasons)
+        model = re.sub(r"[^A-Za-z0-9_.-]+", "_", self.model_version)
+        return f"combined_{model}_{seasons}_{self.watermark}.arrow"
+
+
+def weights_version(path: str | None) -> str:
+    """Identifies saved weights: a registry's version and fingerprint, or a digest of the
+    weight files' names, sizes and modification times (`UNVERSIONED` if `path` is unset or
+    does not exist)."""
+    if not path or not os.path.exists(path):
+        return UNVERSIONED
+    if os.path.isfile(path):
+        registry = load_registry(path)
+        return f"{registry.version}-{registry.fingerprint[:12]}"
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(path)):
+        stat = os.stat(os.path.join(path, name))
+        digest.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns};".encode("utf-8"))
+    return f"weights-{digest.hexdigest()[:12]}"
+
+
+def data_watermark(players_df: pd.DataFrame) -> str:
+    """Latest (season, week) in the weekly stats plus their row count, e.g. `2024w18-18981`."""
+    if players_df.empty:
+        return "empty"
+    season = int(players_df["season"].max())
+    week = int(players_df.loc[players_df["season"] == season, "week"].max())
+    return f"{season}w{week:02d}-{len(players_df)}"
+
+
+class FrameCache:
+    """Directory of versioned Arrow IPC datasets (see module docstring)."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def path(self, key: CacheKey) -> str:
+        return os.path.join(self.directory, key.filename())
+
+    def store(self, key: CacheKey, df: pd.DataFrame) -> str:
+        """Writes `df` for `key` (atomically) and returns its path."""
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_METADATA_KEY] = json.dumps({
+            "format": _FORMAT_VERSION,
+            "model_version": key.model_version,
+            "watermark": key.watermark,
+            "seasons": list(key.seasons),
+        }).encode("utf-8")
+        table = table.replace_schema_metadata(metadata)
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(key)
+        tmp_path = f"{path}.tmp"
+        with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, path)
+        return path
+
+    def load(self, key: CacheKey, columns: list[str] | None = None) -> pd.DataFrame | None:
+        """The dataset stored for `key` (only `columns`, where present), or None if there is no
+        readable one."""
+        path = self.path(key)
+        if not os.path.isfile(path) or self._read_key(path) != key:
+            return None
+        return self._read(path, columns)
+
+    def latest(
+        self,
+        model_version: str,
+        seasons: tuple[int, ...],
+        columns: list[str] | None = None,
+    ) -> tuple[CacheKey, pd.DataFrame] | None:
+        """The most recently written dataset for a model version (any for `UNVERSIONED`) and
+        seasons, if any."""
+        candidates = []
+        for name in os.listdir(self.directory) if os.path.isdir(self.directory) else []:
+            if not name.endswith(".arrow"):
+                continue
+            path = os.path.join(self.directory, name)
+            key = self._read_key(path)
+            if key is None or key.seasons != tuple(seasons):
+                continue
+            if model_version == UNVERSIONED or key.model_version == model_version:
+                candidates.append((os.stat(path).st_mtime_ns, path, key))
+        for _, path, key in sorted(candidates, key=lambda c: c[0], reverse=True):
+            df = self._read(path, columns)
+            if df is not None:
+                return key, df
+        return None
+
+    @staticmethod
+    def _read_key(path: str) -> CacheKey | None:
+        """The key in a file's schema metadata (None for unreadable or other-format files)."""
+        try:
+            with pa.memory_map(path, "r") as source:
+                schema = pa.ipc.open_file(source).schema
+        except (OSError, pa.ArrowInvalid):
+            return None
+        raw = (schema.metadata or {}).get(_METADATA_KEY)
+        if raw is None:
+            return None
+        meta = json.loads(raw)
+        if meta.get("format") != _FORMAT_VERSION:
+            return None
+        return CacheKey(meta["model_version"], meta["watermark"], tuple(meta["seasons"]))
+
+    @staticmethod
+    def _read(path: str, columns: list[str] | None = None) -> pd.DataFrame | None:
+        # The table's buffers keep the mapping alive; columns without nulls are not copied
+        try:
+            table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+        except (OSError, pa.ArrowInvalid):
+            return None
+        if columns is not None:
+            table = table.select([c for c in columns if c in table.column_names])
+        return table.to_pandas(split_blocks=True)
@@ -0,0 +1,45 @@
+"""Server-side pagination for dashboard tables.
+
+The table output renders one page of the filtered, sorted rows: the server works out the
+page's row range (`Page`) and styles and sends only those rows. The payload per render is
+bounded by the page size, whatever the filter selection.
+"""
+from dataclasses import dataclass
+
+__all__ = ["PAGE_SIZES", "Page"]
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+@dataclass(frozen=True)
+class Page:
+    """One page (1-based `number`) of `size` rows out of `total_rows`."""
+
+    number: int
+    size: int
+    total_rows: int
+
+    @classmethod
+    def of(cls, total_rows: int, number: int | None, size: int) -> "Page":
+        """The requested page, clamped to the pages that exist (always at least one)."""
+        size = max(int(size), 1)
+        n_pages = max(-(-total_rows // size), 1)
+        number = min(max(int(number or 1), 1), n_pages)
+        return cls(number, size, total_rows)
+
+    @property
+    def n_pages(self) -> int:
+        return max(-(-self.total_rows // self.size), 1)
+
+    @property
+    def start(self) -> int:
+        return min((self.number - 1) * self.size, self.total_rows)
+
+    @property
+    def stop(self) -> int:
+        return min(self.start + self.size, self.total_rows)
+
+    def label(self) -> str:
+        if self.total_rows == 0:
+            return "No rows"
+        return f"Rows {self.start + 1:,}-{self.stop:,} of {self.total_rows:,} (page {self.number} of {self.n_pages})"
@@ -0,0 +1,64 @@
+"""Per-player row index for the dashboard's player drill-down.
+
+The detail view of a player shows their week-by-week values. Instead of filtering the whole
+frame by player on every click, `PlayerIndex` orders the frame's row positions once per
+dataset: by player, then season and week, with the offsets of every player's block. Opening
+a player is then one slice of that array and a `take` of only those rows.
+
+`player_weeks` turns one player's rows into the series the detail chart plots.
+"""
+import numpy as np
+import pandas as pd
+
+import utils
+
+__all__ = ["PlayerIndex", "player_weeks"]
+
+
+class PlayerIndex:
+    """Row positions of every player's rows in a frame, in (season, week) order."""
+
+    def __init__(self, df: pd.DataFrame, player_col: str = "player_id", order_cols: list[str] = ("season", "week")):
+        codes, self.players = pd.factorize(df[player_col])
+        order = np.lexsort([df[c].to_numpy() for c in reversed(order_cols)] + [codes])
+        # Rows of player i are _rows[_offsets[i]:_offsets[i + 1]]; rows without a player are left out
+        self._rows = order[codes[order] >= 0]
+        self._offsets = np.searchsorted(codes[self._rows], np.arange(len(self.players) + 1))
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def __contains__(self, player_id) -> bool:
+        return player_id in self.players
+
+    @property
+    def nbytes(self) -> int:
+        return self._rows.nbytes + self._offsets.nbytes + int(self.players.memory_usage(deep=True))
+
+    def rows(self, player_id) -> np.ndarray:
+        """Positions of the player's rows (empty for an unknown player)."""
+        loc = self.players.get_indexer([player_id])[0]
+        if loc < 0:
+            return self._rows[:0]
+        return self._rows[self._offsets[loc]:self._offsets[loc + 1]]
+
+    def first_rows(self) -> np.ndarray:
+        """Position of every player's first row, in `players` order (e.g. for their names)."""
+        return self._rows[self._offsets[:-1]]
+
+
+def player_weeks(rows: pd.DataFrame, stat: str, rolling_period: int = 4) -> pd.DataFrame:
+    """One player's week-by-week True / Projected / season-to-date Average / Risk Quotient of
+    `stat` ("Points" for fantasy points), plus the rolling mean of the prior `rolling_period`
+    true values within the season (the window the pipeline's features use).
+
+    Args:
+        rows: the player's rows in (season, week) order (see `PlayerIndex.rows`).
+    """
+    columns = {metric: f"{metric} {stat}" for metric in ["True", "Projected", "Average", "Risk Quotient"]}
+    out = rows[["season", "week"]].reset_index(drop=True)
+    for metric, col in columns.items():
+        out[metric] = rows[col].to_numpy(dtype=np.float64) if col in rows.columns else np.nan
+    seasons = pd.factorize(out["season"])[0]
+    out["Rolling"] = utils.grouped_rolling_mean(out["True"].to_numpy(), seasons, rolling_period)[:, 0]
+    return out
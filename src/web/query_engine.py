@@ -0,0 +1,111 @@
+"""In-memory query engine behind the dashboard table.
+
+The dashboard filters the combined frame by week and position and sorts it by one metric.
+Instead of copying, rounding, masking and sorting the frame on every interaction,
+`TableQueryEngine` does the work once per dataset:
+
+    - keeps one rounded copy of the frame
+    - encodes the filter columns as categorical codes and groups the row positions by their
+      combined code (one contiguous block of rows per (week, position) pair)
+    - precomputes a stable ascending and descending sort permutation per sortable column
+
+A query is then the union of the selected pairs' row blocks (a boolean mask) gathered in the
+order of the sort permutation, and returns row positions; only the rows that are displayed
+are ever taken from the frame.
+"""
+import numpy as np
+import pandas as pd
+
+__all__ = ["TableQueryEngine"]
+
+
+class TableQueryEngine:
+    """Filter-and-sort index over a frame (see module docstring)."""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        sort_columns: list[str],
+        filter_columns: list[str] = ("week", "position"),
+        decimals: int | None = 2,
+    ):
+        self.frame = (df.round(decimals) if decimals is not None else df).reset_index(drop=True)
+        self.filter_columns = list(filter_columns)
+        n_rows = len(self.frame)
+
+        # Categorical codes per filter column, combined into one code per row
+        self._categories: dict[str, pd.Index] = {}
+        combined = np.zeros(n_rows, dtype=np.int64)
+        for col in self.filter_columns:
+            codes, categories = pd.factorize(self.frame[col], sort=True)
+            self._categories[col] = categories
+            combined = combined * (len(categories) + 1) + (codes + 1)  # 0 = missing
+        self._radix = [len(self._categories[col]) + 1 for col in self.filter_columns]
+
+        # Row positions grouped by combined code: rows of code c are _rows[_starts[c]:_starts[c + 1]]
+        self._rows = np.argsort(combined, kind="stable")
+        self._starts = np.searchsorted(combined[self._rows], np.arange(int(np.prod(self._radix)) + 1))
+
+        self._ascending: dict[str, np.ndarray] = {}
+        self._descending: dict[str, np.ndarray] = {}
+        for col in sort_columns:
+            if col not in self.frame.columns:
+                continue
+            values = self.frame[col]
+            self._ascending[col] = values.sort_values(kind="stable").index.to_numpy()
+            self._descending[col] = values.sort_values(ascending=False, kind="stable").index.to_numpy()
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the rounded frame, the row blocks and the sort permutations."""
+        arrays = [self._rows, self._starts, *self._ascending.values(), *self._descending.values()]
+        return int(self.frame.memory_usage(index=True, deep=True).sum()) + sum(a.nbytes for a in arrays)
+
+    def choices(self, col: str) -> list:
+        """Sorted distinct values of a filter column."""
+        return self._categories[col].tolist()
+
+    def sortable(self, col: str) -> bool:
+        return col in self._ascending
+
+    def _codes(self, col: str, values) -> np.ndarray:
+        """Code (+1) of every selected value of `col`; no selection selects every row."""
+        categories = self._categories[col]
+        if not values:
+            return np.arange(len(categories) + 1)
+        codes = categories.get_indexer(list(values))
+        return np.unique(codes[codes >= 0]) + 1
+
+    def query(
+        self,
+        filters: dict[str, list] | None = None,
+        sort_by: str | None = None,
+        ascending: bool = False,
+    ) -> np.ndarray:
+        """Positions in `frame` of the rows matching `filters`, in display order.
+
+        Args:
+            filters: {filter column: selected values}; a missing or empty selection keeps every row.
+            sort_by: a sortable column (None keeps frame order).
+        """
+        filters = filters or {}
+        combined = np.zeros(1, dtype=np.int64)
+        for col, radix in zip(self.filter_columns, self._radix):
+            combined = (combined[:, None] * radix + self._codes(col, filters.get(col))[None, :]).ravel()
+
+        blocks = [self._rows[self._starts[c]:self._starts[c + 1]] for c in combined]
+        selected = np.concatenate(blocks) if blocks else np.empty(0, dtype=np.int64)
+        mask = np.zeros(len(self.frame), dtype=bool)
+        mask[selected] = True
+
+        if sort_by is None:
+            return np.flatnonzero(mask)
+        order = self._ascending[sort_by] if ascending else self._descending[sort_by]
+        return order[mask[order]]
+
+    def take(self, rows: np.ndarray) -> pd.DataFrame:
+        """The rows at `rows` (e.g. one page of a query result), as a fresh frame."""
+        return self.frame.take(rows).reset_index(drop=True)
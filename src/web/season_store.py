@@ -0,0 +1,125 @@
+"""Lazily loaded seasons for the dashboard, within a memory budget.
+
+One dashboard process can browse every season (1999 onwards) without holding them all in
+memory. Each season is its own dataset in the columnar cache (`web.frame_cache`), and
+`SeasonStore` keeps the recently viewed ones loaded:
+
+    - `get(season)` returns the loaded dataset, or loads it with `load(season)` (which reads
+      only the displayed columns from the memory-mapped file and indexes them)
+    - seasons are kept in least-recently-used order; loading one evicts the least recently
+      used seasons until the total size fits `budget_bytes` (the season just requested is
+      always kept, even alone over budget)
+    - a season with no stored dataset yet is recorded as pending, for the dataset worker to
+      build; a failed build is recorded with `fail` and not requested again until
+      `invalidate(season)`, which also drops a loaded copy once a newer one is stored
+
+`version` is bumped whenever a season is built or dropped, so sessions can poll for it.
+"""
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from .dataset_worker import Dataset
+
+__all__ = ["SeasonStore"]
+
+
+def _frame_nbytes(dataset: Dataset) -> int:
+    return int(dataset.frame.memory_usage(index=True, deep=True).sum())
+
+
+class SeasonStore:
+    """LRU of loaded season datasets (see module docstring)."""
+
+    def __init__(
+        self,
+        load: Callable[[int], Dataset | None],
+        budget_bytes: int,
+        sizeof: Callable[[Dataset], int] = _frame_nbytes,
+    ):
+        """
+        Args:
+            load: the stored dataset of a season, or None if it has not been built.
+            budget_bytes: memory budget for the loaded seasons.
+            sizeof: estimated resident bytes of a loaded dataset.
+        """
+        self._load = load
+        self.budget_bytes = budget_bytes
+        self._sizeof = sizeof
+        self._loaded: OrderedDict[int, tuple[Dataset, int]] = OrderedDict()
+        self._pending: set[int] = set()
+        self._errors: dict[int, str] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return sum(size for _, size in self._loaded.values())
+
+    def seasons(self) -> list[int]:
+        """Loaded seasons, least recently used first."""
+        with self._lock:
+            return list(self._loaded)
+
+    def pending(self) -> list[int]:
+        """Requested seasons that have no stored dataset yet."""
+        with self._lock:
+            return sorted(self._pending)
+
+    def error(self, season: int) -> str | None:
+        """Why the last build of `season` failed, if it did."""
+        return self._errors.get(season)
+
+    def get(self, season: int) -> Dataset | None:
+        """The dataset of `season`, loading it (and evicting others) if needed."""
+        with self._lock:
+            if season in self._loaded:
+                self._loaded.move_to_end(season)
+                return self._loaded[season][0]
+            if season in self._errors:
+                return None
+
+        dataset = self._load(season)
+        with self._lock:
+            if dataset is None:
+                self._pending.add(season)
+                return None
+            self._pending.discard(season)
+            self._loaded[season] = (dataset, self._sizeof(dataset))
+            self._evict()
+        return dataset
+
+    def invalidate(self, season: int):
+        """Drops the loaded copy or failed build of `season` (e.g. after it was rebuilt)."""
+        with self._lock:
+            self._loaded.pop(season, None)
+            self._pending.discard(season)
+            self._errors.pop(season, None)
+            self._version += 1
+
+    def fail(self, season: int, error: str):
+        """Records a failed build of a pending season."""
+        with self._lock:
+            self._pending.discard(season)
+            self._errors[season] = error
+            self._version += 1
+
+    def describe(self) -> str:
+        loaded = self.seasons()
+        if not loaded:
+            return "No seasons loaded"
+        return (
+            f"{len(loaded)} season(s) loaded, "
+            f"{self.nbytes / 2**20:,.0f} of {self.budget_bytes / 2**20:,.0f} MB"
+        )
+
+    def _evict(self):
+        total = sum(size for _, size in self._loaded.values())
+        while total > self.budget_bytes and len(self._loaded) > 1:
+            _, (_, size) = self._loaded.popitem(last=False)
+            total -= size
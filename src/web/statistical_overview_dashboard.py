@@ -1,9 +1,13 @@
 import os
 import sys
-import matplotlib
+import threading
+import time
+import traceback
+from typing import NamedTuple
 import numpy as np
 import pandas as pd
-from functools import reduce
+from matplotlib.figure import Figure
+from matplotlib.ticker import MaxNLocator
 from shiny import App, reactive, render, ui
 from dotenv import load_dotenv 
 load_dotenv()
@@ -21,6 +25,14 @@ if project_root not in sys.path:
 # Now import internal modules
 import utils
 from pipelines import linear_regression_pipeline_v1 as pipeline
+from pipelines.assembly import assemble_combined_df
+from web.dataset_worker import Dataset, DatasetWorker
+from web.frame_cache import UNVERSIONED, CacheKey, FrameCache, data_watermark, weights_version
+from web.pagination import PAGE_SIZES, Page
+from web.player_index import PlayerIndex, player_weeks
+from web.query_engine import TableQueryEngine
+from web.season_store import SeasonStore
+from web.table_style import COLOR_SUFFIX, Z_SUFFIX, add_color_columns, cell_styles, zscores_by_group
 from data_api import NFLDataPy
 
 # -----------------------------------------------------------------------------
@@ -38,183 +50,172 @@ CATEGORIES_POSITIONS = {
 }
 
 SAVED_WEIGHTS_PATH = os.getenv("SAVED_WEIGHTS_PATH")
-COMBINED_DF_PATH = os.getenv("COMBINED_DATA_FRAME_PATH")
+# Default: the repository's (git-ignored) cache/ directory, wherever the app is started from
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+DASHBOARD_CACHE_DIR = os.getenv("DASHBOARD_CACHE_DIR", os.path.join(_REPO_ROOT, "cache", "dashboard"))
+# Seasons that can be browsed (the range NFLDataPy serves); the current one is kept up to date
+SEASONS = tuple(range(1999, 2026))
+CURRENT_SEASON = int(os.getenv("DASHBOARD_SEASON", "2024"))
+# Memory budget for the other seasons loaded while browsing
+DASHBOARD_MEMORY_BUDGET_MB = float(os.getenv("DASHBOARD_MEMORY_BUDGET_MB", "512"))
+# Seconds between checks for new data / weights (unset: only at startup and on request)
+DASHBOARD_REFRESH_SECS = float(os.getenv("DASHBOARD_REFRESH_SECS")) if os.getenv("DASHBOARD_REFRESH_SECS") else None
+
+# Metric columns colored by their z-score within the player's position
+METRIC_COLS = [f"{prefix} {target}" for target in utils.TARGET_TRANSLATION.values() for prefix in ["True", "Projected", "Average", "STD", "Risk Quotient"]]
+# Add the projection error to the targets, use that to color the projection values
+METRIC_COLS += ["Error Points", "True Points", "Projected Points"]
 
 # -----------------------------------------------------------------------------
 # Define functions
 # -----------------------------------------------------------------------------
+def load_base_frames(seasons: tuple[int, ...], players: pd.DataFrame | None = None) -> dict[str, pd.DataFrame]:
+    """The pipeline's input frames of `seasons` (`players`: weekly stats already loaded)."""
+    nfl_data = NFLDataPy()
+    years = list(seasons)
+    return {
+        "players": nfl_data.load_player_stats(years) if players is None else players,
+        "teams": nfl_data.load_team_stats(years),
+        "injuries": nfl_data.load_injuries(years),
+        "depth": nfl_data.load_depth_charts(years),
+    }
+
+
+def build_combined_df(frames: dict[str, pd.DataFrame], report=lambda stage: None) -> pd.DataFrame:
+    """Pipeline -> scoring -> assembly -> per-position z-scores and cell colors."""
+    if weights_version(SAVED_WEIGHTS_PATH) == UNVERSIONED:
+        raise FileNotFoundError(
+            f"No saved weights to score with: SAVED_WEIGHTS_PATH={SAVED_WEIGHTS_PATH!r} is unset or does not exist"
+        )
+    report("Running pipeline")
+    target_data_struct, target_input_cols = pipeline.run_pipeline(frames["players"], frames["teams"], frames["injuries"], frames["depth"])
 
-def assemble_combined_df(
-    target_data_struct: dict[str, pd.DataFrame],
-    trues: dict[str, pd.Series | pd.DataFrame],
-    predictions: dict[str, pd.Series | pd.DataFrame],
-) -> pd.DataFrame:
-    """
-    Build one wide table with per-target True/Projected columns.
-    - Merges on keys (prefers ['player_id','season','week'] if present, else just 'player_id')
-    - Keeps player_name and position (joined from a meta table)
-    - Fills NA in metric columns with 0 (does not touch text/meta)
-    """
-    # Collect metric frames (only keys + 2 metric columns per target)
-    metric_frames: list[pd.DataFrame] = []
-    # Collect meta (to attach player_name/position once at the end)
-    meta_frames: list[pd.DataFrame] = []
-
-    for target, df in target_data_struct.items():
-        if target == "def" or df is None or not isinstance(df, pd.DataFrame):
-            continue
+    report("Scoring")
+    results, trues, predictions = pipeline.test_model(target_data_struct, target_input_cols, SAVED_WEIGHTS_PATH)
 
-        # Determine merge keys available in this df
-        preferred_keys = ["player_id", "season", "week"]
-        keys = [k for k in preferred_keys if k in df.columns]
-        if not keys:  # Fallback to player_id only if absolutely necessary
-            if "player_id" in df.columns:
-                keys = ["player_id"]
-            else:
-                # Can't merge without an id; skip this target
-                print(f"[assemble] Skipping '{target}' (no merge key present).")
-                continue
-
-        # Build a small frame with keys and per-target metrics
-        tmp = df[keys].copy()
-
-        # Align trues/preds to df rows (works if Series indexed like df or just reindexes)
-        true_series = trues.get(target, pd.Series(index=df.index, dtype="float64"))
-        pred_series = predictions.get(target, pd.Series(index=df.index, dtype="float64"))
-
-        # If they are DataFrames with a single column, squeeze to Series
-        if isinstance(true_series, pd.DataFrame) and true_series.shape[1] == 1:
-            true_series = true_series.iloc[:, 0]
-        if isinstance(pred_series, pd.DataFrame) and pred_series.shape[1] == 1:
-            pred_series = pred_series.iloc[:, 0]
-
-        tmp[f"True {utils.TARGET_TRANSLATION[target]}"] = pd.Series(true_series).reindex(df.index).to_numpy()
-        tmp[f"Projected {utils.TARGET_TRANSLATION[target]}"] = pd.Series(pred_series).reindex(df.index).to_numpy()
-        tmp[f"Average {utils.TARGET_TRANSLATION[target]}"] = df[f"{utils.TARGET_TRANSLATION[target]}_cum_avg_copy"]
-        tmp[f"STD {utils.TARGET_TRANSLATION[target]}"] = df[f"{utils.TARGET_TRANSLATION[target]}_cum_std_copy"]
-        tmp[f"Risk Quotient {utils.TARGET_TRANSLATION[target]}"] = df[f"{utils.TARGET_TRANSLATION[target]}_cum_avg_copy"] / df[f"{utils.TARGET_TRANSLATION[target]}_cum_std_copy"].replace(0, np.nan)
-
-        metric_frames.append(tmp)
-
-        # Stash meta once per df (we’ll dedupe later)
-        keep_meta = [c for c in ["player_id", "season", "week", "player_display_name", "position"] if c in df.columns]
-        if keep_meta:
-            meta_frames.append(df[keep_meta].copy())
-
-    if not metric_frames:
-        return pd.DataFrame(columns=["player_id", "season", "week", "player_display_name", "position"])
-
-    # Merge all metric frames with an outer join on the available keys
-    def _merge(left: pd.DataFrame, right: pd.DataFrame) -> pd.DataFrame:
-        # Intersect on keys both frames share (at least player_id)
-        shared_keys = [k for k in ["player_id", "season", "week"] if k in left.columns and k in right.columns]
-        if not shared_keys and "player_id" in left.columns and "player_id" in right.columns:
-            shared_keys = ["player_id"]
-        return left.merge(right, on=shared_keys, how="outer")
-
-    combined_metrics = reduce(_merge, metric_frames)
-
-    # Build a meta table and join it on keys (prefer season/week if present)
-    if meta_frames:
-        meta = pd.concat(meta_frames, ignore_index=True).drop_duplicates()
-        # Keep only one row per key combo, preferring non-null player_name/position
-        key_order = [k for k in ["player_id", "season", "week"] if k in meta.columns]
-        if not key_order:
-            key_order = ["player_id"]
-        meta = (meta
-                .sort_values(key_order)  # stable
-                .groupby(key_order, as_index=False)
-                .agg({
-                    "player_display_name": "first" if "player_display_name" in meta.columns else "first",
-                    "position": "first" if "position" in meta.columns else "first"
-                })
-               ) if any(c in meta.columns for c in ["player_display_name", "position"]) else meta
-
-        # Determine merge keys between combined_metrics and meta
-        shared_keys = [k for k in ["player_id", "season", "week"] if k in combined_metrics.columns and k in meta.columns]
-        if not shared_keys and "player_id" in combined_metrics.columns and "player_id" in meta.columns:
-            shared_keys = ["player_id"]
-
-        combined = combined_metrics.merge(meta, on=shared_keys, how="left")
-    else:
-        combined = combined_metrics
-
-    # Fill NA only in metric columns (leave text/meta alone)
-    def _metric_conditions(column: str):
-        return (column.startswith("True ") or 
-                column.startswith("Projected ") or 
-                column.startswith("Average ") or 
-                column.startswith("STD ") or
-                column.startswith("Risk Quotient "))
-    
-    metric_cols = [c for c in combined.columns if _metric_conditions(c)]
-    combined[metric_cols] = combined[metric_cols].fillna(0)
-
-    # Optional: order columns
-    front = [c for c in ["player_id", "season", "week", "player_display_name", "position"] if c in combined.columns]
-    rest = [c for c in combined.columns if c not in front]
-    combined = combined[front + rest]
-
-    combined = combined.drop_duplicates(subset=["season", "week", "player_display_name"])
-
-    combined = utils.compile_player_points_and_projections(combined)
-
-    return combined.reset_index(drop=True)
+    report("Assembling")
+    combined_df = assemble_combined_df(target_data_struct, trues, predictions)
 
+    # Per-position z-score of every metric, one grouped transform
+    combined_df = pd.concat([combined_df, zscores_by_group(combined_df, METRIC_COLS)], axis=1)
 
-# -----------------------------------------------------------------------------
-# Load Persistent DataFrames
-# -----------------------------------------------------------------------------
-df_cached = False
+    # Cell colors are computed once per dataset (uint8 palette indices, see web.table_style)
+    return add_color_columns(combined_df, METRIC_COLS)
 
-if COMBINED_DF_PATH:
-    try:
-        combined_df = pd.read_csv(COMBINED_DF_PATH)
-        df_cached = True
 
-    except:
-        print("Dataframe is not cached or is not cached correctly, or the path is not set.")
+def build_season(season: int, report=lambda stage: None) -> tuple[CacheKey, pd.DataFrame]:
+    """Builds and stores the dataset of one season."""
+    report("Loading data")
+    frames = load_base_frames((season,))
+    key = CacheKey(weights_version(SAVED_WEIGHTS_PATH), data_watermark(frames["players"]), (season,))
+    combined_df = build_combined_df(frames, report)
+    report("Caching")
+    frame_cache.store(key, combined_df)
+    return key, combined_df
 
-if not df_cached:
-    print("Loading base data frames...")
-    nfl_data = NFLDataPy()
-    years = [2024]
-    all_players_df = nfl_data.load_player_stats(years)
-    all_teams_df = nfl_data.load_team_stats(years)
-    injuries_df = nfl_data.load_injuries(years)
-    depth_df = nfl_data.load_depth_charts(years)
-    print("-" * 40)
-    print("\n")
-
-    print("Running data pipeline...")
-    target_data_struct, target_input_cols = pipeline.run_pipeline(all_players_df, all_teams_df, injuries_df, depth_df)
-    print("-" * 40)
 
-    results, trues, predictions = pipeline.test_model(target_data_struct, target_input_cols, SAVED_WEIGHTS_PATH)
+# Set by "Rebuild now"; the current season is also checked at startup and every DASHBOARD_REFRESH_SECS
+refresh_requested = threading.Event()
+_last_refresh: float | None = None
 
-    combined_df = assemble_combined_df(target_data_struct, trues, predictions)
 
-    from collections import defaultdict
-    targets = [f"{prefix} {target}" for target in utils.TARGET_TRANSLATION.values() for prefix in ["True", "Projected", "Average", "STD", "Risk Quotient"]]
-    # Add the projection error to the targets, use that to color the projection values
-    targets += ["Error Points", "True Points", "Projected Points"]
-    descriptive_stats = defaultdict(dict)
+def refresh_due() -> bool:
+    """Whether a worker wakeup should check the current season, rather than only build the
+    seasons requested while browsing."""
+    if refresh_requested.is_set() or _last_refresh is None:
+        return True
+    return DASHBOARD_REFRESH_SECS is not None and time.monotonic() - _last_refresh >= DASHBOARD_REFRESH_SECS
 
-    for col in targets:
-        descriptive_stats[col]["mean"] = combined_df.groupby("position")[col].mean()
-        descriptive_stats[col]["std"] = combined_df.groupby("position")[col].std()
 
-    for col in targets:
-        means = descriptive_stats[col]["mean"]                     # Series indexed by position
-        stds  = descriptive_stats[col]["std"].replace(0, np.nan)   # avoid div-by-0
+def build_dataset(report) -> tuple[CacheKey, pd.DataFrame] | None:
+    """Worker build: seasons requested while browsing, then, when a refresh is due, a new
+    dataset of the current season if its data or the weights moved past the served one.
 
-        mu  = combined_df["position"].map(means)
-        sig = combined_df["position"].map(stds)
-
-        z = (combined_df[col] - mu) / sig
-        combined_df[f"{col}_z-score"] = z.fillna(0)                # fill NA/inf with 0 if you like
-
-    combined_df.to_csv("combined_data_frame.csv")
+    The watermark comes from the weekly stats alone; the other frames are only loaded for a
+    dataset that is neither served nor cached."""
+    global _last_refresh
+    for season in season_store.pending():
+        try:
+            build_season(season, lambda stage: report(f"{season}: {stage}"))
+        except Exception as exc:  # shown when the season is selected, the other builds go on
+            traceback.print_exc()
+            season_store.fail(season, f"{type(exc).__name__}: {exc}")
+            continue
+        season_store.invalidate(season)
+
+    if not refresh_due():
+        return None
+    refresh_requested.clear()
+    _last_refresh = time.monotonic()
+
+    report("Checking data")
+    players = NFLDataPy().load_player_stats([CURRENT_SEASON])
+    key = CacheKey(weights_version(SAVED_WEIGHTS_PATH), data_watermark(players), (CURRENT_SEASON,))
+    served = dataset_worker.current()
+    if served is not None and served.key == key:
+        return None
+
+    cached = frame_cache.load(key)
+    if cached is not None:
+        return key, cached
+    report("Loading data")
+    frames = load_base_frames((CURRENT_SEASON,), players)
+    combined_df = build_combined_df(frames, report)
+    report("Caching")
+    frame_cache.store(key, combined_df)
+    return key, combined_df
+
+
+class DatasetIndex(NamedTuple):
+    """What sessions read of a dataset, built once per dataset on the worker."""
+
+    table: TableQueryEngine  # rounded table columns, week/position index, sort permutations
+    players: PlayerIndex  # each player's rows of table.frame, for the drill-down
+
+    @property
+    def nbytes(self) -> int:
+        return self.table.nbytes + self.players.nbytes
+
+
+def index_dataset(key: CacheKey, combined_df: pd.DataFrame) -> DatasetIndex:
+    table = TableQueryEngine(combined_df[[c for c in TABLE_COLUMNS if c in combined_df.columns]], sort_by_columns)
+    return DatasetIndex(table, PlayerIndex(table.frame))
+
+
+def player_choices(index: DatasetIndex) -> dict[str, str]:
+    """{player_id: "Name (POS)"} of every player in a dataset, by name."""
+    first = index.table.frame.take(index.players.first_rows())
+    labels = first["player_display_name"].fillna("?") + " (" + first["position"].fillna("?") + ")"
+    return dict(sorted(zip(index.players.players, labels), key=lambda item: item[1]))
+
+
+def plot_player_weeks(weeks: pd.DataFrame, title: str) -> Figure:
+    """True vs projected values with the rolling and season-to-date averages, risk quotient below."""
+    fig = Figure(figsize=(9, 5), layout="constrained")
+    top, bottom = fig.subplots(2, 1, sharex=True, height_ratios=[3, 1])
+    top.plot(weeks["week"], weeks["True"], marker="o", label="True")
+    top.plot(weeks["week"], weeks["Projected"], marker="s", label="Projected")
+    top.plot(weeks["week"], weeks["Rolling"], linestyle="--", label=f"Rolling avg (prior {ROLLING_PERIOD} wks)")
+    if weeks["Average"].notna().any():
+        top.plot(weeks["week"], weeks["Average"], linestyle=":", label="Season avg (prior wks)")
+    top.set_title(title)
+    top.legend(loc="upper left", fontsize="small")
+    top.grid(alpha=0.3)
+    if weeks["Risk Quotient"].notna().any():
+        bottom.bar(weeks["week"], weeks["Risk Quotient"], color="tab:gray")
+    bottom.set_ylabel("Risk Quotient")
+    bottom.set_xlabel("Week")
+    bottom.xaxis.set_major_locator(MaxNLocator(integer=True))
+    bottom.grid(alpha=0.3)
+    return fig
+
+
+def load_season(season: int) -> Dataset | None:
+    """A season's stored dataset, reading only the table columns (None if not built yet)."""
+    cached = frame_cache.latest(weights_version(SAVED_WEIGHTS_PATH), (season,), columns=TABLE_COLUMNS)
+    if cached is None:
+        return None
+    return Dataset(*cached, index=index_dataset(*cached))
 
 # -------------------------------------------------------------------
 # UI
@@ -247,21 +248,55 @@ column_ref = {
     "receiving": [f"{prefix} {stat}" for stat in["receiving_yards", "receiving_tds", "receiving_fumbles_lost"] for prefix in ["True", "Projected", "Average", "Risk Quotient"]] + standard_player_columns
 }
 
+# Everything the table and the player drill-down can display, with the cell colors of the metrics
+_metric_columns = list(dict.fromkeys(sort_by_columns + [c for cols in column_ref.values() for c in cols]))
+TABLE_COLUMNS = ["player_id", "player_display_name", "position", "season", "week"] + _metric_columns + [f"{c}{COLOR_SUFFIX}" for c in _metric_columns]
+
+# Stats of the player drill-down ("Points" are fantasy points)
+DETAIL_STATS = ["Points"] + list(dict.fromkeys(c.split(" ", 1)[1] for c in _metric_columns if c.startswith("Average ")))
+
+# -----------------------------------------------------------------------------
+# Load Persistent DataFrames
+# -----------------------------------------------------------------------------
+# Datasets are built off the request path and swapped in when ready (see web.dataset_worker)
+frame_cache = FrameCache(DASHBOARD_CACHE_DIR)
+dataset_worker = DatasetWorker(build_dataset, index_dataset, interval=DASHBOARD_REFRESH_SECS)
+# Other seasons load on demand, least recently viewed ones are dropped past the budget
+season_store = SeasonStore(load_season, int(DASHBOARD_MEMORY_BUDGET_MB * 2**20), sizeof=lambda ds: ds.index.nbytes)
+
+if weights_version(SAVED_WEIGHTS_PATH) == UNVERSIONED:
+    print(f"SAVED_WEIGHTS_PATH={SAVED_WEIGHTS_PATH!r} is unset or does not exist: serving cached data only.")
+cached = frame_cache.latest(weights_version(SAVED_WEIGHTS_PATH), (CURRENT_SEASON,))
+if cached is not None:
+    # Serve the last good version right away, check for newer data in the background
+    print(f"Serving cached dashboard data ({cached[0].watermark}).")
+    dataset_worker.publish(*cached)
+else:
+    print("No cached dashboard data for this model version; building it in the background...")
+dataset_worker.start()
+_initial = dataset_worker.current()
+
 app_ui = ui.page_fluid(
-    ui.h2("2024 NFL Weekly Player Stats with Projections"),
-    ui.p("Select week and position categories to see data from the 2024 NFL Season."),
+    ui.h2("NFL Weekly Player Stats with Projections"),
+    ui.p("Select a season, week and position categories to see player stats and projections."),
     ui.layout_sidebar(
         ui.sidebar(
+            ui.input_select(
+                "season",
+                "Season",
+                choices=[str(s) for s in reversed(SEASONS)],
+                selected=str(CURRENT_SEASON),
+            ),
             ui.input_selectize(
                 "week_filter",
                 "Select week(s)",
-                choices=sorted(combined_df["week"].unique().tolist()),
+                choices=_initial.index.table.choices("week") if _initial else [],
                 multiple=True,
             ),
             ui.input_selectize(
                 "position_filter",
                 "Select position(s)",
-                choices=sorted(combined_df["position"].unique().tolist()),
+                choices=_initial.index.table.choices("position") if _initial else [],
                 multiple=True,
             ),
             ui.input_select(
@@ -283,11 +318,27 @@ app_ui = ui.page_fluid(
                 multiple=True,
                 selected=["True rushing_yards", "Projected rushing_yards"]
             ),
+            ui.hr(),
+            ui.output_text("status"),
+            ui.input_action_button("rebuild", "Rebuild now"),
         ),
         ui.card(
             ui.card_header("Colorized (by z-score)"),
+            ui.layout_columns(
+                ui.input_numeric("page", "Page", value=1, min=1, step=1),
+                ui.input_select("page_size", "Rows per page", choices=[str(n) for n in PAGE_SIZES], selected="50"),
+                ui.output_text("page_info"),
+            ),
             ui.output_ui("styled_table"),
-        )
+        ),
+        ui.card(
+            ui.card_header("Player detail"),
+            ui.layout_columns(
+                ui.input_selectize("player", "Player", choices=[], options={"placeholder": "Select a player"}),
+                ui.input_select("detail_stat", "Stat", choices=DETAIL_STATS, selected="Points"),
+            ),
+            ui.output_plot("player_detail", height="420px"),
+        ),
     )
 )
 
@@ -295,54 +346,102 @@ app_ui = ui.page_fluid(
 # Server
 # -------------------------------------------------------------------
 def server(input, output, session):
+    # The session switches to a new dataset when the worker swaps one in or builds a season
+    @reactive.poll(lambda: (dataset_worker.version, season_store.version), 1)
+    def datasets_version() -> tuple[int, int]:
+        return dataset_worker.version, season_store.version
+
     @reactive.calc
-    def filtered_data():
-        d = combined_df.copy().round(2)
+    def dataset() -> Dataset | None:
+        datasets_version()
+        season = int(input.season())
+        if season == CURRENT_SEASON:
+            return dataset_worker.current()
+        served = season_store.get(season)
+        if served is None:
+            dataset_worker.request_build()
+        return served
+
+    @reactive.effect
+    def _update_filter_choices():
+        index = dataset().index if dataset() else None
+        if index is None:
+            return
+        with reactive.isolate():
+            weeks, positions, player = input.week_filter(), input.position_filter(), input.player()
+        ui.update_selectize("week_filter", choices=index.table.choices("week"), selected=weeks)
+        ui.update_selectize("position_filter", choices=index.table.choices("position"), selected=positions)
+        ui.update_selectize("player", choices=player_choices(index), selected=player, server=True)
+
+    @reactive.effect
+    @reactive.event(input.rebuild)
+    def _rebuild():
+        season = int(input.season())
+        if season_store.error(season):
+            season_store.invalidate(season)  # try the failed season again
+        refresh_requested.set()
+        dataset_worker.request_build()
 
-        if input.week_filter():
-            d = d[d["week"].isin([int(wk) for wk in input.week_filter()])]
-        if input.position_filter():
-            d = d[d["position"].isin(input.position_filter())]
+    @output
+    @render.text
+    def status():
+        reactive.invalidate_later(1)
+        served, season = dataset(), int(input.season())
+        if served is not None:
+            data = f"Data through {served.key.watermark}."
+        elif season_store.error(season):
+            data = f"Season {season} could not be built ({season_store.error(season)})."
+        else:
+            data = f"Season {season} is not built yet."
+        return f"{data} {dataset_worker.status().describe()}. {season_store.describe()}."
+
+    @reactive.calc
+    def filtered_rows() -> np.ndarray:
+        """Positions in the dataset's query engine frame of the filtered rows, in display order."""
+        table_engine = dataset().index.table if dataset() else None
+        if table_engine is None:
+            return np.empty(0, dtype=np.int64)
+        filters = {
+            "week": [int(wk) for wk in input.week_filter()],
+            "position": list(input.position_filter()),
+        }
 
         sort_col = input.sort_by()
-        if sort_col not in d.columns:
+        if not table_engine.sortable(sort_col):
+            sort_col = None
             for c in ["True rushing_yards", "Projected rushing_yards"]:
-                if c in d.columns: sort_col = c; break
-        if sort_col:
-            d = d.sort_values(by=sort_col, ascending=(input.sort_order()=="Ascending"))
-        return d.reset_index(drop=True)
-
-    # helper: returns a list of "background-color: #hex" per cell in the column
-    def _bg_from_z(zvals: pd.Series) -> list[str]:
-        s_name = zvals.name
-
-        sign = 1
-        
-        if any(sub in s_name for sub in ["Risk Quotient", "Error Points"]):
-            sign = -1
-
-        vmax = np.nanmax(np.abs(zvals.values)) if len(zvals) else 1.0
-        if not np.isfinite(vmax) or vmax == 0:
-            vmax = 1.0
-        norm = ((zvals.values * sign) + vmax) / (2 * vmax)          # [-vmax, vmax] -> [0, 1]
-        cmap = matplotlib.cm.get_cmap("RdYlGn")
-        colors = [matplotlib.colors.to_hex(cmap(float(x))) if np.isfinite(x) else "#ffffff" for x in norm]
-        return [f"background-color: {c}" for c in colors]
+                if table_engine.sortable(c): sort_col = c; break
+        return table_engine.query(filters, sort_col, ascending=(input.sort_order() == "Ascending"))
+
+    @reactive.calc
+    def current_page() -> Page:
+        return Page.of(len(filtered_rows()), input.page(), int(input.page_size()))
+
+    # Back to the first page whenever the rows or their order change
+    @reactive.effect
+    @reactive.event(input.season, input.week_filter, input.position_filter, input.sort_by, input.sort_order, input.page_size)
+    def _reset_page():
+        ui.update_numeric("page", value=1)
+
+    @output
+    @render.text
+    def page_info():
+        return current_page().label()
 
     @output
     @render.ui
     def styled_table():
-        if not input.week_filter() or not input.position_filter():
+        if not input.week_filter() or not input.position_filter() or dataset() is None:
             return
 
-        d = filtered_data()
+        # Only the visible page is styled and sent
+        page = current_page()
+        d = dataset().index.table.take(filtered_rows()[page.start:page.stop])
 
-        z_suffix = "_z-score"
-        z_cols = [c for c in d.columns if c.endswith(z_suffix)]
-        base_cols = [c[:-len(z_suffix)] for c in z_cols if c[:-len(z_suffix)] in d.columns]
+        helper_cols = [c for c in d.columns if c.endswith((Z_SUFFIX, COLOR_SUFFIX))]
 
-        # Drop z-score columns from what we display
-        d_no_z = d.drop(columns=z_cols, errors="ignore")
+        # Drop z-score and color columns from what we display
+        d_no_z = d.drop(columns=helper_cols, errors="ignore")
 
         # Apply user column selection
         added_cols = []
@@ -358,29 +457,30 @@ def server(input, output, session):
 
         sty = d_no_z.style.hide(axis="index")
 
-        # helper stays the same
-        def color_by_z(series: pd.Series, z: pd.Series) -> list[str]:
-            return _bg_from_z(z.reindex(series.index))
-
-        # Only style columns that are BOTH:
-        #   1) visible (selected), and
-        #   2) have a matching z-score column present in d
-        to_style = [b for b in base_cols if b in selected and f"{b}{z_suffix}" in d.columns]
-
-        for base in to_style:
-            if base == "Projected Points":
-                # Alias to the error z-score column
-                zcol = f"Error Points{z_suffix}"
-            else:
-                zcol = f"{base}{z_suffix}"
-            # sanitize z (inf -> NaN) and align to visible rows
-            z = d.loc[d_no_z.index, zcol].replace([np.inf, -np.inf], np.nan) 
-            sty = sty.apply(color_by_z, axis=0, subset=pd.IndexSlice[:, [base]], z=z)
+        def color_cells(series: pd.Series) -> list[str]:
+            return cell_styles(d.loc[series.index, f"{series.name}{COLOR_SUFFIX}"])
+
+        # Only style visible columns that have precomputed colors
+        to_style = [c for c in selected if f"{c}{COLOR_SUFFIX}" in d.columns]
+        if to_style:
+            sty = sty.apply(color_cells, axis=0, subset=pd.IndexSlice[:, to_style])
 
         sty = sty.format(precision=2)
         return ui.HTML(sty.to_html())
 
+    @output
+    @render.plot
+    def player_detail():
+        served, player = dataset(), input.player()
+        if served is None or not player or player not in served.index.players:
+            return
+        # Only the player's rows are read, in week order
+        rows = served.index.table.take(served.index.players.rows(player))
+        stat = input.detail_stat()
+        name = rows["player_display_name"].dropna().iloc[0] if rows["player_display_name"].notna().any() else player
+        return plot_player_weeks(player_weeks(rows, stat, ROLLING_PERIOD), f"{name}: {stat}")
+
 # -------------------------------------------------------------------
 # App entrypoint
 # -------------------------------------------------------------------
-app = App(app_ui, server)
\ No newline at end of file
+app = App(app_ui, server)
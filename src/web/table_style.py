@@ -0,0 +1,86 @@
+"""Precomputed cell colors for the dashboard table.
+
+Metric cells are colored by their z-score within the player's position on the RdYlGn
+colormap. Instead of calling matplotlib per cell on every render, the colors are computed
+once per dataset:
+
+    - `zscores_by_group` computes every metric's per-position z-score in one grouped transform
+    - `add_color_columns` maps each z-score to a uint8 index into `PALETTE`, a fixed 256-entry
+      hex lookup table (255 colormap steps + white for missing values), stored as a
+      `<metric>_color` column next to the metric
+
+Rendering is then a gather of `CELL_STYLES` by those indices. A metric's colors are scaled by
+its largest absolute z-score over the whole dataset, so a cell keeps its color under any
+filter or sort.
+"""
+import matplotlib
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "PALETTE",
+    "CELL_STYLES",
+    "MISSING_COLOR",
+    "Z_SUFFIX",
+    "COLOR_SUFFIX",
+    "zscores_by_group",
+    "color_indices",
+    "add_color_columns",
+    "cell_styles",
+]
+
+Z_SUFFIX = "_z-score"
+COLOR_SUFFIX = "_color"
+
+_STEPS = 255
+MISSING_COLOR = _STEPS  # palette index of cells without a finite z-score
+PALETTE: tuple[str, ...] = tuple(
+    [matplotlib.colors.to_hex(c) for c in matplotlib.colormaps["RdYlGn"].resampled(_STEPS)(np.arange(_STEPS))]
+    + ["#ffffff"]
+)
+CELL_STYLES = np.array([f"background-color: {c}" for c in PALETTE], dtype=object)
+
+# Higher is worse for these metrics, so their colors are reversed
+_INVERTED = ("Risk Quotient", "Error Points")
+# Metrics colored by another metric's z-score
+_COLOR_SOURCE = {"Projected Points": "Error Points"}
+
+
+def zscores_by_group(df: pd.DataFrame, cols: list[str], group_col: str = "position") -> pd.DataFrame:
+    """`(x - group mean) / group std` per column (sample std; zero std or no group -> 0)."""
+    grouped = df.groupby(group_col)[cols]
+    mean = grouped.transform("mean")
+    std = grouped.transform("std").replace(0, np.nan)
+    z = (df[cols] - mean) / std
+    return z.fillna(0).add_suffix(Z_SUFFIX)
+
+
+def color_indices(z: np.ndarray, invert: bool = False) -> np.ndarray:
+    """uint8 palette indices for z-scores scaled to [-max |z|, max |z|]."""
+    z = np.asarray(z, dtype=np.float64)
+    finite = np.isfinite(z)
+    vmax = np.max(np.abs(z[finite])) if finite.any() else 1.0
+    if vmax == 0:
+        vmax = 1.0
+    norm = ((-z if invert else z) + vmax) / (2 * vmax)
+    idx = np.full(z.shape, MISSING_COLOR, dtype=np.uint8)
+    idx[finite] = np.clip(np.floor(norm[finite] * _STEPS), 0, _STEPS - 1).astype(np.uint8)
+    return idx
+
+
+def add_color_columns(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
+    """Adds a `<col>_color` palette-index column for every metric with a z-score column."""
+    colors = {}
+    for col in cols:
+        source = _COLOR_SOURCE.get(col, col)
+        z_col = f"{source}{Z_SUFFIX}"
+        if z_col not in df.columns:
+            continue
+        invert = any(name in source for name in _INVERTED)
+        colors[f"{col}{COLOR_SUFFIX}"] = color_indices(df[z_col].to_numpy(dtype=np.float64), invert)
+    return df.assign(**colors)
+
+
+def cell_styles(indices: pd.Series | np.ndarray) -> list[str]:
+    """CSS for each cell of a column from its palette indices."""
+    return CELL_STYLES[np.asarray(indices, dtype=np.intp)].tolist()
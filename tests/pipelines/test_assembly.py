@@ -0,0 +1,82 @@
+# tests/pipelines/test_assembly.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipelines.assembly import assemble_combined_df
+
+STATS = {
+    "rsh_yd": "rushing_yards", "rsh_td": "rushing_tds", "rc_yd": "receiving_yards", "rc_td": "receiving_tds",
+    "rc": "receptions", "rsh_fmbls": "rushing_fumbles_lost", "rc_fmbls": "receiving_fumbles_lost",
+    "p_yd": "passing_yards", "p_td": "passing_tds", "intcpt": "passing_interceptions",
+}
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+def _frame(keys, names, positions):
+    df = pd.DataFrame(keys, columns=["player_id", "season", "week"])
+    df["player_display_name"] = names
+    df["position"] = positions
+    for i, stat in enumerate(STATS.values()):
+        df[f"{stat}_cum_avg"] = np.arange(len(df), dtype=float) + i
+        df[f"{stat}_cum_std"] = 2.0
+    return df
+
+
+@pytest.fixture
+def frames():
+    skill = _frame(
+        [("b", 2024, 1), ("a", 2024, 2), ("a", 2024, 1), ("b", 2024, 1)],
+        ["B", "A", None, "B"],
+        ["WR", "QB", "QB", "WR"],
+    )
+    skill.loc[1, "rushing_yards_cum_std"] = 0.0
+    skill.loc[2, "receptions_cum_avg"] = np.nan
+    passing = _frame([("a", 2024, 1), ("c", 2024, 1)], ["A", "C"], ["QB", "QB"])
+    struct = {t: (passing if t in ("p_yd", "p_td", "intcpt") else skill) for t in STATS}
+    struct["def"] = pd.DataFrame()
+    trues = {t: np.full(len(struct[t]), 1.0) for t in STATS}
+    predictions = {t: np.arange(len(struct[t]), dtype=float) + 10 for t in STATS if t != "rc"}
+    return struct, trues, predictions
+
+
+# ---------- Tests ------------------------------------------------------------
+
+def test_one_sorted_row_per_player_week(frames):
+    combined = assemble_combined_df(*frames)
+
+    assert list(zip(combined["player_id"], combined["week"])) == [("a", 1), ("a", 2), ("b", 1), ("c", 1)]
+    assert list(combined.columns[:5]) == ["player_id", "season", "week", "player_display_name", "position"]
+    # First non-null name across frames
+    assert list(combined["player_display_name"]) == ["A", "A", "B", "C"]
+
+
+def test_metrics_aligned_and_filled(frames):
+    combined = assemble_combined_df(*frames).set_index(["player_id", "week"])
+
+    # First row of a duplicated key wins
+    assert combined.loc[("b", 1), "Projected rushing_yards"] == 10.0
+    assert combined.loc[("a", 1), "Projected passing_yards"] == 10.0
+    assert combined.loc[("a", 2), "Average rushing_yards"] == 1.0
+    # Zero std -> no risk quotient; missing frames / targets / values -> 0
+    assert combined.loc[("a", 2), "Risk Quotient rushing_yards"] == 0.0
+    assert combined.loc[("a", 1), "Risk Quotient receptions"] == 0.0
+    assert combined.loc[("c", 1), "Projected rushing_yards"] == 0.0
+    assert (combined["Projected receptions"] == 0).all()
+    assert combined.loc[("b", 1), "Projected Points"] == pytest.approx(
+        0.1 * 10 + 6 * 10 + 0.1 * 10 + 6 * 10 - 2 * 10 - 2 * 10
+    )
+
+
+def test_series_align_by_row_label(frames):
+    struct, trues, predictions = frames
+    skill = struct["rsh_yd"].set_axis([30, 10, 20, 40])
+    struct = {t: (skill if df is struct["rsh_yd"] else df) for t, df in struct.items()}
+    # Scored rows only, in any order: (a, 2024, 1) is label 20, (b, 2024, 1) first row is label 30
+    predictions["rsh_yd"] = pd.Series([5.0, 7.0], index=[20, 30])
+    combined = assemble_combined_df(struct, trues, predictions).set_index(["player_id", "week"])
+
+    assert combined.loc[("a", 1), "Projected rushing_yards"] == 5.0
+    assert combined.loc[("b", 1), "Projected rushing_yards"] == 7.0
+    assert combined.loc[("a", 2), "Projected rushing_yards"] == 0.0
@@ -0,0 +1,64 @@
+# tests/pipelines/test_batched_training.py
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.model_selection import train_test_split
+
+from src.pipelines.batched_training import train_and_validate_batched
+from src.pipelines.feature_matrix import build_feature_matrix, fit_feature_scalers
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture
+def target_data():
+    rng = np.random.default_rng(9)
+    n = 400
+    shared = pd.DataFrame({
+        "season": rng.choice([2022, 2023, 2024], n),
+        "a": rng.normal(size=n),
+        "b": rng.normal(size=n),
+        "c": rng.normal(size=n),
+        "def_a": rng.normal(size=n),
+    })
+    shared.loc[rng.random(n) < 0.1, "c"] = np.nan
+    shared["rushing_yards"] = 3 * shared["a"] + shared["def_a"] + rng.normal(size=n)
+    shared["rushing_tds"] = shared["a"] - shared["b"] + rng.normal(size=n)
+    shared["receiving_yards"] = 2 * shared["c"].fillna(0) + rng.normal(size=n)
+    shared.index = rng.permutation(n) + 1000
+    struct = {"rsh_yd": shared, "rsh_td": shared, "rc_yd": shared, "def": pd.DataFrame({"def_a": rng.normal(size=64)})}
+    cols = {"rsh_yd": ["a", "b"], "rsh_td": ["a", "b"], "rc_yd": ["b", "c"], "def": ["def_a"]}
+    return struct, cols
+
+
+# ---------- Tests ------------------------------------------------------------
+
+def test_matches_per_target_linear_regression(target_data):
+    struct, cols = target_data
+    models, model_results, trues, predictions = train_and_validate_batched(struct, cols)
+    scalers = fit_feature_scalers(struct, cols)
+
+    assert list(models) == ["rsh_yd", "rsh_td", "rc_yd"]
+    for target, target_col in [("rsh_yd", "rushing_yards"), ("rsh_td", "rushing_tds"), ("rc_yd", "receiving_yards")]:
+        df = struct[target]
+        mask = (df["season"] != 2024).to_numpy()
+        X = build_feature_matrix(df, cols[target] + cols["def"], mask, scalers[target])
+        y = build_feature_matrix(df, [target_col], mask)[:, 0]
+        X_train, X_valid, y_train, y_valid = train_test_split(X, y, test_size=0.2, random_state=42)
+        reg = LinearRegression().fit(X_train, y_train)
+
+        np.testing.assert_allclose(models[target].coef_, reg.coef_, rtol=1e-8)
+        np.testing.assert_array_equal(trues[target], y_valid)
+        np.testing.assert_allclose(predictions[target], reg.predict(X_valid), rtol=1e-8)
+        assert set(model_results[target]) == {"validation_rmse", "r2"}
+        # Values are keyed by the frame rows they were computed for
+        np.testing.assert_array_equal(trues[target], df.loc[trues[target].index, target_col])
+        assert predictions[target].index.equals(trues[target].index)
+
+
+def test_ridge_shrinks_coefficients(target_data):
+    struct, cols = target_data
+    ols, *_ = train_and_validate_batched(struct, cols)
+    ridge, *_ = train_and_validate_batched(struct, cols, alpha=1e4)
+    assert np.linalg.norm(ridge["rsh_yd"].coef_) < np.linalg.norm(ols["rsh_yd"].coef_)
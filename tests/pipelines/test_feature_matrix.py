@@ -0,0 +1,66 @@
+# tests/pipelines/test_feature_matrix.py
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import StandardScaler
+
+from src.pipelines.feature_matrix import ScalerStats, build_feature_matrix, fit_feature_scalers
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(2)
+    n = 50
+    df = pd.DataFrame({
+        "season": rng.choice([2023, 2024], n),
+        "x": rng.normal(10, 3, n),
+        "flag": rng.random(n) < 0.5,
+        "count": rng.integers(0, 5, n),
+        "const": 7.0,
+        "name": "p",
+    })
+    df.loc[rng.random(n) < 0.2, "x"] = np.nan
+    return df
+
+
+# ---------- Tests ------------------------------------------------------------
+
+def test_matches_scale_then_fillna(frame):
+    cols = ["x", "flag", "count", "const"]
+    expected = pd.DataFrame(StandardScaler().fit_transform(frame[cols]), columns=cols).fillna(0).to_numpy()
+    X = build_feature_matrix(frame, cols, scaler=ScalerStats.fit(frame, cols))
+
+    assert X.dtype == np.float64 and X.flags.c_contiguous
+    np.testing.assert_allclose(X, expected, rtol=1e-12, atol=1e-12)
+    np.testing.assert_array_equal(X[:, 3], 0.0)  # zero-variance column keeps scale 1
+
+
+def test_row_mask_and_float32(frame):
+    mask = (frame["season"] == 2023).to_numpy()
+    X = build_feature_matrix(frame, ["x", "count"], mask, dtype=np.float32)
+    assert X.dtype == np.float32 and X.shape == (mask.sum(), 2)
+    np.testing.assert_allclose(X[:, 0], frame.loc[mask, "x"].fillna(0), rtol=1e-6)
+
+
+def test_store_values_are_not_modified(frame):
+    before = frame.copy()
+    build_feature_matrix(frame, ["x", "count"], scaler=ScalerStats.fit(frame, ["x", "count"]))
+    pd.testing.assert_frame_equal(frame, before)
+
+
+def test_scaler_columns_must_match(frame):
+    with pytest.raises(ValueError):
+        build_feature_matrix(frame, ["count", "x"], scaler=ScalerStats.fit(frame, ["x", "count"]))
+
+
+def test_defensive_features_use_team_frame_stats(frame):
+    teams = pd.DataFrame({"def_a": [1.0, 2.0, 3.0, 4.0]})
+    merged = frame.assign(def_a=np.resize([1.0, 1.0, 1.0, 4.0], len(frame)))
+    scalers = fit_feature_scalers({"rsh_yd": merged, "rc_yd": merged, "def": teams},
+                                  {"rsh_yd": ["x"], "rc_yd": ["count", "x"], "def": ["def_a"]})
+
+    assert scalers["rc_yd"].columns == ("count", "x", "def_a")
+    assert scalers["rc_yd"].mean[2] == pytest.approx(2.5)
+    np.testing.assert_array_equal(scalers["rsh_yd"].mean[:1], scalers["rc_yd"].mean[1:2])
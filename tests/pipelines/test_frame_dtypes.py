@@ -0,0 +1,102 @@
+# tests/pipelines/test_frame_dtypes.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipelines.frame_dtypes import downcast_numeric, optimize_nfl_frames
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture
+def frames():
+    players = pd.DataFrame({
+        "player_id": ["00-2", "00-1", "00-2", "00-3"],
+        "season": np.array([2024, 2024, 2024, 2024], dtype=np.int64),
+        "week": np.array([1, 1, 2, 2], dtype=np.int64),
+        "team": ["KC", "BUF", "KC", "MIA"],
+        "opponent_team": ["BAL", "NYJ", "CIN", "BUF"],
+        "position": ["WR", "QB", "WR", "RB"],
+        "position_group": ["WR", "QB", "WR", "RB"],
+        "receiving_yards": [54.0, 0.0, np.nan, 12.0],
+        "fantasy_points": [11.4, 22.1, 3.3, 7.0],
+    })
+    teams = pd.DataFrame({
+        "team": ["BAL", "NYJ", "CIN", "BUF"],
+        "season": np.full(4, 2024),
+        "week": [1, 1, 2, 2],
+        "def_sacks": [2.0, 1.0, 3.0, 0.0],
+    })
+    injuries = pd.DataFrame({
+        "gsis_id": ["00-2", "00-9"],
+        "season": [2024, 2024],
+        "week": [2, 2],
+        "report_status": ["Questionable", None],
+    })
+    return {"players": players, "teams": teams, "injuries": injuries}
+
+
+# ---------- Tests ------------------------------------------------------------
+
+def test_downcast_numeric_is_lossless():
+    df = pd.DataFrame({
+        "small": np.array([1, 18], dtype=np.int64),
+        "large": np.array([0, 2**40], dtype=np.int64),
+        "counts": [3.0, np.nan],
+        "fractions": [0.1, 1 / 3],
+        "name": ["a", "b"],
+    })
+    out = downcast_numeric(df)
+
+    assert out["small"].dtype == np.int8
+    assert out["large"].dtype == np.int64
+    assert out["counts"].dtype == np.float32
+    assert out["fractions"].dtype == np.float64  # not exactly representable as float32
+    pd.testing.assert_frame_equal(out.astype({"small": np.int64, "counts": np.float64}), df)
+
+
+def test_key_columns_share_sorted_categories(frames):
+    out, report = optimize_nfl_frames(frames)
+    players, teams, injuries = out["players"], out["teams"], out["injuries"]
+
+    assert players["player_id"].dtype == injuries["gsis_id"].dtype
+    assert list(players["player_id"].cat.categories) == ["00-1", "00-2", "00-3", "00-9"]
+    assert players["opponent_team"].dtype == teams["team"].dtype == players["team"].dtype
+    assert isinstance(players["position_group"].dtype, pd.CategoricalDtype)
+    assert list(injuries["report_status"].cat.categories) == ["Questionable"]
+    assert players["week"].dtype == np.int8 and players["season"].dtype == np.int16
+
+    # Sorting by a key gives the order of the strings
+    assert players.sort_values("player_id")["player_id"].tolist() == sorted(frames["players"]["player_id"])
+    assert set(report.before) == set(report.after) == set(frames)
+
+
+def test_merges_match_the_string_keyed_frames(frames):
+    out, _ = optimize_nfl_frames(frames)
+
+    def merged(f):
+        injuries = f["injuries"].rename(columns={"gsis_id": "player_id"})
+        df = f["players"].merge(injuries, how="left", on=["player_id", "season", "week"])
+        return df.merge(f["teams"], how="left", left_on=["opponent_team", "season", "week"],
+                        right_on=["team", "season", "week"])
+
+    expected, result = merged(frames), merged(out)
+    for col in result.columns:
+        if isinstance(result[col].dtype, pd.CategoricalDtype):
+            result[col] = result[col].astype(object)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_report_counts_saved_memory():
+    n = 5000
+    players = pd.DataFrame({
+        "player_id": [f"00-{i % 50:07d}" for i in range(n)],
+        "season": np.full(n, 2024),
+        "week": np.arange(n) % 18 + 1,
+        "passing_yards": np.arange(n, dtype=np.float64),
+    })
+    out, report = optimize_nfl_frames({"players": players})
+
+    assert report.saved > 0
+    assert report.after["players"] == out["players"].memory_usage(index=True, deep=True).sum()
+    assert report.describe().startswith("saved ")
@@ -0,0 +1,123 @@
+# tests/pipelines/test_incremental_features.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipelines.incremental_features import IncrementalFeatureUpdater
+from src.utils.window_features import grouped_window_features
+
+COLS = ["yards", "tds"]
+SORT = ["season", "week", "player_id"]
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture
+def weekly_df():
+    rng = np.random.default_rng(11)
+    rows = [
+        (season, week, f"00-{p:03d}", rng.choice(["BUF", "KC", "SF", "DAL", None]))
+        for season in (2023, 2024)
+        for week in range(1, 11)
+        for p in range(20)
+        if rng.random() < 0.8
+    ]
+    df = pd.DataFrame(rows, columns=["season", "week", "player_id", "opponent_team"])
+    df["yards"] = rng.normal(40, 25, len(df)).round(1)
+    df["tds"] = rng.poisson(0.4, len(df)).astype(float)
+    df.loc[rng.random(len(df)) < 0.1, "yards"] = np.nan
+    return df.sort_values(SORT).reset_index(drop=True)
+
+
+def _full_recompute(df):
+    season = grouped_window_features(df, COLS, ["season", "player_id"], rolling_period=4)
+    opponent = grouped_window_features(df, COLS, ["opponent_team", "player_id"], prefix="vs_opponent_")
+    return pd.concat([season, opponent], axis=1)
+
+
+# ---------- Tests ------------------------------------------------------------
+
+def test_ingest_matches_full_recompute(weekly_df):
+    expected = _full_recompute(weekly_df)
+    updater = IncrementalFeatureUpdater(COLS, rolling_period=4)
+
+    for _, week_df in weekly_df.groupby(["season", "week"], sort=True):
+        emitted = updater.ingest(week_df)
+        assert list(emitted.columns[-len(updater.feature_columns):]) == updater.feature_columns
+        np.testing.assert_allclose(
+            emitted[updater.feature_columns].to_numpy(),
+            expected.loc[week_df.index, updater.feature_columns].to_numpy(),
+            rtol=1e-9, atol=1e-12,
+        )
+
+
+def test_from_history_then_ingest_last_week(weekly_df):
+    expected = _full_recompute(weekly_df)
+    last = (weekly_df["season"] == 2024) & (weekly_df["week"] == 10)
+
+    updater = IncrementalFeatureUpdater.from_history(weekly_df[~last], COLS)
+    assert updater.last_week == (2024, 9)
+    emitted = updater.ingest(weekly_df[last])
+    np.testing.assert_allclose(
+        emitted[updater.feature_columns].to_numpy(),
+        expected.loc[last, updater.feature_columns].to_numpy(),
+        rtol=1e-9, atol=1e-12,
+    )
+
+
+def test_reingesting_a_week_is_rejected(weekly_df, tmp_path):
+    last = (weekly_df["season"] == 2024) & (weekly_df["week"] == 10)
+    updater = IncrementalFeatureUpdater.from_history(weekly_df[~last], COLS)
+    updater.ingest(weekly_df[last])
+    before = updater.features(weekly_df[last])
+
+    with pytest.raises(ValueError, match="at or before"):
+        updater.ingest(weekly_df[last])
+    with pytest.raises(ValueError):
+        updater.update(weekly_df[(weekly_df["season"] == 2024) & (weekly_df["week"] == 3)])
+    pd.testing.assert_frame_equal(updater.features(weekly_df[last]), before)
+
+    path = tmp_path / "state.npz"
+    updater.save(path)
+    with pytest.raises(ValueError):
+        IncrementalFeatureUpdater.load(path).ingest(weekly_df[last])
+
+
+def test_save_and_load_round_trip(weekly_df, tmp_path):
+    last = (weekly_df["season"] == 2024) & (weekly_df["week"] == 10)
+    updater = IncrementalFeatureUpdater.from_history(weekly_df[~last], COLS)
+    path = tmp_path / "state.npz"
+    updater.save(path)
+
+    restored = IncrementalFeatureUpdater.load(path)
+    assert restored.feature_columns == updater.feature_columns
+    assert restored.last_week == updater.last_week
+    pd.testing.assert_frame_equal(restored.features(weekly_df[last]), updater.features(weekly_df[last]))
+
+
+def test_save_and_load_round_trip_with_integer_ids(tmp_path):
+    df = pd.DataFrame({
+        "season": 2024,
+        "week": [1, 1, 2, 2, 3, 3],
+        "player_id": [7, 8, 7, 8, 7, 8],
+        "opponent_team": ["KC", "SF", "SF", "KC", "KC", "SF"],
+        "a": [10.0, 1.0, 20.0, 2.0, 30.0, 3.0],
+    })
+    last = df["week"] == 3
+    updater = IncrementalFeatureUpdater.from_history(df[~last], ["a"])
+    path = tmp_path / "state.npz"
+    updater.save(path)
+
+    restored = IncrementalFeatureUpdater.load(path)
+    expected = updater.features(df[last])
+    assert expected["a_cum_avg"].notna().all()
+    pd.testing.assert_frame_equal(restored.features(df[last]), expected)
+
+
+def test_defensive_updater_without_opponent():
+    df = pd.DataFrame({"season": 2024, "week": [1, 1, 2, 2], "team": ["KC", "SF", "KC", "SF"], "sacks": [1.0, 3.0, 2.0, 5.0]})
+    updater = IncrementalFeatureUpdater(["sacks"], rolling_period=4, entity="team", opponent=None)
+    updater.update(df[df["week"] == 1])
+    out = updater.features(df[df["week"] == 2])
+    assert list(out.columns) == ["team", "season", "week", "sacks_roll4_shift", "sacks_cum_avg", "sacks_cum_std"]
+    np.testing.assert_array_equal(out["sacks_roll4_shift"], [1.0, 3.0])
@@ -0,0 +1,67 @@
+# tests/pipelines/test_injury_encoding.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipelines.injury_encoding import INJURY_ENCODER, InjuryEncoder
+from src.utils import REQUIRED_INJURY_ENCODED_COLS
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture
+def injuries():
+    return pd.DataFrame({
+        "report_status": ["Out", None, "questionable ", "Injured Reserve", "Doubtful"],
+        "practice_status": [
+            "Did Not Participate in Practice",
+            "\n    ",
+            "Limited Participation in Practice",
+            None,
+            "Full  Participation in Practice",
+        ],
+    }, index=[10, 11, 12, 13, 14])
+
+
+def _hot(encoded):
+    """Names of the set indicators per row."""
+    return [sorted(encoded.columns[row == 1]) for row in encoded.to_numpy()]
+
+
+# ---------- Tests ------------------------------------------------------------
+
+def test_fixed_vocabulary_in_order(injuries):
+    encoded = INJURY_ENCODER.transform(injuries.iloc[:0])
+    assert list(encoded.columns) == REQUIRED_INJURY_ENCODED_COLS
+    assert (encoded.dtypes == np.uint8).all()
+
+
+def test_statuses_are_normalized(injuries):
+    encoded = INJURY_ENCODER.transform(injuries)
+
+    assert encoded.index.equals(injuries.index)
+    assert _hot(encoded) == [
+        ["practice_status_Did Not Participate In Practice", "report_status_Out"],
+        ["practice_status_\n    ", "report_status_None"],
+        ["practice_status_Limited Participation in Practice", "report_status_Questionable"],
+        [],  # unknown report status, missing practice status
+        ["practice_status_Full Participation in Practice", "report_status_Doubtful"],
+    ]
+
+
+def test_categorical_and_string_inputs_encode_alike(injuries):
+    as_categories = injuries.astype("category")
+    as_strings = injuries.astype("string")
+    expected = INJURY_ENCODER.transform(injuries)
+    pd.testing.assert_frame_equal(INJURY_ENCODER.transform(as_categories), expected)
+    pd.testing.assert_frame_equal(INJURY_ENCODER.transform(as_strings), expected)
+
+
+def test_custom_vocabulary():
+    encoder = InjuryEncoder(["report_status_Out", "report_status_Healthy"], columns=("report_status",),
+                            missing={"report_status": "Healthy"})
+    encoded = encoder.transform(pd.DataFrame({"report_status": ["OUT", np.nan]}))
+    np.testing.assert_array_equal(encoded.to_numpy(), [[1, 0], [0, 1]])
+
+    with pytest.raises(ValueError):
+        InjuryEncoder(["game_status_Out"])
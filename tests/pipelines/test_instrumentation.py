@@ -0,0 +1,87 @@
+# tests/pipelines/test_instrumentation.py
+import json
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipelines.instrumentation import PipelineTrace
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({"a": np.arange(10), "b": np.ones(10)})
+
+
+# ---------- Tests ------------------------------------------------------------
+
+def test_stage_records_times_and_output_shape(frame):
+    trace = PipelineTrace()
+    with trace.stage("outer", season=2024) as outer:
+        with trace.stage("inner") as inner:
+            inner.output({"x": frame, "y": frame, "z": frame.iloc[:4, :1]})
+        outer.output(frame)
+
+    inner, outer = trace.records
+    assert [r.name for r in trace.records] == ["inner", "outer"]
+    assert (inner.depth, outer.depth) == (1, 0)
+    assert (inner.rows, inner.columns) == (14, 2)  # distinct frames only
+    assert (outer.rows, outer.columns) == (10, 2)
+    assert outer.wall >= inner.wall >= 0 and outer.cpu >= 0
+    assert outer.start <= inner.start
+    assert outer.meta == {"season": 2024}
+
+
+def test_memory_peaks_propagate_to_parent_stage():
+    trace = PipelineTrace(trace_memory=True)
+    with trace.stage("outer"):
+        with trace.stage("inner"):
+            block = np.ones(2**20)  # 8 MB
+            del block
+        with trace.stage("small"):
+            pass
+
+    inner, small, outer = trace.records
+    assert inner.alloc_peak_mb >= 7.5
+    assert small.alloc_peak_mb < 1
+    assert outer.alloc_peak_mb >= inner.alloc_peak_mb
+
+
+def test_failed_stage_is_recorded_and_reraised():
+    trace = PipelineTrace()
+    with pytest.raises(ValueError):
+        with trace.stage("broken"):
+            raise ValueError("bad input")
+    assert trace.records[0].error == "ValueError: bad input"
+
+
+def test_stages_are_logged(caplog, frame):
+    trace = PipelineTrace()
+    with caplog.at_level(logging.INFO, logger="pipelines.trace"):
+        with trace.stage("depth_filter") as stage:
+            stage.output(frame)
+
+    (log,) = caplog.records
+    assert log.getMessage().startswith("stage=depth_filter wall_s=")
+    assert "rows=10 cols=2" in log.getMessage()
+    assert log.stage["name"] == "depth_filter"
+
+
+def test_chrome_trace(tmp_path, frame):
+    trace = PipelineTrace()
+    with trace.stage("outer"):
+        with trace.stage("inner") as inner:
+            inner.output(frame)
+
+    path = trace.write_chrome_trace(str(tmp_path / "traces" / "run.json"))
+    with open(path, encoding="utf-8") as f:
+        events = json.load(f)["traceEvents"]
+
+    complete = [e for e in events if e["ph"] == "X"]
+    assert [e["name"] for e in complete] == ["outer", "inner"]
+    outer, inner = complete
+    assert outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"] + 1
+    assert inner["args"]["rows"] == 10
@@ -0,0 +1,94 @@
+# tests/pipelines/test_model_registry.py
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from src.pipelines.feature_matrix import ScalerStats, build_feature_matrix
+from src.pipelines.model_registry import ModelRegistry, data_fingerprint, load_registry
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture
+def registry():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(100, 3))
+    models, names, scalers = {}, {}, {}
+    for target, cols in [("rsh_yd", ["a", "b", "def_a"]), ("rc", ["b", "c", "d"])]:
+        models[target] = LinearRegression().fit(X, X @ rng.normal(size=3) + 1.5)
+        names[target] = cols
+        scalers[target] = ScalerStats(tuple(cols), rng.normal(size=3), rng.uniform(1, 2, 3))
+    return ModelRegistry.from_models(models, names, scalers, version="v-test", fingerprint="abc")
+
+
+# ---------- Tests ------------------------------------------------------------
+
+def test_round_trip_is_memory_mapped(tmp_path, registry):
+    path = tmp_path / "models" / "v.models"
+    registry.save(str(path))
+    loaded = ModelRegistry.load(str(path))
+
+    assert list(loaded) == ["rsh_yd", "rc"]
+    assert (loaded.version, loaded.fingerprint, loaded.created) == ("v-test", "abc", registry.created)
+    for target in registry:
+        expected, actual = registry[target], loaded[target]
+        assert actual.feature_names == expected.feature_names
+        assert isinstance(actual.coef, np.memmap)
+        np.testing.assert_array_equal(actual.coef, expected.coef)
+        assert actual.intercept == expected.intercept
+        np.testing.assert_array_equal(actual.scaler.mean, expected.scaler.mean)
+        np.testing.assert_array_equal(actual.scaler.scale, expected.scaler.scale)
+
+    X = np.ones((4, 3))
+    np.testing.assert_allclose(loaded["rc"].to_linear_regression().predict(X), loaded["rc"].predict(X))
+
+
+def test_rejects_non_registry_files(tmp_path):
+    path = tmp_path / "weights.npz"
+    np.savez(path, coef=np.ones(3))
+    with pytest.raises(ValueError):
+        ModelRegistry.load(str(path))
+
+
+def test_feature_names_must_match_coefficients():
+    reg = LinearRegression().fit(np.eye(3), [1.0, 2.0, 3.0])
+    with pytest.raises(ValueError):
+        ModelRegistry.from_models({"rc": reg}, {"rc": ["a", "b"]})
+
+
+def test_load_registry_caches_until_the_file_changes(tmp_path, registry):
+    path = str(tmp_path / "v.models")
+    registry.save(path)
+    first = load_registry(path)
+    assert load_registry(path) is first
+
+    ModelRegistry(registry.models, version="v-next").save(path)
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+    assert load_registry(path).version == "v-next"
+
+
+def test_data_fingerprint_tracks_training_values():
+    df = pd.DataFrame({"a": [1.0, 2.0], "def_a": [0.0, 1.0], "rushing_yards": [10.0, 20.0]})
+    cols = {"rsh_yd": ["a"], "def": ["def_a"]}
+    struct = {"rsh_yd": df, "def": df}
+
+    assert data_fingerprint(struct, cols) == data_fingerprint({"rsh_yd": df.copy(), "def": df}, cols)
+    changed = df.assign(a=[1.0, 2.5])
+    assert data_fingerprint(struct, cols) != data_fingerprint({"rsh_yd": changed, "def": df}, cols)
+
+
+def test_stored_scaler_is_applied_to_scored_data(tmp_path):
+    train = pd.DataFrame({"a": [0.0, 2.0, 4.0], "b": [1.0, 1.0, 4.0]})
+    scaler = ScalerStats.fit(train, ["a", "b"])
+    reg = LinearRegression().fit(build_feature_matrix(train, ["a", "b"], scaler=scaler), [1.0, 2.0, 3.0])
+    path = str(tmp_path / "v.models")
+    ModelRegistry.from_models({"rc": reg}, {"rc": ["a", "b"]}, {"rc": scaler}).save(path)
+
+    scored = pd.DataFrame({"a": [10.0, np.nan], "b": [2.0, 2.0]})
+    stored = ModelRegistry.load(path)["rc"].scaler
+    X = build_feature_matrix(scored, list(stored.columns), scaler=stored)
+    np.testing.assert_allclose(X[:, 0], [(10.0 - 2.0) / np.std([0.0, 2.0, 4.0]), 0.0])
+    np.testing.assert_allclose(X[:, 1], (2.0 - 2.0) / np.std([1.0, 1.0, 4.0]))
@@ -0,0 +1,78 @@
+# tests/pipelines/test_parallel.py
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.model_selection import train_test_split
+
+from src.pipelines.feature_matrix import build_feature_matrix, fit_feature_scalers
+from src.pipelines.parallel import score_parallel, train_and_validate_parallel
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture
+def target_data():
+    rng = np.random.default_rng(5)
+    n = 300
+    shared = pd.DataFrame({
+        "season": rng.choice([2023, 2024], n),
+        "a": rng.normal(size=n),
+        "b": rng.normal(size=n),
+        "def_a": rng.normal(size=n),
+    })
+    shared.loc[rng.random(n) < 0.1, "b"] = np.nan
+    shared["rushing_yards"] = 3 * shared["a"] - shared["def_a"] + rng.normal(scale=0.1, size=n)
+    shared["receiving_yards"] = 2 * shared["b"].fillna(0) + rng.normal(scale=0.1, size=n)
+    shared.index = rng.permutation(n) + 1000
+    struct = {"rsh_yd": shared, "rc_yd": shared, "def": pd.DataFrame({"def_a": rng.normal(size=32)})}
+    cols = {"rsh_yd": ["a"], "rc_yd": ["a", "b"], "def": ["def_a"]}
+    return struct, cols
+
+
+def _serial_fit(df, feature_cols, target_col, scaler):
+    mask = (df["season"] != 2024).to_numpy()
+    X = build_feature_matrix(df, feature_cols, mask, scaler)
+    y = build_feature_matrix(df, [target_col], mask)[:, 0]
+    X_train, X_valid, y_train, y_valid = train_test_split(X, y, test_size=0.2, random_state=42)
+    reg = LinearRegression().fit(X_train, y_train)
+    return reg, y_valid, reg.predict(X_valid)
+
+
+# ---------- Tests ------------------------------------------------------------
+
+def test_train_matches_serial_fit(target_data):
+    struct, cols = target_data
+    models, model_results, trues, predictions, timings = train_and_validate_parallel(struct, cols, max_workers=2)
+
+    assert set(models) == set(model_results) == set(timings) == {"rsh_yd", "rc_yd"}
+    scaler = fit_feature_scalers(struct, cols)["rc_yd"]
+    reg, y_valid, preds = _serial_fit(struct["rc_yd"], ["a", "b", "def_a"], "receiving_yards", scaler)
+    np.testing.assert_allclose(models["rc_yd"].coef_, reg.coef_)
+    np.testing.assert_array_equal(trues["rc_yd"], y_valid)
+    np.testing.assert_allclose(predictions["rc_yd"], preds)
+    # Values are keyed by the frame rows they were computed for
+    pd.testing.assert_series_equal(trues["rc_yd"], struct["rc_yd"].loc[trues["rc_yd"].index, "receiving_yards"],
+                                   check_names=False)
+    assert predictions["rc_yd"].index.equals(trues["rc_yd"].index)
+    assert {"prepare", "fit", "score", "total"} <= set(timings["rc_yd"])
+
+
+def test_scoring_uses_given_models(target_data):
+    struct, cols = target_data
+    models, *_ = train_and_validate_parallel(struct, cols, max_workers=2)
+    scalers = fit_feature_scalers(struct, cols)
+    model_results, trues, predictions, _ = score_parallel(struct, cols, models, scalers, max_workers=2)
+
+    X = build_feature_matrix(struct["rsh_yd"], ["a", "def_a"], scaler=scalers["rsh_yd"])
+    np.testing.assert_allclose(predictions["rsh_yd"], models["rsh_yd"].predict(X))
+    np.testing.assert_array_equal(trues["rsh_yd"], struct["rsh_yd"]["rushing_yards"].to_numpy())
+    assert predictions["rsh_yd"].index.equals(struct["rsh_yd"].index)
+    assert set(model_results) == {"rsh_yd", "rc_yd"}
+
+
+def test_scoring_requires_training_scalers(target_data):
+    struct, cols = target_data
+    models, *_ = train_and_validate_parallel(struct, cols, max_workers=2)
+    with pytest.raises(ValueError, match="rc_yd"):
+        score_parallel(struct, cols, models, {"rsh_yd": fit_feature_scalers(struct, cols)["rsh_yd"]})
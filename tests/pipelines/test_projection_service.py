@@ -0,0 +1,106 @@
+# tests/pipelines/test_projection_service.py
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipelines.batched_training import train_and_validate_batched
+from src.pipelines.feature_matrix import build_feature_matrix, fit_feature_scalers
+from src.pipelines.model_registry import ModelRegistry
+from src.pipelines.projection_service import ProjectionService, make_server
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture
+def service_data():
+    rng = np.random.default_rng(5)
+    n = 300
+    players = pd.DataFrame({
+        "player_id": [f"p{i % 30}" for i in range(n)],
+        "player_display_name": [f"Player {i % 30}" for i in range(n)],
+        "position": "RB",
+        "season": 2023 + (np.arange(n) // 150),
+        "week": (np.arange(n) // 30) % 5 + 1,
+        "opponent_team": rng.choice(["BUF", "KC", "NYJ"], n),
+        "a": rng.normal(size=n),
+        "b": rng.normal(size=n),
+    })
+    players.loc[rng.random(n) < 0.1, "b"] = np.nan
+    defense = pd.DataFrame(
+        [(team, season, week) for team in ["BUF", "KC", "NYJ"] for season in (2023, 2024) for week in range(1, 6)],
+        columns=["team", "season", "week"],
+    )
+    defense["def_a"] = rng.normal(size=len(defense))
+    players = players.merge(defense, left_on=["opponent_team", "season", "week"],
+                            right_on=["team", "season", "week"], how="left").drop(columns="team")
+    players["rushing_yards"] = 10 * players["a"] + 5 * players["def_a"] + rng.normal(size=n)
+    players["rushing_tds"] = players["b"].fillna(0) + rng.normal(size=n)
+
+    struct = {"rsh_yd": players, "rsh_td": players, "def": defense}
+    cols = {"rsh_yd": ["a", "b"], "rsh_td": ["b"], "def": ["def_a"]}
+    scalers = fit_feature_scalers(struct, cols)
+    models, _, _, _ = train_and_validate_batched(struct, cols, season_holdout=2025, scalers=scalers)
+    registry = ModelRegistry.from_models(models, {t: list(s.columns) for t, s in scalers.items() if t in models}, scalers)
+    return struct, cols, registry
+
+
+# ---------- Tests ------------------------------------------------------------
+
+def test_project_matches_registry_predictions(service_data):
+    struct, cols, registry = service_data
+    service = ProjectionService.build(struct, registry, cols["def"])
+    df = struct["rsh_yd"]
+
+    for i in [0, 57, 299]:
+        row = df.iloc[[i]]
+        result = service.project(row["player_id"].iloc[0], row["season"].iloc[0], row["week"].iloc[0])
+        assert result["player_display_name"] == row["player_display_name"].iloc[0]
+        assert result["opponent_team"] == row["opponent_team"].iloc[0]
+
+        expected = {}
+        for target, stat in [("rsh_yd", "rushing_yards"), ("rsh_td", "rushing_tds")]:
+            model = registry[target]
+            X = build_feature_matrix(row, list(model.feature_names), scaler=model.scaler)
+            expected[stat] = float(model.predict(X)[0])
+            assert result["projections"][stat] == pytest.approx(expected[stat], rel=1e-9, abs=1e-9)
+        assert result["projected_points"] == pytest.approx(
+            0.1 * expected["rushing_yards"] + 6 * expected["rushing_tds"], rel=1e-9
+        )
+
+
+def test_unknown_player_week_is_none(service_data):
+    struct, cols, registry = service_data
+    service = ProjectionService.build(struct, registry, cols["def"])
+    assert service.project("p0", 2023, 17) is None
+    assert service.project("nobody", 2023, 1) is None
+
+
+def test_http_endpoint(service_data):
+    struct, cols, registry = service_data
+    service = ProjectionService.build(struct, registry, cols["def"])
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(f"{base}/project?player_id=p3&season=2023&week=1") as response:
+            payload = json.loads(response.read())
+        expected = service.project("p3", 2023, 1)
+        assert (payload["player_id"], payload["season"], payload["week"]) == ("p3", 2023, 1)
+        assert payload["projections"] == pytest.approx(expected["projections"])
+        assert payload["projected_points"] == pytest.approx(expected["projected_points"])
+
+        for query, status in [("/project?player_id=p3&season=x&week=1", 400),
+                              ("/project?player_id=p3&season=2023&week=9", 404),
+                              ("/other", 404)]:
+            with pytest.raises(urllib.error.HTTPError) as err:
+                urllib.request.urlopen(base + query)
+            assert err.value.code == status
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,98 @@
+# tests/pipelines/test_slate_scoring.py
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from src.pipelines.feature_matrix import ScalerStats, build_feature_matrix
+from src.pipelines.model_registry import ModelRegistry, RegisteredModel
+from src.pipelines.slate_scoring import score_slate
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture
+def slate_data():
+    rng = np.random.default_rng(11)
+
+    def _frame(n, ids):
+        return pd.DataFrame({
+            "player_id": rng.choice(ids, n),
+            "player_display_name": "x",
+            "position": "QB",
+            "season": rng.choice([2023, 2024], n),
+            "week": rng.integers(1, 4, n),
+            "a": rng.normal(size=n),
+            "b": rng.normal(size=n),
+            "def_a": rng.normal(size=n),
+        })
+
+    skill = _frame(200, [f"s{i}" for i in range(40)])
+    passing = _frame(60, ["s0", "s1", "q0", "q1", "q2"])
+    passing.loc[rng.random(60) < 0.2, "a"] = np.nan
+    struct = {"rsh_yd": skill, "rc": skill, "p_yd": passing, "def": pd.DataFrame({"def_a": [0.0]})}
+
+    X = rng.normal(size=(50, 3))
+    frame_scalers = {id(df): ScalerStats(("a", "b", "def_a"), rng.normal(size=3), rng.uniform(1, 2, 3))
+                     for df in (skill, passing)}
+    models, names, scalers = {}, {}, {}
+    for target, cols in [("rsh_yd", ["a", "b", "def_a"]), ("rc", ["b", "a", "def_a"]), ("p_yd", ["a", "b", "def_a"])]:
+        models[target] = LinearRegression().fit(X, X @ rng.normal(size=3) + rng.normal())
+        names[target] = cols
+        scalers[target] = frame_scalers[id(struct[target])].select(cols)
+    return struct, ModelRegistry.from_models(models, names, scalers)
+
+
+# ---------- Tests ------------------------------------------------------------
+
+def test_matches_per_target_scoring(slate_data):
+    struct, registry = slate_data
+    slate = score_slate(struct, registry, season=2024, week=2)
+
+    assert not slate.duplicated(["player_id", "season", "week"]).any()
+    assert (slate["season"] == 2024).all() and (slate["week"] == 2).all()
+    assert {"Projected rushing_yards", "Projected receptions", "Projected passing_yards",
+            "Projected rushing_tds", "Projected Points"} <= set(slate.columns)
+
+    for target, stat in [("rsh_yd", "rushing_yards"), ("rc", "receptions"), ("p_yd", "passing_yards")]:
+        df = struct[target]
+        rows = df[(df["season"] == 2024) & (df["week"] == 2)].drop_duplicates(["player_id", "season", "week"])
+        model = registry[target]
+        expected = pd.Series(
+            model.predict(build_feature_matrix(rows, list(model.feature_names), scaler=model.scaler)),
+            index=rows["player_id"].to_numpy(),
+        )
+        actual = slate.set_index("player_id")[f"Projected {stat}"]
+        np.testing.assert_allclose(actual.reindex(expected.index), expected, rtol=1e-10)
+        # Players without rows in this target's frame get no projection
+        assert (actual.drop(expected.index) == 0).all()
+
+    # Rushing / passing players are merged onto one row per player-week
+    both = set(struct["rsh_yd"].query("season == 2024 and week == 2")["player_id"]) & \
+        set(struct["p_yd"].query("season == 2024 and week == 2")["player_id"])
+    assert len(slate) == len(set(struct["rsh_yd"].query("season == 2024 and week == 2")["player_id"])
+                             | set(struct["p_yd"].query("season == 2024 and week == 2")["player_id"]))
+    for player in both:
+        row = slate.set_index("player_id").loc[player]
+        assert row["Projected rushing_yards"] != 0 and row["Projected passing_yards"] != 0
+
+    expected_points = (0.1 * slate["Projected rushing_yards"] + 0.5 * slate["Projected receptions"]
+                       + 0.04 * slate["Projected passing_yards"])
+    np.testing.assert_allclose(slate["Projected Points"], expected_points, rtol=1e-10)
+
+
+def test_requires_scaler_statistics(slate_data):
+    struct, registry = slate_data
+    bare = ModelRegistry.from_models(registry.to_linear_regressions(),
+                                     {t: list(registry[t].feature_names) for t in registry})
+    with pytest.raises(ValueError):
+        score_slate(struct, bare)
+
+
+def test_rejects_inconsistent_scaling(slate_data):
+    struct, registry = slate_data
+    rc = registry["rc"]
+    shifted = ScalerStats(rc.scaler.columns, rc.scaler.mean + 1.0, rc.scaler.scale)
+    registry.models["rc"] = RegisteredModel(rc.target, rc.feature_names, rc.coef, rc.intercept, shifted)
+    with pytest.raises(ValueError):
+        score_slate(struct, registry)
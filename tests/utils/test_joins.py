@@ -0,0 +1,88 @@
+# tests/utils/test_joins.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.joins import join_keys, left_join, left_join_indexer
+
+KEYS = ["player_id", "season", "week"]
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture
+def players():
+    rng = np.random.default_rng(3)
+    n = 500
+    return pd.DataFrame({
+        "player_id": rng.choice([f"00-{i:03d}" for i in range(20)], n),
+        "season": rng.choice([2023, 2024], n),
+        "week": rng.integers(1, 18, n).astype(np.int8),
+        "opponent_team": rng.choice(["BUF", "KC", "SF"], n),
+        "team": rng.choice(["MIA", "NYJ"], n),
+        "yards": rng.normal(50, 20, n),
+    })
+
+
+@pytest.fixture
+def depth(players):
+    rng = np.random.default_rng(4)
+    n = 400  # duplicated player-weeks and players the left side does not have
+    return pd.DataFrame({
+        "player_id": rng.choice([f"00-{i:03d}" for i in range(5, 25)], n),
+        "season": rng.choice([2023, 2024], n),
+        "week": rng.integers(1, 18, n),
+        "depth_team": rng.integers(1, 4, n),
+        "starter": rng.random(n) < 0.5,
+    })
+
+
+@pytest.fixture
+def teams():
+    index = pd.MultiIndex.from_product([["BUF", "KC", "SF"], [2023, 2024], range(1, 18)],
+                                       names=["team", "season", "week"])
+    return pd.DataFrame({"def_sacks": np.arange(len(index), dtype=float)}, index=index).reset_index()
+
+
+# ---------- Tests ------------------------------------------------------------
+
+@pytest.mark.parametrize("unique", [False, True])
+def test_left_join_matches_merge(players, depth, unique):
+    right = depth.drop_duplicates(KEYS) if unique else depth
+    expected = players.merge(right, how="left", on=KEYS)
+    pd.testing.assert_frame_equal(left_join(players, right, KEYS), expected, check_dtype=False)
+
+
+def test_left_join_drops_right_keys(players, teams):
+    expected = players.merge(teams, how="left", left_on=["opponent_team", "season", "week"],
+                             right_on=["team", "season", "week"])
+    expected = expected.drop(columns="team_y").rename(columns={"team_x": "team"})
+    result = left_join(players, teams, ["opponent_team", "season", "week"], ["team", "season", "week"])
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_shared_categorical_keys_join_on_codes(players, depth):
+    dtype = pd.CategoricalDtype(sorted(set(players["player_id"]) | set(depth["player_id"])))
+    left, right = players.astype({"player_id": dtype}), depth.astype({"player_id": dtype})
+    result = left_join(left, right, KEYS)
+    assert result["player_id"].dtype == dtype
+    expected = players.merge(depth, how="left", on=KEYS)
+    pd.testing.assert_frame_equal(result.astype({"player_id": object}), expected, check_dtype=False)
+
+
+def test_missing_keys_never_match():
+    left = pd.DataFrame({"k": ["a", None, "b"], "v": [1, 2, 3]})
+    right = pd.DataFrame({"k": ["a", None], "w": [10.0, 20.0]})
+    result = left_join(left, right, ["k"])
+    np.testing.assert_array_equal(result["w"], [10.0, np.nan, np.nan])
+
+
+def test_direct_and_sorted_lookups_agree(players, teams, depth):
+    for right, left_on, right_on in [(teams, ["opponent_team", "season", "week"], ["team", "season", "week"]),
+                                     (depth, KEYS, KEYS)]:
+        left_keys, right_keys, space = join_keys(players, right, left_on, right_on)
+        assert left_keys.dtype == np.int64 and left_keys.max() < space
+        direct = left_join_indexer(left_keys, right_keys, space)
+        searched = left_join_indexer(left_keys, right_keys)
+        for a, b in zip(direct, searched):
+            np.testing.assert_array_equal(a, b)
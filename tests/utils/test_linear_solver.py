@@ -0,0 +1,56 @@
+# tests/utils/test_linear_solver.py
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression, Ridge
+
+from src.utils.linear_solver import NormalEquations, fit_least_squares
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture
+def design():
+    rng = np.random.default_rng(4)
+    X = rng.normal(size=(500, 6)) * [1, 10, 0.1, 1, 5, 2] + [0, 3, -1, 0, 100, 0]
+    Y = np.column_stack([X @ rng.normal(size=6) + rng.normal(size=500) for _ in range(3)])
+    return X, Y
+
+
+# ---------- Tests ------------------------------------------------------------
+
+def test_matches_linear_regression(design):
+    X, Y = design
+    coef, intercept = fit_least_squares(X, Y)
+    for k in range(Y.shape[1]):
+        reg = LinearRegression().fit(X, Y[:, k])
+        np.testing.assert_allclose(coef[k], reg.coef_, rtol=1e-9)
+        assert intercept[k] == pytest.approx(reg.intercept_, rel=1e-9)
+
+
+def test_sample_weights_and_ridge(design):
+    X, Y = design
+    weight = np.random.default_rng(1).uniform(0.1, 2.0, X.shape[0])
+    coef, intercept = fit_least_squares(X, Y[:, 0], sample_weight=weight, alpha=3.0)
+    ridge = Ridge(alpha=3.0).fit(X, Y[:, 0], sample_weight=weight)
+    np.testing.assert_allclose(coef[0], ridge.coef_, rtol=1e-8)
+    assert intercept[0] == pytest.approx(ridge.intercept_, rel=1e-8)
+
+
+def test_column_subsets_share_the_gram_matrix(design):
+    X, Y = design
+    equations = NormalEquations(X)
+    coef, intercept = equations.solve(Y[:, :2], cols=[4, 0, 2])
+    expected, expected_intercept = fit_least_squares(X[:, [4, 0, 2]], Y[:, :2])
+    np.testing.assert_allclose(coef, expected, rtol=1e-9)
+    np.testing.assert_allclose(intercept, expected_intercept, rtol=1e-9)
+
+
+def test_degenerate_columns_match_minimum_norm_solution(design):
+    X, Y = design
+    X = np.column_stack([X, X[:, 1], np.full(X.shape[0], 2.0)])  # duplicate + constant column
+    coef, intercept = fit_least_squares(X, Y[:, 0])
+    reg = LinearRegression().fit(X, Y[:, 0])
+
+    assert coef[0, -1] == 0.0
+    assert coef[0, 1] == pytest.approx(coef[0, 6])
+    np.testing.assert_allclose(X @ coef[0] + intercept[0], reg.predict(X), rtol=1e-9)
@@ -0,0 +1,69 @@
+# tests/utils/test_moments.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.moments import Moments
+from src.utils.window_features import group_codes, grouped_expanding_mean_std
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture
+def values():
+    rng = np.random.default_rng(11)
+    values = rng.normal(1e6, 3.0, (300, 3))  # large offset: sum-of-squares variance would cancel
+    values[rng.random(values.shape) < 0.1] = np.nan
+    return values
+
+
+# ---------- Accumulator ------------------------------------------------------
+
+def test_merge_of_partitions_equals_whole(values):
+    groups = np.arange(values.shape[0]) % 4
+    whole = Moments.from_values(values, groups, 4)
+    left = Moments.from_values(values[:120], groups[:120], 4)
+    right = Moments.from_values(values[120:], groups[120:], 4)
+    merged = left.merge(right)
+
+    np.testing.assert_array_equal(merged.count, whole.count)
+    np.testing.assert_allclose(merged.mean, whole.mean, rtol=1e-12)
+    np.testing.assert_allclose(merged.m2, whole.m2, rtol=1e-9)
+
+
+def test_update_with_repeated_groups(values):
+    groups = np.arange(values.shape[0]) % 5
+    acc = Moments.zeros((5, values.shape[1]))
+    for start in range(0, values.shape[0], 70):
+        acc.update(groups[start:start + 70], values[start:start + 70])
+
+    mean, std = acc.finalize()
+    for g in range(5):
+        expected = pd.DataFrame(values[groups == g])
+        np.testing.assert_allclose(mean[g], expected.mean(), rtol=1e-12)
+        np.testing.assert_allclose(std[g], expected.std(), rtol=1e-9)
+
+
+def test_finalize_handles_small_counts():
+    acc = Moments.from_values(np.array([[2.0], [np.nan], [4.0]]), np.array([0, 1, 2]), 3)
+    acc.update(np.array([2]), np.array([[6.0]]))
+    mean, std = acc.finalize(ddof=1)
+    np.testing.assert_array_equal(mean[:, 0], [2.0, np.nan, 5.0])
+    assert np.isnan(std[:2, 0]).all()
+    assert std[2, 0] == pytest.approx(np.sqrt(2.0))
+
+
+# ---------- Chunked expanding moments ----------------------------------------
+
+def test_chunked_expanding_matches_single_pass(values):
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({
+        "season": np.sort(rng.choice([2022, 2023, 2024], values.shape[0])),
+        "player_id": rng.choice(["a", "b", "c", None], values.shape[0]),
+    })
+    codes = group_codes(df, ["player_id"])
+    mean, std = grouped_expanding_mean_std(values, codes)
+    chunked_mean, chunked_std = grouped_expanding_mean_std(values, codes, chunks=df["season"].to_numpy())
+
+    np.testing.assert_allclose(chunked_mean, mean, rtol=1e-12)
+    np.testing.assert_allclose(chunked_std, std, rtol=1e-9)
@@ -0,0 +1,92 @@
+# tests/utils/test_window_features.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.window_features import (
+    group_codes,
+    grouped_expanding_mean_std,
+    grouped_rolling_mean,
+    grouped_window_features,
+)
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture
+def weekly_df():
+    rng = np.random.default_rng(7)
+    n = 400
+    df = pd.DataFrame({
+        "season": rng.choice([2023, 2024], n),
+        "week": rng.integers(1, 18, n),
+        "player_id": rng.choice([f"00-{i:03d}" for i in range(12)], n),
+        "opponent_team": rng.choice(["BUF", "KC", "SF", None], n),
+        "a": rng.normal(50, 20, n),
+        "b": rng.poisson(2, n).astype(float),
+    })
+    df.loc[rng.random(n) < 0.15, "a"] = np.nan
+    return df.sort_values(["season", "week", "player_id"])
+
+
+def _pandas_reference(df, cols, groupby, transform):
+    return df.groupby(groupby)[cols].transform(transform).to_numpy()
+
+
+# ---------- Kernels ----------------------------------------------------------
+
+@pytest.mark.parametrize("window,min_periods,shift", [(4, 1, 1), (3, 2, 1), (2, 1, 0), (5, 1, 2)])
+def test_grouped_rolling_mean_matches_pandas(weekly_df, window, min_periods, shift):
+    cols = ["a", "b"]
+    groupby = ["season", "player_id"]
+    expected = _pandas_reference(
+        weekly_df, cols, groupby,
+        lambda x: x.rolling(window, min_periods=min_periods).mean().shift(shift),
+    )
+    actual = grouped_rolling_mean(weekly_df[cols], group_codes(weekly_df, groupby), window, min_periods, shift)
+    np.testing.assert_allclose(actual, expected, rtol=1e-9)
+
+
+@pytest.mark.parametrize("groupby", [["season", "player_id"], ["opponent_team", "player_id"]])
+def test_grouped_expanding_mean_std_matches_pandas(weekly_df, groupby):
+    cols = ["a", "b"]
+    mean, std = grouped_expanding_mean_std(weekly_df[cols], group_codes(weekly_df, groupby))
+
+    np.testing.assert_allclose(
+        mean, _pandas_reference(weekly_df, cols, groupby, lambda x: x.expanding().mean().shift(1)), rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(
+        std, _pandas_reference(weekly_df, cols, groupby, lambda x: x.expanding().std().shift(1)), rtol=1e-7)
+
+
+def test_missing_group_keys_produce_nan(weekly_df):
+    codes = group_codes(weekly_df, ["opponent_team", "player_id"])
+    missing = weekly_df["opponent_team"].isna().to_numpy()
+    assert (codes[missing] == -1).all()
+
+    mean, std = grouped_expanding_mean_std(weekly_df[["b"]], codes)
+    assert np.isnan(mean[missing]).all() and np.isnan(std[missing]).all()
+
+
+def test_constant_group_has_zero_std():
+    values = np.full((5, 1), 3.0)
+    mean, std = grouped_expanding_mean_std(values, np.zeros(5, dtype=int))
+    np.testing.assert_array_equal(mean[1:, 0], 3.0)
+    assert np.isnan(std[:2, 0]).all()
+    np.testing.assert_array_equal(std[2:, 0], 0.0)
+
+
+# ---------- Combined features ------------------------------------------------
+
+def test_grouped_window_features_names_and_index(weekly_df):
+    out = grouped_window_features(weekly_df, ["a", "b"], ["season", "player_id"], rolling_period=4, prefix="p_")
+    assert list(out.columns) == [
+        "a_roll4_shift", "b_roll4_shift",
+        "p_a_cum_avg", "p_b_cum_avg",
+        "p_a_cum_std", "p_b_cum_std",
+    ]
+    assert out.index.equals(weekly_df.index)
+
+
+def test_grouped_window_features_without_cumulative(weekly_df):
+    out = grouped_window_features(weekly_df, ["a"], ["season", "player_id"], rolling_period=3, cumulative=False)
+    assert list(out.columns) == ["a_roll3_shift"]
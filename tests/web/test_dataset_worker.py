@@ -0,0 +1,75 @@
+# tests/web/test_dataset_worker.py
+import time
+
+import pandas as pd
+import pytest
+
+from src.web.dataset_worker import DatasetWorker
+from src.web.frame_cache import CacheKey
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+def _key(watermark: str) -> CacheKey:
+    return CacheKey("v1", watermark, (2024,))
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({"week": [1, 2], "Projected Points": [1.0, 2.0]})
+
+
+# ---------- Tests ------------------------------------------------------------
+
+def test_build_swaps_in_prepared_dataset(frame):
+    def build(report):
+        report("Loading data")
+        report("Scoring")
+        return _key("2024w02-2"), frame
+
+    worker = DatasetWorker(build, prepare=lambda key, df: len(df))
+    assert worker.current() is None and worker.version == 0
+
+    assert worker.build_once()
+    dataset = worker.current()
+    assert worker.version == 1
+    assert dataset.key == _key("2024w02-2") and dataset.index == 2
+    assert dataset.frame is frame
+
+    status = worker.status()
+    assert status.state == "idle"
+    assert list(status.last_timings) == ["Loading data", "Scoring", "Indexing"]
+    assert status.describe().startswith("Last build")
+
+
+def test_up_to_date_build_keeps_dataset(frame):
+    worker = DatasetWorker(lambda report: None)
+    served = worker.publish(_key("2024w01-2"), frame)
+
+    assert not worker.build_once()
+    assert worker.current() is served and worker.version == 1
+
+
+def test_failed_build_keeps_last_dataset(frame):
+    def build(report):
+        report("Running pipeline")
+        raise RuntimeError("download failed")
+
+    worker = DatasetWorker(build)
+    served = worker.publish(_key("2024w01-2"), frame)
+
+    assert not worker.build_once()
+    assert worker.current() is served
+    status = worker.status()
+    assert status.state == "failed" and "download failed" in status.error
+    assert "download failed" in status.describe()
+
+
+def test_background_thread_builds_on_start(frame):
+    worker = DatasetWorker(lambda report: (_key("2024w02-2"), frame))
+    worker.start()
+
+    deadline = time.monotonic() + 5
+    while worker.version == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert worker.current().key == _key("2024w02-2")
@@ -0,0 +1,95 @@
+# tests/web/test_frame_cache.py
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.web.frame_cache import UNVERSIONED, CacheKey, FrameCache, data_watermark, weights_version
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture
+def combined():
+    return pd.DataFrame({
+        "player_id": ["a", "b", "c"],
+        "season": np.array([2024, 2024, 2024], dtype=np.int64),
+        "week": np.array([1, 1, 2], dtype=np.int64),
+        "player_display_name": ["A", None, "C"],
+        "Projected Points": [1.5, np.nan, 3.0],
+        "Projected Points_color": np.array([0, 127, 254], dtype=np.uint8),
+    })
+
+
+# ---------- Tests ------------------------------------------------------------
+
+def test_round_trip_keeps_dtypes(tmp_path, combined):
+    cache = FrameCache(str(tmp_path / "cache"))
+    key = CacheKey("v1-abc", "2024w02-3", (2024,))
+    path = cache.store(key, combined)
+
+    assert os.path.basename(path) == key.filename()
+    loaded = cache.load(key)
+    assert loaded["season"].dtype == np.int64
+    assert loaded["Projected Points_color"].dtype == np.uint8
+    np.testing.assert_array_equal(loaded["Projected Points"], combined["Projected Points"])
+    assert loaded["player_display_name"].isna().tolist() == [False, True, False]
+    assert cache.load(CacheKey("v1-abc", "2024w03-3", (2024,))) is None
+
+
+def test_latest_picks_newest_for_model_and_seasons(tmp_path, combined):
+    cache = FrameCache(str(tmp_path))
+    old = CacheKey("v1", "2024w01-2", (2024,))
+    new = CacheKey("v1", "2024w02-3", (2024,))
+    cache.store(old, combined.iloc[:2])
+    cache.store(new, combined)
+    cache.store(CacheKey("v2", "2024w03-3", (2024,)), combined)
+    os.utime(cache.path(old), ns=(1, 1))
+
+    key, df = cache.latest("v1", (2024,))
+    assert key == new and len(df) == 3
+    assert cache.latest("v1", (2023, 2024)) is None
+    assert FrameCache(str(tmp_path / "missing")).latest("v1", (2024,)) is None
+
+
+def test_missing_weights_serve_any_model_version(tmp_path, combined):
+    assert weights_version(None) == UNVERSIONED
+    assert weights_version(str(tmp_path / "missing")) == UNVERSIONED
+
+    cache = FrameCache(str(tmp_path / "cache"))
+    cache.store(CacheKey("v1", "2024w01-3", (2024,)), combined)
+    newest = CacheKey("v2", "2024w02-3", (2024,))
+    cache.store(newest, combined)
+    os.utime(cache.path(CacheKey("v1", "2024w01-3", (2024,))), ns=(1, 1))
+
+    key, _ = cache.latest(UNVERSIONED, (2024,))
+    assert key == newest
+
+
+def test_unreadable_files_are_skipped(tmp_path, combined):
+    cache = FrameCache(str(tmp_path))
+    good = CacheKey("v1", "2024w01-3", (2024,))
+    cache.store(good, combined)
+    (tmp_path / "combined_v1_2024_2024w09-1.arrow").write_bytes(b"not arrow")
+    pd.DataFrame({"x": [1]}).to_feather(tmp_path / "other.arrow")
+
+    key, _ = cache.latest("v1", (2024,))
+    assert key == good
+
+
+def test_watermark():
+    players = pd.DataFrame({"season": [2023, 2024, 2024], "week": [18, 3, 7]})
+    assert data_watermark(players) == "2024w07-3"
+    assert data_watermark(players.iloc[:0]) == "empty"
+
+
+def test_reads_project_columns(tmp_path, combined):
+    cache = FrameCache(str(tmp_path))
+    key = CacheKey("v1", "2024w02-3", (2024,))
+    cache.store(key, combined)
+
+    loaded = cache.load(key, columns=["week", "Projected Points_color", "not stored"])
+    assert loaded.columns.tolist() == ["week", "Projected Points_color"]
+    _, latest = cache.latest("v1", (2024,), columns=["player_id"])
+    assert latest["player_id"].tolist() == ["a", "b", "c"]
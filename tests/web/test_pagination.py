@@ -0,0 +1,24 @@
+# tests/web/test_pagination.py
+import pytest
+
+from src.web.pagination import Page
+
+
+# ---------- Tests ------------------------------------------------------------
+
+@pytest.mark.parametrize("total, number, size, expected", [
+    (120, 1, 50, (1, 0, 50, 3)),
+    (120, 3, 50, (3, 100, 120, 3)),
+    (120, 9, 50, (3, 100, 120, 3)),   # past the end -> last page
+    (120, 0, 50, (1, 0, 50, 3)),
+    (120, None, 50, (1, 0, 50, 3)),
+    (0, 4, 25, (1, 0, 0, 1)),
+])
+def test_page_bounds(total, number, size, expected):
+    page = Page.of(total, number, size)
+    assert (page.number, page.start, page.stop, page.n_pages) == expected
+
+
+def test_label():
+    assert Page.of(1234, 2, 100).label() == "Rows 101-200 of 1,234 (page 2 of 13)"
+    assert Page.of(0, 1, 100).label() == "No rows"
@@ -0,0 +1,55 @@
+# tests/web/test_player_index.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.web.player_index import PlayerIndex, player_weeks
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(7)
+    n = 300
+    df = pd.DataFrame({
+        "player_id": rng.choice(["p1", "p2", "p3", "p4", None], n),
+        "season": rng.choice([2023, 2024], n),
+        "week": rng.integers(1, 19, n),
+        "True Points": rng.gamma(2, 5, n),
+        "Projected Points": rng.gamma(2, 5, n),
+    })
+    return df.drop_duplicates(["player_id", "season", "week"]).reset_index(drop=True)
+
+
+# ---------- Tests ------------------------------------------------------------
+
+def test_rows_match_filter_in_week_order(frame):
+    index = PlayerIndex(frame)
+    assert len(index) == 4 and "p3" in index and None not in index
+
+    for player in ["p1", "p2", "p3", "p4"]:
+        expected = frame[frame["player_id"] == player].sort_values(["season", "week"]).index.to_numpy()
+        np.testing.assert_array_equal(index.rows(player), expected)
+    assert len(index.rows("unknown")) == 0
+
+
+def test_first_rows_follow_players(frame):
+    index = PlayerIndex(frame)
+    first = frame.take(index.first_rows())
+    assert first["player_id"].tolist() == index.players.tolist()
+
+
+def test_player_weeks_rolling_mean_of_prior_weeks_within_season(frame):
+    index = PlayerIndex(frame)
+    rows = frame.take(index.rows("p1"))
+    weeks = player_weeks(rows, "Points", rolling_period=3)
+
+    expected = (
+        rows.groupby("season")["True Points"]
+        .transform(lambda x: x.rolling(3, min_periods=1).mean().shift(1))
+        .to_numpy()
+    )
+    np.testing.assert_allclose(weeks["Rolling"], expected)
+    np.testing.assert_array_equal(weeks["Projected"], rows["Projected Points"])
+    assert weeks["Average"].isna().all() and weeks["Risk Quotient"].isna().all()
@@ -0,0 +1,64 @@
+# tests/web/test_query_engine.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.web.query_engine import TableQueryEngine
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(4)
+    n = 500
+    df = pd.DataFrame({
+        "week": rng.integers(1, 8, n),
+        "position": rng.choice(["QB", "RB", "WR", "TE"], n),
+        "Projected Points": rng.normal(10, 5, n).round(1),
+        "True rushing_yards": rng.gamma(2, 20, n),
+    })
+    df.loc[rng.random(n) < 0.05, "position"] = None
+    return df.set_axis(rng.permutation(n) + 100)
+
+
+def _expected(df, weeks, positions, sort_by, ascending):
+    d = df.round(2).reset_index(drop=True)
+    if weeks:
+        d = d[d["week"].isin(weeks)]
+    if positions:
+        d = d[d["position"].isin(positions)]
+    return d.sort_values(sort_by, ascending=ascending, kind="stable").index.to_numpy()
+
+
+# ---------- Tests ------------------------------------------------------------
+
+@pytest.mark.parametrize("weeks, positions", [([1, 3], ["WR", "RB"]), ([], ["QB"]), ([2], []), ([], [])])
+@pytest.mark.parametrize("ascending", [True, False])
+def test_query_matches_mask_and_sort(frame, weeks, positions, ascending):
+    engine = TableQueryEngine(frame, ["Projected Points", "True rushing_yards"])
+    for sort_by in ["Projected Points", "True rushing_yards"]:
+        rows = engine.query({"week": weeks, "position": positions}, sort_by, ascending)
+        np.testing.assert_array_equal(rows, _expected(frame, weeks, positions, sort_by, ascending))
+
+
+def test_unsorted_query_keeps_frame_order(frame):
+    engine = TableQueryEngine(frame, [])
+    rows = engine.query({"position": ["TE", "not a position"]})
+    np.testing.assert_array_equal(rows, np.flatnonzero((frame["position"] == "TE").to_numpy()))
+
+
+def test_take_returns_rounded_rows(frame):
+    engine = TableQueryEngine(frame, ["True rushing_yards"])
+    rows = engine.query({"week": [4]}, "True rushing_yards")[:10]
+    page = engine.take(rows)
+
+    assert list(page.index) == list(range(len(rows)))
+    np.testing.assert_array_equal(page["True rushing_yards"], frame["True rushing_yards"].round(2).to_numpy()[rows])
+    assert engine.choices("week") == sorted(frame["week"].unique().tolist())
+    assert engine.choices("position") == ["QB", "RB", "TE", "WR"]
+
+
+def test_nbytes_counts_frame_and_permutations(frame):
+    engine = TableQueryEngine(frame, ["Projected Points"])
+    assert engine.nbytes > engine.frame.memory_usage(deep=True).sum() + 2 * len(frame) * 8
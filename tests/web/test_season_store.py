@@ -0,0 +1,94 @@
+# tests/web/test_season_store.py
+import pandas as pd
+import pytest
+
+from src.web.dataset_worker import Dataset
+from src.web.frame_cache import CacheKey
+from src.web.season_store import SeasonStore
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+class _Seasons:
+    """Stored seasons; counts loads."""
+
+    def __init__(self, seasons):
+        self.stored = set(seasons)
+        self.loads = []
+
+    def __call__(self, season):
+        self.loads.append(season)
+        if season not in self.stored:
+            return None
+        frame = pd.DataFrame({"season": [season] * 3, "week": [1, 2, 3]})
+        return Dataset(CacheKey("v1", f"{season}w03-3", (season,)), frame)
+
+
+@pytest.fixture
+def seasons():
+    return _Seasons(range(2019, 2025))
+
+
+def _store(seasons, budget_seasons):
+    # Every dataset counts as 100 bytes
+    return SeasonStore(seasons, budget_bytes=100 * budget_seasons, sizeof=lambda ds: 100)
+
+
+# ---------- Tests ------------------------------------------------------------
+
+def test_loaded_seasons_are_reused(seasons):
+    store = _store(seasons, 3)
+    first = store.get(2020)
+    assert store.get(2020) is first
+    assert seasons.loads == [2020]
+    assert store.nbytes == 100
+
+
+def test_least_recently_used_seasons_are_evicted(seasons):
+    store = _store(seasons, 2)
+    store.get(2019)
+    store.get(2020)
+    store.get(2019)
+    store.get(2021)
+    assert store.seasons() == [2019, 2021]
+
+    store.get(2020)
+    assert seasons.loads == [2019, 2020, 2021, 2020]
+
+
+def test_requested_season_is_kept_over_budget(seasons):
+    store = SeasonStore(seasons, budget_bytes=10, sizeof=lambda ds: 100)
+    store.get(2019)
+    assert store.get(2020) is not None
+    assert store.seasons() == [2020]
+
+
+def test_missing_season_is_pending_until_built(seasons):
+    store = _store(seasons, 3)
+    assert store.get(2010) is None
+    assert store.pending() == [2010]
+
+    seasons.stored.add(2010)
+    store.invalidate(2010)
+    assert store.pending() == [] and store.version == 1
+    assert store.get(2010).key.seasons == (2010,)
+
+
+def test_invalidate_reloads_season(seasons):
+    store = _store(seasons, 3)
+    first = store.get(2024)
+    store.invalidate(2024)
+    assert store.get(2024) is not first
+    assert seasons.loads == [2024, 2024]
+
+
+def test_failed_season_is_not_requested_again(seasons):
+    store = _store(seasons, 3)
+    store.get(2010)
+    store.fail(2010, "ValueError: no data")
+
+    assert store.get(2010) is None
+    assert store.pending() == [] and store.error(2010) == "ValueError: no data"
+    store.invalidate(2010)
+    store.get(2010)
+    assert store.pending() == [2010] and store.error(2010) is None
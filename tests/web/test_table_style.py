@@ -0,0 +1,72 @@
+# tests/web/test_table_style.py
+import matplotlib
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.web.table_style import (
+    CELL_STYLES, MISSING_COLOR, PALETTE, add_color_columns, cell_styles, color_indices, zscores_by_group,
+)
+
+
+# ---------- Fixtures ---------------------------------------------------------
+
+@pytest.fixture
+def metrics():
+    rng = np.random.default_rng(2)
+    n = 60
+    return pd.DataFrame({
+        "position": rng.choice(["QB", "RB", "WR"], n),
+        "Projected rushing_yards": rng.normal(50, 20, n),
+        "Risk Quotient rushing_yards": rng.normal(1, 0.5, n),
+        "Error Points": rng.gamma(2, 3, n),
+        "Projected Points": rng.normal(10, 4, n),
+        "flat": 3.0,
+    })
+
+
+# ---------- Tests ------------------------------------------------------------
+
+def test_zscores_match_per_position_loop(metrics):
+    cols = ["Projected rushing_yards", "flat"]
+    z = zscores_by_group(metrics, cols)
+
+    for col in cols:
+        mean = metrics.groupby("position")[col].mean()
+        std = metrics.groupby("position")[col].std().replace(0, np.nan)
+        expected = ((metrics[col] - metrics["position"].map(mean)) / metrics["position"].map(std)).fillna(0)
+        pd.testing.assert_series_equal(z[f"{col}_z-score"], expected, check_names=False)
+
+
+def test_palette_is_a_fixed_lookup_table():
+    assert len(PALETTE) == len(CELL_STYLES) == 256
+    assert PALETTE[MISSING_COLOR] == "#ffffff"
+    cmap = matplotlib.colormaps["RdYlGn"]
+    assert PALETTE[0] == matplotlib.colors.to_hex(cmap(0.0))
+    assert PALETTE[254] == matplotlib.colors.to_hex(cmap(1.0))
+
+
+def test_color_indices_scale_and_direction():
+    z = np.array([-2.0, 0.0, 2.0, 1.0, np.nan, np.inf])
+    idx = color_indices(z)
+    assert idx.dtype == np.uint8
+    assert list(idx[:3]) == [0, 127, 254]
+    assert idx[4] == idx[5] == MISSING_COLOR
+    assert list(color_indices(z, invert=True)[:3]) == [254, 127, 0]
+
+
+def test_color_columns_and_styles(metrics):
+    cols = ["Projected rushing_yards", "Risk Quotient rushing_yards", "Error Points", "Projected Points"]
+    df = pd.concat([metrics, zscores_by_group(metrics, cols)], axis=1)
+    colored = add_color_columns(df, cols + ["not a metric"])
+
+    assert "not a metric_color" not in colored
+    by_z = colored.sort_values("Projected rushing_yards_z-score")
+    assert by_z["Projected rushing_yards_color"].is_monotonic_increasing
+    # Lower risk / error is better; projected points are colored by the error
+    by_risk = colored.sort_values("Risk Quotient rushing_yards_z-score")
+    assert by_risk["Risk Quotient rushing_yards_color"].is_monotonic_decreasing
+    np.testing.assert_array_equal(colored["Projected Points_color"], colored["Error Points_color"])
+
+    styles = cell_styles(colored["Projected rushing_yards_color"])
+    assert styles == [f"background-color: {PALETTE[i]}" for i in colored["Projected rushing_yards_color"]]